@@ -5,12 +5,41 @@ Uses live API requirements to validate before upload
 """
 
 import json
+import logging
+import os
 import re
+from array import array
+from collections import Counter, defaultdict
 from datetime import datetime
+from functools import lru_cache
 from pathlib import Path
-from typing import Dict, List, Tuple, Any
+from types import MappingProxyType
+from typing import Dict, List, Tuple, Any, Iterable, Mapping, Optional, Sequence
 from dataclasses import dataclass
 
+from core.substring_index import SubstringIndex
+
+logger = logging.getLogger(__name__)
+
+# Bump when parsing changes, so compiled artefacts cached on disk are rebuilt
+ARTEFACT_VERSION = 1
+
+# Field description patterns behind the validation hints
+VALIDATION_HINT_PATTERNS = {
+    'numeric': re.compile(r'(число|цифр|numeric|number)'),
+    'required': re.compile(r'(обязательн|required|must)'),
+    'length_limit': re.compile(r'(длин|length|символ|character)'),
+    'format_specific': re.compile(r'(формат|format|pattern)'),
+    'url': re.compile(r'(url|ссылк|link)'),
+    'phone': re.compile(r'(телефон|phone)'),
+    'email': re.compile(r'(email|почт)'),
+    'currency': re.compile(r'(рубл|руб|currency|price)'),
+    'range': re.compile(r'(от|до|from|to|range|диапазон)')
+}
+
+ID_PATTERN = re.compile(r'^[a-zA-Z0-9_-]+$')
+DATE_PATTERN = re.compile(r'^\d{4}-\d{2}-\d{2}$')
+
 @dataclass
 class ValidationResult:
     """Result of validation check"""
@@ -30,15 +59,191 @@ class OverallValidationResult:
     total_checks: int
     summary: str
 
+@dataclass
+class FeedValidationResult:
+    """Validation results of a whole feed, kept as counters instead of per-check objects"""
+    total_items: int
+    item_errors: array                      # errors per item, in feed order
+    item_warnings: array                    # warnings per item, in feed order
+    field_errors: Dict[str, Counter]        # field -> error message -> count
+    field_warnings: Dict[str, Counter]      # field -> warning message -> count
+    skipped_fields: Counter                 # fields without a validation rule -> count
+    passed_checks: int
+    total_checks: int
+    
+    @property
+    def valid_items(self) -> int:
+        return self.item_errors.count(0)
+    
+    @property
+    def is_valid(self) -> bool:
+        return self.valid_items == self.total_items
+    
+    @property
+    def invalid_items(self) -> List[int]:
+        """Feed positions of items with errors"""
+        return [position for position, errors in enumerate(self.item_errors) if errors]
+    
+    def error_histogram(self) -> Dict[str, int]:
+        """Errors per field, most frequent first"""
+        counts = Counter({field: sum(messages.values()) for field, messages in self.field_errors.items()})
+        return dict(counts.most_common())
+    
+    def warning_histogram(self) -> Dict[str, int]:
+        """Warnings per field, most frequent first"""
+        counts = Counter({field: sum(messages.values()) for field, messages in self.field_warnings.items()})
+        return dict(counts.most_common())
+    
+    @property
+    def summary(self) -> str:
+        errors = sum(self.item_errors)
+        warnings = sum(self.item_warnings)
+        return (f"FEED VALIDATION {'PASSED' if self.is_valid else 'FAILED'}: "
+                f"{self.valid_items}/{self.total_items} items valid, "
+                f"{self.passed_checks}/{self.total_checks} checks passed, "
+                f"{errors} errors, {warnings} warnings")
+
+class ModelLookup:
+    """
+    Official BRP model names indexed for validate_model
+    
+    Exact checks use a hashed set. Suggestions are the first listed model
+    that contains the value or is contained in it, ignoring case, found
+    through a lowercasing SubstringIndex.
+    """
+    
+    def __init__(self, models: Sequence[str], trigrams: Optional[Dict[str, List[int]]] = None):
+        """
+        Index model names
+        
+        Args:
+            models: Official model names, in suggestion order
+            trigrams: Trigram postings of an earlier index over the same models, if already computed
+        """
+        self.models = models
+        self.model_set = frozenset(models)
+        self.index = SubstringIndex(str.lower).build(models, trigrams)
+    
+    @property
+    def trigrams(self) -> Dict[str, List[int]]:
+        """Trigram postings of the index, stored in the compiled artefact"""
+        return self.index.postings
+    
+    def __contains__(self, value: str) -> bool:
+        return value in self.model_set
+    
+    def __len__(self) -> int:
+        return len(self.models)
+    
+    def first_similar(self, value: str) -> Optional[str]:
+        """First model containing value or contained in it, ignoring case"""
+        position = self.index.first_match(value)
+        return self.models[position] if position is not None else None
+
 class AvitoInternalValidator:
-    def __init__(self):
-        self.brp_models = self.load_brp_models()
-        self.field_constraints = self.load_field_constraints()
+    models_file = Path("Avito_I/official_avito_brp_models.json")
+    constraints_file = Path("avito_snegohody_fields_20250902_124141.json")
+    
+    # Compiled artefacts shared by validators in this process, by source file state
+    _compiled: Dict[str, Tuple[Tuple[str, ...], Mapping[str, Any], ModelLookup]] = {}
+    
+    # Fields with few distinct values across a feed, whose results validate_feed reuses
+    FEED_MEMO_FIELDS = frozenset({
+        'Model', 'Year', 'Power', 'EngineCapacity', 'PersonCapacity', 'TrackWidth', 'Address', 'Category',
+        'VehicleType', 'Make', 'EngineType', 'Condition', 'Type', 'Availability'
+    })
+    # Results kept per memoised field, least recently used dropped first
+    FEED_MEMO_SIZE = 256
+    
+    def __init__(self, cache_dir: Optional[str] = None):
+        """
+        Set up the validator from the compiled constraint artefact
+        
+        Args:
+            cache_dir: Directory for the compiled artefact, None (default) to skip the disk cache
+        """
+        self.cache_dir = Path(cache_dir) if cache_dir else None
+        self.brp_models, self.field_constraints, self.model_lookup = self.load_compiled_constraints()
         self.validation_rules = self.build_validation_rules()
+    
+    def source_state(self) -> str:
+        """Artefact version and the source files' modification times, as a cache key"""
+        state = [ARTEFACT_VERSION]
+        for path in (self.models_file, self.constraints_file):
+            try:
+                state.append([str(path), os.stat(path).st_mtime_ns])
+            except OSError:
+                state.append([str(path), None])
+        return json.dumps(state)
+    
+    def load_compiled_constraints(self) -> Tuple[Tuple[str, ...], Mapping[str, Any], ModelLookup]:
+        """
+        Models, parsed field constraints and model index, compiled once per source state
+        
+        The artefact is reused from this process, then from the disk cache,
+        and only rebuilt from the source JSON files when their modification
+        times change. Validators share the returned objects, so the models
+        are a tuple and the constraints read-only mappings.
+        """
+        state = self.source_state()
+        compiled = self._compiled.get(state)
+        if compiled is None:
+            artefact = self.read_compiled_constraints(state) or self.compile_constraints(state)
+            brp_models = tuple(artefact['brp_models'])
+            field_constraints = MappingProxyType({
+                tag: MappingProxyType({**constraint, 'validation_hints': tuple(constraint['validation_hints'])})
+                for tag, constraint in artefact['field_constraints'].items()
+            })
+            compiled = (brp_models, field_constraints, ModelLookup(brp_models, artefact['model_trigrams']))
+            AvitoInternalValidator._compiled[state] = compiled
+        return compiled
+    
+    @property
+    def artefact_path(self) -> Optional[Path]:
+        return self.cache_dir / "constraints.json" if self.cache_dir else None
+    
+    def read_compiled_constraints(self, state: str) -> Optional[Dict[str, Any]]:
+        """Cached artefact for the given source state, None if missing, corrupt or stale"""
+        if self.artefact_path is None or not self.artefact_path.exists():
+            return None
+        try:
+            with open(self.artefact_path, 'r', encoding='utf-8') as f:
+                artefact = json.load(f)
+        except (OSError, ValueError):
+            return None
+        if not isinstance(artefact, dict) or artefact.get('source_state') != state:
+            return None
+        if not all(key in artefact for key in ('brp_models', 'field_constraints', 'model_trigrams')):
+            return None
+        return artefact
+    
+    def compile_constraints(self, state: str) -> Dict[str, Any]:
+        """Parse the source files into an artefact and write it to the disk cache"""
+        brp_models = self.load_brp_models()
+        artefact = {
+            'source_state': state,
+            'brp_models': brp_models,
+            'field_constraints': self.load_field_constraints(),
+            'model_trigrams': ModelLookup(brp_models).trigrams
+        }
+        
+        # Nothing worth caching without source files
+        sources_exist = self.models_file.exists() or self.constraints_file.exists()
+        if self.artefact_path is not None and sources_exist:
+            try:
+                self.cache_dir.mkdir(parents=True, exist_ok=True)
+                tmp_path = self.artefact_path.with_suffix('.tmp')
+                with open(tmp_path, 'w', encoding='utf-8') as f:
+                    json.dump(artefact, f, ensure_ascii=False)
+                os.replace(tmp_path, self.artefact_path)
+            except OSError as e:
+                print(f"WARNING: Could not cache compiled constraints: {e}")
         
+        return artefact
+    
     def load_brp_models(self) -> List[str]:
         """Load current BRP models list"""
-        models_file = Path("Avito_I/official_avito_brp_models.json")
+        models_file = self.models_file
         
         if models_file.exists():
             with open(models_file, 'r', encoding='utf-8') as f:
@@ -51,7 +256,7 @@ class AvitoInternalValidator:
     def load_field_constraints(self) -> Dict[str, Any]:
         """Load field validation constraints from API response"""
         # Use the parsed field data from earlier API calls
-        constraints_file = Path("avito_snegohody_fields_20250902_124141.json")
+        constraints_file = self.constraints_file
         
         if constraints_file.exists():
             with open(constraints_file, 'r', encoding='utf-8') as f:
@@ -104,21 +309,8 @@ class AvitoInternalValidator:
             
         desc_lower = description.lower()
         
-        # Common validation patterns
-        patterns = {
-            'numeric': r'(число|цифр|numeric|number)',
-            'required': r'(обязательн|required|must)',
-            'length_limit': r'(длин|length|символ|character)',
-            'format_specific': r'(формат|format|pattern)',
-            'url': r'(url|ссылк|link)',
-            'phone': r'(телефон|phone)',
-            'email': r'(email|почт)',
-            'currency': r'(рубл|руб|currency|price)',
-            'range': r'(от|до|from|to|range|диапазон)'
-        }
-        
-        for hint, pattern in patterns.items():
-            if re.search(pattern, desc_lower):
+        for hint, pattern in VALIDATION_HINT_PATTERNS.items():
+            if pattern.search(desc_lower):
                 hints.append(hint)
         
         return hints
@@ -164,7 +356,7 @@ class AvitoInternalValidator:
             return ValidationResult('Id', False, "Id must be no more than 50 characters long")
         
         # Should be alphanumeric with possible hyphens/underscores
-        if not re.match(r'^[a-zA-Z0-9_-]+$', cleaned_value):
+        if not ID_PATTERN.match(cleaned_value):
             return ValidationResult('Id', False, "Id should only contain letters, numbers, hyphens, and underscores",
                                   suggested_fix="Use format like: ARTICLE-CODE-123 or MODEL_YEAR_2025")
         
@@ -199,16 +391,14 @@ class AvitoInternalValidator:
         cleaned_value = value.strip()
         
         # Check against official BRP models list
-        if cleaned_value not in self.brp_models:
+        if cleaned_value not in self.model_lookup:
             # Try fuzzy matching
-            similar_models = [m for m in self.brp_models if 
-                            cleaned_value.lower() in m.lower() or 
-                            m.lower() in cleaned_value.lower()]
+            similar_model = self.model_lookup.first_similar(cleaned_value)
             
-            if similar_models:
+            if similar_model is not None:
                 return ValidationResult('Model', False, 
                                       f"Model '{cleaned_value}' not found in official BRP list",
-                                      suggested_fix=f"Did you mean: {similar_models[0]}?")
+                                      suggested_fix=f"Did you mean: {similar_model}?")
             else:
                 return ValidationResult('Model', False, 
                                       f"Model '{cleaned_value}' not found in official BRP list",
@@ -469,7 +659,7 @@ class AvitoInternalValidator:
             return ValidationResult('AvitoDateBegin', True, warning_message="Date begin is optional")
         
         # Should be in YYYY-MM-DD format
-        if not re.match(r'^\d{4}-\d{2}-\d{2}$', value):
+        if not DATE_PATTERN.match(value):
             return ValidationResult('AvitoDateBegin', False, "Date must be in YYYY-MM-DD format",
                                   suggested_fix="Use format: 2025-01-01")
         
@@ -481,7 +671,7 @@ class AvitoInternalValidator:
             return ValidationResult('AvitoDateEnd', True, warning_message="Date end is optional")
         
         # Should be in YYYY-MM-DD format
-        if not re.match(r'^\d{4}-\d{2}-\d{2}$', value):
+        if not DATE_PATTERN.match(value):
             return ValidationResult('AvitoDateEnd', False, "Date must be in YYYY-MM-DD format",
                                   suggested_fix="Use format: 2025-12-31")
         
@@ -542,6 +732,90 @@ class AvitoInternalValidator:
             summary=summary
         )
     
+    def validate_feed(self, items: Iterable[Dict[str, str]], error_log_level: int = logging.DEBUG,
+                      summary_log_level: int = logging.INFO) -> FeedValidationResult:
+        """
+        Validate many ads at once, without per-field console output
+        
+        Applies the same field rules as validate_xml_data but only counts
+        the outcomes: errors and warnings per item and per field/message.
+        Each failed check is logged at error_log_level and the feed summary
+        at summary_log_level, and messages are only formatted when the
+        logger is enabled for that level. The rules depend only on the field
+        value, so for the low-cardinality FEED_MEMO_FIELDS, such as the fixed
+        Category or Address, results of repeated values are reused from a
+        per-field LRU cache of FEED_MEMO_SIZE entries. Free-text fields like
+        Id, Title and Description are validated directly, so memory stays
+        bounded however long the feed (or generator) is.
+        
+        Args:
+            items: Ad field dicts, as passed to validate_xml_data
+            error_log_level: Logging level for failed checks
+            summary_log_level: Logging level for the feed summary
+        
+        Returns:
+            FeedValidationResult with per-item counts and per-field histograms
+        """
+        rules = self.validation_rules
+        log_errors = logger.isEnabledFor(error_log_level)
+        
+        item_errors = array('I')
+        item_warnings = array('I')
+        field_errors: Dict[str, Counter] = defaultdict(Counter)
+        field_warnings: Dict[str, Counter] = defaultdict(Counter)
+        skipped_fields: Counter = Counter()
+        passed_checks = total_checks = 0
+        memoised = {
+            field_name: lru_cache(maxsize=self.FEED_MEMO_SIZE)(rule)
+            for field_name, rule in rules.items() if field_name in self.FEED_MEMO_FIELDS
+        }
+        
+        for position, item in enumerate(items):
+            errors = warnings = 0
+            
+            for field_name, field_value in item.items():
+                rule = rules.get(field_name)
+                if rule is None:
+                    skipped_fields[field_name] += 1
+                    continue
+                
+                if field_name in memoised and isinstance(field_value, str):
+                    result = memoised[field_name](field_value)
+                else:
+                    result = rule(field_value)
+                
+                total_checks += 1
+                if not result.is_valid:
+                    errors += 1
+                    field_errors[field_name][result.error_message] += 1
+                    if log_errors:
+                        logger.log(error_log_level, "Item %s %s: %s", item.get('Id', position),
+                                   field_name, result.error_message)
+                else:
+                    passed_checks += 1
+                    if result.warning_message:
+                        warnings += 1
+                        field_warnings[field_name][result.warning_message] += 1
+            
+            item_errors.append(errors)
+            item_warnings.append(warnings)
+        
+        feed_result = FeedValidationResult(
+            total_items=len(item_errors),
+            item_errors=item_errors,
+            item_warnings=item_warnings,
+            field_errors=dict(field_errors),
+            field_warnings=dict(field_warnings),
+            skipped_fields=skipped_fields,
+            passed_checks=passed_checks,
+            total_checks=total_checks
+        )
+        
+        if logger.isEnabledFor(summary_log_level):
+            logger.log(summary_log_level, feed_result.summary)
+        
+        return feed_result
+    
     def get_validation_summary(self) -> Dict[str, Any]:
         """Get validation system summary"""
         return {
@@ -550,7 +824,7 @@ class AvitoInternalValidator:
             'validation_rules_count': len(self.validation_rules),
             'supported_fields': list(self.validation_rules.keys()),
             'required_fields': ['Id', 'Title', 'Category', 'VehicleType', 'Price', 'Description', 'Images', 'Address'],
-            'brp_sample_models': self.brp_models[:10] if self.brp_models else []
+            'brp_sample_models': list(self.brp_models[:10])
         }
 
 def test_validator():
@@ -53,20 +53,35 @@ class MatchingConfig:
     similarity_threshold: float = 0.7
     enable_domain_boost: bool = True
     max_catalog_entries: int = 1000
+    top_k: int = 1  # candidates kept in match_details["top_k"] for review; see BaseMatcher.match_top_k()
     
     # Performance settings
     batch_size: int = 50
     use_gpu: bool = False
+    worker_chunk_size: int = 0  # products per parallel chunk (PipelineConfig.worker_count), 0 = automatic
+    encoder_backend: str = "torch"  # "torch_int8" (dynamic quantisation) or "onnx" for CPU-only nodes
+    onnx_model_file: Optional[str] = None  # e.g. "onnx/model_qint8_avx512_vnni.onnx"
     cache_embeddings: bool = True
     cache_duration_hours: int = 24
+    embedding_cache_dir: str = field(default_factory=lambda: os.getenv("EMBEDDING_CACHE_DIR", ".cache/embeddings"))
+    embedding_cache_dtype: str = "float32"  # "float16" or "int8" to shrink stored catalog vectors
+    
+    # Vector index settings
+    vector_index: str = "brute_force"  # or "ivf"
+    vector_index_path: Optional[str] = None
+    ann_candidates: int = 50
+    ivf_lists: int = 0  # 0 = sqrt(catalog size)
+    ivf_probe: int = 8
     
     # Fallback settings
     fallback_to_fuzzy: bool = True
     fuzzy_threshold: float = 0.6
+    fuzzy_candidates: int = 50  # trigram-blocked candidates scored exactly when BERT is unavailable
     enable_exact_matching: bool = True
     
     # Brand filtering
     enable_brand_filtering: bool = True
+    enable_year_filtering: bool = False  # restrict candidates to the product's model year (plus unknown years)
     brand_boost_factor: float = 0.1
 
 
@@ -87,6 +102,10 @@ class ValidationConfig:
     brp_models_cache_hours: int = 24
     enable_fuzzy_model_matching: bool = True
     model_fuzzy_threshold: float = 0.8
+    model_fuzzy_candidates: int = 20  # trigram-blocked BRP models scored exactly per fuzzy lookup
+    worker_chunk_size: int = 0  # products per parallel chunk (PipelineConfig.worker_count), 0 = automatic
+    rule_reorder_interval: int = 100  # products recorded before a run reorders the strict-mode layers, 0 = fixed order
+    stream_batch_size: int = 1000  # products per batch in iter_validate(), bounding memory use
     
     # Field validation settings
     price_min: int = 100000  # RUB
@@ -95,6 +114,9 @@ class ValidationConfig:
     year_max: int = 2030
     model_code_length: int = 4
     
+    # Reuse stored results (validation_results) for products unchanged since the last run
+    memoize_results: bool = True
+    
     # External validation
     enable_avito_api_validation: bool = False
     avito_api_timeout: int = 10
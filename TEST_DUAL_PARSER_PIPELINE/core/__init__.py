@@ -1,11 +1,12 @@
 """
 Core module for Avito Pipeline
-Contains fundamental data models, exceptions, and database utilities
+Contains fundamental data models, exceptions, database and text normalization utilities
 """
 
 from .models import ProductData, CatalogData, ValidationResult, MatchResult, PipelineStats, PipelineStage, MatchType, ValidationLevel
 from .exceptions import PipelineError, ExtractionError, ValidationError, MatchingError
 from .database import DatabaseManager
+from .text_normalizer import TextNormalizer
 
 __all__ = [
     'ProductData',
@@ -20,5 +21,6 @@ __all__ = [
     'ExtractionError',
     'ValidationError',
     'MatchingError',
-    'DatabaseManager'
+    'DatabaseManager',
+    'TextNormalizer'
 ]
\ No newline at end of file
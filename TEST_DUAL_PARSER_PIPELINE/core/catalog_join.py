@@ -0,0 +1,75 @@
+"""
+Catalog Join Index
+Product-to-catalog lookup by model family containment
+"""
+
+from typing import Dict, Iterable, List, Optional
+
+from .models import ProductData, CatalogData
+from .substring_index import SubstringIndex
+
+
+class CatalogJoinIndex:
+    """
+    Join of products to catalog entries under CatalogData.matches_product
+
+    An entry matches when the uppercased product malli and model family
+    contain one another, so lookups go through a SubstringIndex of the
+    uppercased model families instead of checking every entry.
+
+    Entries are deduplicated by model family (the last entry wins) and
+    tried in first-seen family order, like the dict the stages used to
+    build, so lookups return the same entry as a scan over that dict.
+    """
+
+    def __init__(self):
+        self._entries: List[CatalogData] = []
+        self._index = SubstringIndex(str.upper)
+
+    def build(self, catalog_entries: Iterable[CatalogData]) -> 'CatalogJoinIndex':
+        """
+        Build the index over catalog entries
+
+        Args:
+            catalog_entries: Catalog entries
+
+        Returns:
+            The index itself
+        """
+        by_family: Dict[str, CatalogData] = {}
+        for entry in catalog_entries:
+            by_family[entry.model_family] = entry
+
+        self._entries = list(by_family.values())
+        self._index = SubstringIndex(str.upper).build(entry.model_family for entry in self._entries)
+        return self
+
+    def __len__(self) -> int:
+        return len(self._entries)
+
+    def candidates(self, malli: str) -> List[int]:
+        """
+        Positions of entries matching a product malli
+
+        Args:
+            malli: Product model name
+
+        Returns:
+            Entry positions in lookup order
+        """
+        return self._index.matches(malli)
+
+    def lookup(self, product: ProductData) -> Optional[CatalogData]:
+        """
+        First catalog entry matching a product
+
+        Args:
+            product: Product to join
+
+        Returns:
+            Matching catalog entry, or None
+        """
+        if not product.malli:
+            return None
+        position = self._index.first_match(product.malli)
+        return self._entries[position] if position is not None else None
@@ -112,6 +112,8 @@ class DatabaseManager:
                         suggestions TEXT,
                         confidence_score REAL,
                         validation_metadata TEXT,
+                        content_hash TEXT,
+                        ruleset_version TEXT,
                         created_at TEXT DEFAULT CURRENT_TIMESTAMP,
                         FOREIGN KEY (product_id) REFERENCES price_entries(id)
                     );
@@ -150,6 +152,17 @@ class DatabaseManager:
                     CREATE INDEX IF NOT EXISTS idx_match_results_product_id ON match_results(product_id);
                 """)
                 
+                # Validation memo columns, added to databases created before they existed
+                columns = {row['name'] for row in conn.execute("PRAGMA table_info(validation_results)")}
+                for column in ('content_hash', 'ruleset_version'):
+                    if column not in columns:
+                        conn.execute(f"ALTER TABLE validation_results ADD COLUMN {column} TEXT")
+                conn.execute(
+                    "CREATE INDEX IF NOT EXISTS idx_validation_results_memo "
+                    "ON validation_results(ruleset_version, content_hash)"
+                )
+                conn.commit()
+                
                 self.logger.info(f"Database initialized at {self.db_path}")
                 
         except Exception as e:
@@ -361,6 +374,119 @@ class DatabaseManager:
             self.logger.error(f"Failed to save validation result: {e}")
             return False
     
+    def load_validation_memo(self, content_hashes: List[str], ruleset_version: str,
+                             stage: str = "internal") -> Dict[str, ValidationResult]:
+        """
+        Stored validation results for product content hashes
+        
+        Args:
+            content_hashes: Product content hashes to look up
+            ruleset_version: Rule-set version the results must have been produced with
+            stage: Validation stage (validator) name
+        
+        Returns:
+            {content hash: latest ValidationResult} for the hashes found
+        """
+        try:
+            with self.get_connection() as conn:
+                cursor = conn.cursor()
+                
+                memo = {}
+                unique_hashes = list(dict.fromkeys(content_hashes))
+                # Chunked to stay below SQLite's bound parameter limit
+                for start in range(0, len(unique_hashes), 500):
+                    chunk = unique_hashes[start:start + 500]
+                    cursor.execute(f"""
+                        SELECT content_hash, success, errors, warnings, suggestions,
+                               confidence_score, validation_metadata
+                        FROM validation_results
+                        WHERE validation_stage = ? AND ruleset_version = ?
+                          AND content_hash IN ({', '.join('?' * len(chunk))})
+                        ORDER BY created_at
+                    """, (stage, ruleset_version, *chunk))
+                    
+                    for row in cursor.fetchall():
+                        memo[row['content_hash']] = ValidationResult(
+                            success=bool(row['success']),
+                            errors=json.loads(row['errors'] or '[]'),
+                            warnings=json.loads(row['warnings'] or '[]'),
+                            suggestions=json.loads(row['suggestions'] or '[]'),
+                            confidence=row['confidence_score'],
+                            metadata=json.loads(row['validation_metadata'] or '{}')
+                        )
+                
+                self.logger.info(f"Validation memo: {len(memo)}/{len(unique_hashes)} products unchanged")
+                return memo
+        
+        except Exception as e:
+            self.logger.error(f"Failed to load validation memo: {e}")
+            return {}
+    
+    def save_validation_memo(self, entries: List[Tuple[str, str, ValidationResult]], ruleset_version: str,
+                             stage: str = "internal") -> int:
+        """
+        Store validation results for reuse by load_validation_memo()
+        
+        Results whose metadata does not survive a JSON round trip unchanged
+        (e.g. datetimes, tuples, non-string keys) are not stored, so a
+        memoised result always equals the one a fresh validation gives.
+        
+        Args:
+            entries: (product id, content hash, result) triples
+            ruleset_version: Rule-set version the results were produced with
+            stage: Validation stage (validator) name
+        
+        Returns:
+            Number of results stored
+        """
+        rows = []
+        for product_id, content_hash, result in entries:
+            try:
+                metadata = json.dumps(result.metadata)
+            except (TypeError, ValueError):
+                continue
+            if json.loads(metadata) != result.metadata:
+                continue
+            rows.append((product_id, content_hash, result, metadata))
+        
+        if len(rows) < len(entries):
+            self.logger.debug(f"Not memoising {len(entries) - len(rows)} results with non-JSON metadata")
+        if not rows:
+            return 0
+        
+        try:
+            with self.get_connection() as conn:
+                created_at = datetime.now().isoformat()
+                conn.executemany("""
+                    INSERT OR REPLACE INTO validation_results (
+                        id, product_id, validation_stage, success, errors, warnings, suggestions,
+                        confidence_score, validation_metadata, content_hash, ruleset_version, created_at
+                    ) VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?)
+                """, [
+                    (
+                        f"{product_id}_{stage}_{ruleset_version}_{content_hash[:16]}",
+                        product_id,
+                        stage,
+                        result.success,
+                        json.dumps(result.errors),
+                        json.dumps(result.warnings),
+                        json.dumps(result.suggestions),
+                        result.confidence,
+                        metadata,
+                        content_hash,
+                        ruleset_version,
+                        created_at
+                    )
+                    for product_id, content_hash, result, metadata in rows
+                ])
+                
+                conn.commit()
+                return len(rows)
+        
+        except Exception as e:
+            self.logger.error(f"Failed to save validation memo: {e}")
+            return 0
+    
     def save_match_result(self, result: MatchResult) -> bool:
         """Save match result to database"""
         try:
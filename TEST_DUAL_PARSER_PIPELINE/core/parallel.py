@@ -0,0 +1,121 @@
+"""
+Process Pool Utilities
+Order-preserving, chunked process parallelism shared by the pipeline stages
+"""
+
+import math
+import multiprocessing
+import os
+from concurrent.futures import ProcessPoolExecutor
+from typing import Any, Callable, Iterable, List, Optional, Sequence, Tuple
+
+CHUNKS_PER_WORKER = 4
+
+
+def resolve_worker_count(requested: Optional[int]) -> int:
+    """
+    Number of worker processes to use
+
+    Args:
+        requested: Configured worker count; 0 or negative means one per CPU
+
+    Returns:
+        Worker count of at least 1
+    """
+    if requested is None:
+        return 1
+    if requested <= 0:
+        return os.cpu_count() or 1
+    return requested
+
+
+def chunk_ranges(total: int, workers: int, chunk_size: int = 0) -> List[Tuple[int, int]]:
+    """
+    Split range(total) into contiguous (start, end) chunks
+
+    Args:
+        total: Number of items
+        workers: Worker processes the chunks are handed out to
+        chunk_size: Items per chunk; 0 picks CHUNKS_PER_WORKER chunks per worker
+            so faster workers can take over the tail
+
+    Returns:
+        Chunk boundaries in input order
+    """
+    if chunk_size <= 0:
+        chunk_size = max(1, math.ceil(total / (workers * CHUNKS_PER_WORKER)))
+    return [(start, min(start + chunk_size, total)) for start in range(0, total, chunk_size)]
+
+
+def uses_fork() -> bool:
+    """Whether worker processes are forked (and so inherit the parent's memory)"""
+    return 'fork' in multiprocessing.get_all_start_methods()
+
+
+class WorkerPool:
+    """
+    Process pool kept open across several order-preserving map() calls
+    
+    The worker processes are started by the first map() call and reused by
+    every later one until close(), so per-worker setup in initializer runs
+    once per pool rather than once per call. Workers are forked where the
+    platform supports it, so initargs are inherited copy-on-write instead of
+    being pickled; elsewhere they are pickled once per worker. Use as a
+    context manager or call close() when done.
+    """
+    
+    def __init__(self, workers: int, initializer: Optional[Callable] = None, initargs: Sequence[Any] = ()):
+        self.workers = workers
+        self.initializer = initializer
+        self.initargs = tuple(initargs)
+        self._executor: Optional[ProcessPoolExecutor] = None
+    
+    def map(self, func: Callable[[Any], Any], chunks: Iterable[Any]) -> List[Any]:
+        """
+        Run func over chunks and return the results in chunk order
+        
+        Chunks are queued up front and picked up by whichever worker is free.
+        
+        Args:
+            func: Module-level function applied to each chunk
+            chunks: Work items, pickled to the workers
+        
+        Returns:
+            func(chunk) for every chunk, in input order
+        """
+        if self._executor is None:
+            context = multiprocessing.get_context('fork' if uses_fork() else 'spawn')
+            self._executor = ProcessPoolExecutor(max_workers=self.workers, mp_context=context,
+                                                 initializer=self.initializer, initargs=self.initargs)
+        return list(self._executor.map(func, chunks))
+    
+    def close(self) -> None:
+        """Shut the worker processes down; a later map() starts new ones"""
+        if self._executor is not None:
+            self._executor.shutdown()
+            self._executor = None
+    
+    def __enter__(self) -> 'WorkerPool':
+        return self
+    
+    def __exit__(self, *exc_info) -> None:
+        self.close()
+
+
+def map_chunks(func: Callable[[Any], Any], chunks: Iterable[Any], workers: int,
+               initializer: Optional[Callable] = None, initargs: Sequence[Any] = ()) -> List[Any]:
+    """
+    Run func over chunks in a one-off process pool and return the results in chunk order
+
+    Args:
+        func: Module-level function applied to each chunk
+        chunks: Work items, pickled to the workers
+        workers: Number of worker processes
+        initializer: Optional per-worker setup function
+        initargs: Arguments for initializer
+
+    Returns:
+        func(chunk) for every chunk, in input order
+    """
+    with WorkerPool(workers, initializer, initargs) as pool:
+        return pool.map(func, chunks)
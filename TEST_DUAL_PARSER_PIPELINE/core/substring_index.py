@@ -0,0 +1,128 @@
+"""
+Substring Index
+Positional lookup of texts that contain a query or are contained in it, narrowed by character trigrams
+"""
+
+from typing import Callable, Dict, Iterable, List, Optional, Set
+
+
+class SubstringIndex:
+    """
+    Index of texts answering "which contain the query, or are contained in it"
+
+    Texts and queries are compared after the fold function (e.g. str.upper
+    or str.lower) and texts are addressed by their position in the built
+    list. Both directions of containment are looked up by hashing:
+    - texts containing the query are listed under each of its trigrams, so
+      the rarest trigram's postings are the only texts checked
+    - texts contained in the query equal one of its slices, found by hash
+      lookups of the slices starting at each trigram that begins a text,
+      for the text lengths starting with it
+    Texts shorter than three characters are always checked, and a query
+    that short checks every text.
+    """
+
+    def __init__(self, fold: Callable[[str], str] = str.lower):
+        self.fold = fold
+        self.postings: Dict[str, List[int]] = {}
+        self._texts: List[str] = []
+        self._positions: Dict[str, List[int]] = {}
+        self._prefix_lengths: Dict[str, List[int]] = {}
+        self._short: List[int] = []
+
+    @staticmethod
+    def trigrams(text: str) -> Set[str]:
+        """Set of (unpadded) character trigrams of text"""
+        return {text[i:i + 3] for i in range(len(text) - 2)}
+
+    def build(self, texts: Iterable[Optional[str]],
+              postings: Optional[Dict[str, List[int]]] = None) -> 'SubstringIndex':
+        """
+        Build the index over texts
+
+        Args:
+            texts: Texts to index, addressed by position; None indexes as ''
+            postings: Trigram postings of an earlier build over the same
+                texts (its postings attribute), to skip recomputing them
+
+        Returns:
+            The index itself
+        """
+        self._texts = [self.fold(text) if text else '' for text in texts]
+        self._positions = {}
+        self._short = []
+        computed: Dict[str, List[int]] = {}
+        prefix_lengths: Dict[str, Set[int]] = {}
+        for position, text in enumerate(self._texts):
+            if len(text) < 3:
+                self._short.append(position)
+                continue
+            self._positions.setdefault(text, []).append(position)
+            prefix_lengths.setdefault(text[:3], set()).add(len(text))
+            if postings is None:
+                for gram in self.trigrams(text):
+                    computed.setdefault(gram, []).append(position)
+
+        self.postings = postings if postings is not None else computed
+        self._prefix_lengths = {prefix: sorted(lengths) for prefix, lengths in prefix_lengths.items()}
+        return self
+
+    def __len__(self) -> int:
+        return len(self._texts)
+
+    def _contained_in(self, text: str) -> List[int]:
+        """Positions of texts contained in a folded query of at least three characters"""
+        positions = [position for position in self._short if self._texts[position] in text]
+        for start in range(len(text) - 2):
+            for length in self._prefix_lengths.get(text[start:start + 3], ()):
+                if start + length > len(text):
+                    break
+                positions.extend(self._positions.get(text[start:start + length], ()))
+        return positions
+
+    def _rarest_postings(self, text: str) -> List[int]:
+        """Shortest trigram postings of a folded query of at least three characters"""
+        return min((self.postings.get(gram, ()) for gram in self.trigrams(text)), key=len)
+
+    def matches(self, query: str) -> List[int]:
+        """
+        Positions of texts that contain the query or are contained in it
+
+        Args:
+            query: Text to look up
+
+        Returns:
+            Matching positions in list order
+        """
+        text = self.fold(query)
+        if len(text) < 3:
+            return [position for position, indexed in enumerate(self._texts) if text in indexed or indexed in text]
+
+        positions = set(self._contained_in(text))
+        positions.update(position for position in self._rarest_postings(text) if text in self._texts[position])
+        return sorted(positions)
+
+    def first_match(self, query: str) -> Optional[int]:
+        """
+        Position of the first text that contains the query or is contained in it
+
+        Args:
+            query: Text to look up
+
+        Returns:
+            Lowest matching position, or None
+        """
+        text = self.fold(query)
+        if len(text) < 3:
+            return next((position for position, indexed in enumerate(self._texts)
+                         if text in indexed or indexed in text), None)
+
+        best = min(self._contained_in(text), default=None)
+        # Postings are in list order, so only those before the best so far are checked
+        for position in self._rarest_postings(text):
+            if best is not None and position >= best:
+                break
+            if text in self._texts[position]:
+                best = position
+                break
+        return best
@@ -0,0 +1,183 @@
+"""
+Text normalization shared by all pipeline stages
+Precompiled replacement tables with bounded memoisation of normalised strings
+"""
+
+import re
+from functools import lru_cache
+from typing import Any, Dict, Iterable, List, Optional
+
+# Entries kept per normalisation memo; product and catalog texts repeat heavily
+NORMALIZE_CACHE_SIZE = 16384
+
+TRADEMARK_PATTERN = re.compile(r'[®™©]')
+FIELD_PATTERN = re.compile(r'[^\w\s-]')
+PACKAGE_WORDS_PATTERN = re.compile(r'\\b(PACKAGE|WITH|AND)\\b', re.IGNORECASE)
+ENGINE_PATTERN = re.compile(r'(\\d{3,4})\\s*([R]?)\\s*(E-TEC|ACE|ETEC)\\s*(TURBO\\s*R?)?', re.IGNORECASE)
+
+
+class ReplacementTable:
+    """
+    Substring replacements applied in one pass of a single compiled alternation
+
+    Keys are tried longest first, so the longest key wins where several
+    match at the same position. The whole match, boundary included, is
+    replaced by the mapped value; with ignore_case keys are looked up
+    case-insensitively.
+    """
+
+    def __init__(self, mapping: Dict[str, str], ignore_case: bool = False, boundary: str = ''):
+        """
+        Initialize replacement table
+
+        Args:
+            mapping: Substring -> replacement
+            ignore_case: Match keys case-insensitively
+            boundary: Regex placed on both sides of the alternation (e.g. word boundary)
+        """
+        self.mapping = dict(mapping)
+        self.ignore_case = ignore_case
+        self._lookup = {(key.upper() if ignore_case else key): value for key, value in self.mapping.items()}
+
+        self.pattern = None
+        if self.mapping:
+            alternation = '|'.join(re.escape(key) for key in sorted(self.mapping, key=len, reverse=True))
+            self.pattern = re.compile(f'{boundary}({alternation}){boundary}', re.IGNORECASE if ignore_case else 0)
+
+    def _replace(self, match: 're.Match') -> str:
+        key = match.group(1)
+        return self._lookup.get(key.upper() if self.ignore_case else key, key)
+
+    def apply(self, text: str) -> str:
+        """Replace every key occurrence in text"""
+        if self.pattern is None:
+            return text
+        return self.pattern.sub(self._replace, text)
+
+
+MODEL_NAME_REPLACEMENTS = ReplacementTable({
+    'X-RS': 'XRS',
+    'X RS': 'XRS',
+    'E-TEC': 'ETEC',
+    'E TEC': 'ETEC',
+    'NEO+': 'NEO PLUS',
+})
+
+
+class TextNormalizer:
+    """
+    Utility class for text normalization operations
+
+    Every normaliser is memoised in a bounded LRU cache keyed on the input
+    string, so repeated model, package and engine names are normalised once
+    per process. Use normalize_batch() for lists of values.
+    """
+
+    _MEMOISED = ('model_name', 'package_name', 'engine_spec', 'field', 'semantic_text')
+
+    @staticmethod
+    @lru_cache(maxsize=NORMALIZE_CACHE_SIZE)
+    def normalize_model_name(text: str) -> str:
+        """Normalize model names for matching"""
+        if not text:
+            return ""
+
+        # Remove trademark symbols and standardize spacing
+        text = ' '.join(TRADEMARK_PATTERN.sub('', text).split())
+
+        # Handle common variations
+        text = MODEL_NAME_REPLACEMENTS.apply(text)
+
+        return text.strip().upper()
+
+    @staticmethod
+    @lru_cache(maxsize=NORMALIZE_CACHE_SIZE)
+    def normalize_package_name(text: str) -> str:
+        """Normalize package names for matching"""
+        if not text:
+            return ""
+
+        # Remove common package words
+        text = PACKAGE_WORDS_PATTERN.sub('', text)
+
+        # Standardize spacing
+        text = ' '.join(text.split())
+
+        return text.strip().upper()
+
+    @staticmethod
+    @lru_cache(maxsize=NORMALIZE_CACHE_SIZE)
+    def normalize_engine_spec(text: str) -> str:
+        """Normalize engine specifications for matching"""
+        if not text:
+            return ""
+
+        # Extract key engine info
+        match = ENGINE_PATTERN.search(text)
+
+        if match:
+            displacement = match.group(1)
+            r_variant = match.group(2) or ""
+            engine_type = match.group(3).replace('-', '').upper()
+            turbo = match.group(4) or ""
+
+            normalized = f"{displacement}{r_variant} {engine_type}"
+            if turbo:
+                normalized += f" {turbo.strip().upper()}"
+
+            return normalized.strip()
+
+        return text.strip().upper()
+
+    @staticmethod
+    @lru_cache(maxsize=NORMALIZE_CACHE_SIZE)
+    def normalize_field(text) -> str:
+        """Normalize a raw field value for storage: lowercase, punctuation replaced by spaces"""
+        if not text:
+            return ""
+        return FIELD_PATTERN.sub(' ', str(text).lower().strip())
+
+    @staticmethod
+    @lru_cache(maxsize=NORMALIZE_CACHE_SIZE)
+    def normalize_semantic_text(text: str, replacements: Optional[ReplacementTable] = None) -> str:
+        """Normalize text for embedding: domain replacements, no trademarks, lowercase"""
+        if not text:
+            return ""
+
+        text = text.strip()
+        if replacements is not None:
+            text = replacements.apply(text)
+
+        text = ' '.join(TRADEMARK_PATTERN.sub('', text).split())
+        return text.lower()
+
+    @classmethod
+    def normalize_batch(cls, texts: Iterable[str], kind: str = 'model_name') -> List[str]:
+        """
+        Normalize many values, computing each distinct value once
+
+        Args:
+            texts: Values to normalize
+            kind: 'model_name', 'package_name', 'engine_spec', 'field' or 'semantic_text'
+
+        Returns:
+            Normalized values in input order
+        """
+        if kind not in cls._MEMOISED:
+            raise ValueError(f"Unknown normalization kind: {kind}")
+        normalize = getattr(cls, f'normalize_{kind}')
+
+        texts = list(texts)
+        normalized = {text: normalize(text) for text in dict.fromkeys(texts)}
+        return [normalized[text] for text in texts]
+
+    @classmethod
+    def cache_info(cls) -> Dict[str, Any]:
+        """Memo statistics per normaliser"""
+        return {kind: getattr(cls, f'normalize_{kind}').cache_info() for kind in cls._MEMOISED}
+
+    @classmethod
+    def cache_clear(cls) -> None:
+        """Drop all memoised normalisations"""
+        for kind in cls._MEMOISED:
+            getattr(cls, f'normalize_{kind}').cache_clear()
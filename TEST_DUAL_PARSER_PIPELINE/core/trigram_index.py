@@ -0,0 +1,104 @@
+"""
+Character Trigram Index
+Inverted index used to block fuzzy comparisons down to the most similar texts
+"""
+
+import heapq
+from collections import Counter
+from typing import Collection, Dict, Iterable, List, Optional, Set
+
+
+class TrigramIndex:
+    """
+    Inverted index from character trigrams to text positions
+
+    Texts are lowercased and padded ("  text ") so short strings and word
+    starts still produce trigrams. Indexed texts are scored by the Dice
+    coefficient of their trigram sets, 2|A∩B| / (|A| + |B|), scaled by the
+    ratio of the shorter to the longer text length (the bound behind
+    difflib's real_quick_ratio). The estimate tracks SequenceMatcher.ratio()
+    closely enough to preselect the texts worth an exact comparison.
+    """
+
+    def __init__(self):
+        self._postings: Dict[str, List[int]] = {}
+        self._sizes: List[int] = []
+        self._lengths: List[int] = []
+
+    @staticmethod
+    def trigrams(text: str) -> Set[str]:
+        """Set of padded, lowercased character trigrams of text"""
+        padded = f"  {text.lower()} " if text else ''
+        return {padded[i:i + 3] for i in range(len(padded) - 2)}
+
+    def build(self, texts: Iterable[str]) -> 'TrigramIndex':
+        """
+        Build the index over texts
+
+        Args:
+            texts: Texts to index, addressed by position
+
+        Returns:
+            The index itself
+        """
+        self._postings = {}
+        self._sizes = []
+        self._lengths = []
+        for position, text in enumerate(texts):
+            grams = self.trigrams(text)
+            self._sizes.append(len(grams))
+            self._lengths.append(len(text or ''))
+            for gram in grams:
+                self._postings.setdefault(gram, []).append(position)
+        return self
+
+    def __len__(self) -> int:
+        return len(self._sizes)
+
+    def scores(self, text: str, positions: Optional[Collection[int]] = None) -> Dict[int, float]:
+        """
+        Similarity estimate against every indexed text sharing a trigram with text
+
+        Args:
+            text: Query text
+            positions: Optional set of eligible positions
+
+        Returns:
+            {position: estimate in [0, 1]} for texts with at least one shared trigram
+        """
+        grams = self.trigrams(text)
+        counts = Counter()
+        for gram in grams:
+            posting = self._postings.get(gram)
+            if posting:
+                counts.update(posting)
+
+        query_size = len(grams)
+        query_length = len(text or '')
+        scores = {}
+        for position, shared in counts.items():
+            if positions is not None and position not in positions:
+                continue
+            length = self._lengths[position]
+            length_ratio = min(query_length, length) / max(query_length, length)
+            scores[position] = 2.0 * shared / (query_size + self._sizes[position]) * length_ratio
+        return scores
+
+    def candidates(self, text: str, top_n: int, positions: Optional[Collection[int]] = None) -> List[int]:
+        """
+        Positions of the top_n texts with the highest similarity estimate
+
+        Args:
+            text: Query text
+            top_n: Maximum number of candidates
+            positions: Optional set of eligible positions
+
+        Returns:
+            Candidate positions in ascending order; texts sharing no trigram
+            with the query are never candidates
+        """
+        scores = self.scores(text, positions)
+        if len(scores) > top_n:
+            # Ties broken by lower position
+            scores = dict(heapq.nsmallest(top_n, scores.items(), key=lambda item: (-item[1], item[0])))
+        return sorted(scores)
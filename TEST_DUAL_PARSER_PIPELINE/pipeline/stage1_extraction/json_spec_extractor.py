@@ -8,19 +8,163 @@ import pdfplumber
 import re
 import sqlite3
 import json
+from concurrent.futures import ProcessPoolExecutor
 from pathlib import Path
-from typing import List, Dict, Any, Optional
+from typing import List, Dict, Any, Optional, Tuple
 from datetime import datetime
 import logging
 
 logging.basicConfig(level=logging.INFO)
 logger = logging.getLogger(__name__)
 
+
+def _named_alternation(rules: List[Tuple[str, str]], flags: int = 0) -> re.Pattern:
+    """Compile (name, pattern) pairs into one alternation with named groups"""
+    return re.compile('|'.join(f'(?P<{name}>{pattern})' for name, pattern in rules), flags)
+
+
 class JsonSpecExtractor:
     """Professional JSON-first extractor for spec book data"""
     
-    def __init__(self, db_path: str = "dual_db.db"):
+    # ------------------------------------------------------------------
+    # Extraction grammar - compiled once at class load
+    # ------------------------------------------------------------------
+    
+    # Part 1: engine name normalisation (single-pass replacement table)
+    _ENGINE_NAME_REPLACEMENTS = [
+        # Turbo variations
+        ('turbo_r', r'\bTURBO\s*R\b', 'TURBOR'),
+        ('turbo_charged', r'\bTURBO\s*CHARGED\b', 'TURBO'),
+        ('turbocharged', r'\bTURBOCHARGED\b', 'TURBO'),
+        
+        # E-TEC variations
+        ('etec', r'\bE-TEC\b|\bETEC\b|\bE\s*TEC\b', 'ETEC'),
+        
+        # ACE / EFI variations
+        ('ace', r'\bACE\b|\bA\.C\.E\.\b', 'ACE'),
+        ('efi', r'\bEFI\b|\bE\.F\.I\.\b|\bFUEL\s*INJECTION\b', 'EFI'),
+        
+        # Remove common filler words
+        ('filler', r'\bWITH\b|\bAND\b|\bOR\b|\bTHE\b', ''),
+        
+        # Standardize separators (dashes, slashes, underscores, periods, colons)
+        ('separator', r'[-–—_/\\.:]', ''),
+    ]
+    _ENGINE_NAME_GRAMMAR = _named_alternation([(name, pattern) for name, pattern, _ in _ENGINE_NAME_REPLACEMENTS])
+    _ENGINE_NAME_SUBSTITUTES = {name: replacement for name, _, replacement in _ENGINE_NAME_REPLACEMENTS}
+    _TRADEMARK_SYMBOLS = re.compile(r'[®™℠©•�]')
+    _NON_ALNUM_SPACE = re.compile(r'[^A-Z0-9\s]')
+    _WHITESPACE_RUN = re.compile(r'\s+')
+    _SPACED_NUMBER = re.compile(r'\s*(\d+)\s*')
+    _NON_ALNUM = re.compile(r'[^A-Z0-9]+')
+    
+    # Part 2: per-line specification grammar (keyword dispatch with named groups)
+    _ENGINE_HEADER_PATTERNS = [
+        re.compile(pattern, re.IGNORECASE) for pattern in (
+            r'850 E-TEC[®\s]*TURBO R',
+            r'850 E-TEC[®\s]*',
+            r'600R E-TEC[®\s]*',
+            r'600 EFI[®\s]*–[®\s]*85',
+            r'600 EFI[®\s]*–[®\s]*55',
+            r'900 ACE[®\s]*TURBO R',
+            r'900 ACE[®\s]*TURBO',
+            r'900 ACE[®\s]*',
+            r'600 ACE[®\s]*',
+        )
+    ]
+    _ENGINE_HEADER_CLEANUP = re.compile(r'[®\s]+')
+    
+    # Keywords are a superset of what the field patterns below require, so a
+    # line without a dispatch hit can never produce a value
+    _ENGINE_LINE_DISPATCH = _named_alternation([
+        ('cooling', r'liquid-cooled'),
+        ('displacement', r'cc'),
+        ('bore_stroke', r'mm'),
+        ('fuel_system', r'fuel system'),
+        ('fuel_type', r'premium unleaded'),
+        ('fuel_tank', r'fuel tank'),
+    ], re.IGNORECASE)
+    _DISPLACEMENT = re.compile(r'(\d+)\s*-\s*(\d+\.?\d*)\s*cc')
+    _BORE_STROKE = re.compile(r'(\d+\.?\d*)\s*x\s*(\d+\.?\d*)\s*mm')
+    _FUEL_SYSTEM = re.compile(r'fuel system\s+(.*)', re.IGNORECASE)
+    _FUEL_TANK = re.compile(r'fuel tank.*?(\d+)', re.IGNORECASE)
+    
+    _DIMENSION_LINE_DISPATCH = _named_alternation([
+        ('overall_length_mm', r'overall length'),
+        ('overall_width_mm', r'overall width'),
+        ('overall_height_mm', r'overall height'),
+        ('ski_stance_mm', r'ski stance'),
+        ('dry_weight_kg', r'dry weight'),
+    ], re.IGNORECASE)
+    _DIMENSION_PATTERNS = {
+        'overall_length_mm': re.compile(r'overall length.*?(\d{1,4})\s*mm', re.IGNORECASE),
+        'overall_width_mm': re.compile(r'overall width.*?(\d{1,4})\s*mm', re.IGNORECASE),
+        'overall_height_mm': re.compile(r'overall height.*?(\d{1,4})\s*mm', re.IGNORECASE),
+        'ski_stance_mm': re.compile(r'ski stance.*?(\d{1,4})\s*mm', re.IGNORECASE),
+        'dry_weight_kg': re.compile(r'dry weight.*?(\d{1,4})\s*kg', re.IGNORECASE),
+    }
+    
+    # Model name patterns - matched against normalized text (alphanumeric only)
+    # SKIDOO Models
+    _SKIDOO_MODEL_PATTERNS = [
+        (r'SUMMITXWITHEXPERTPACKAGE', 'Summit X', 'Expert Package', 'deep-snow'),
+        (r'SUMMITX(?!.*EXPERT)', 'Summit X', 'Base', 'deep-snow'),
+        (r'SUMMITADRENALINE', 'Summit Adrenaline', 'Base', 'deep-snow'),
+        (r'SUMMITNEO', 'Summit Neo', 'Base', 'deep-snow'),
+        (r'FREERIDE', 'Freeride', 'Base', 'deep-snow'),
+        (r'BACKCOUNTRYXRS', 'Backcountry X-RS', 'Base', 'crossover'),
+        (r'BACKCOUNTRYADRENALINE', 'Backcountry Adrenaline', 'Base', 'crossover'),
+        (r'BACKCOUNTRYSPORT', 'Backcountry Sport', 'Base', 'crossover'),
+        (r'MXZXRSWITHCOMPETITIONPACKAGE', 'MXZ X-RS', 'Competition Package', 'trail'),
+        (r'MXZXRS(?!.*COMPETITION)', 'MXZ X-RS', 'Base', 'trail'),
+        (r'MXZSPORT', 'MXZ Sport', 'Base', 'trail'),
+        (r'MXZNEO', 'MXZ Neo+', 'Base', 'trail'),
+        (r'RENEGADEXRS', 'Renegade X-RS', 'Base', 'trail'),
+        (r'RENEGADEADRENALINE', 'Renegade Adrenaline', 'Base', 'trail'),
+        (r'RENEGADESPORT', 'Renegade Sport', 'Base', 'trail'),
+        (r'EXPEDITIONXTREME', 'Expedition Xtreme', 'Base', 'utility'),
+        (r'EXPEDITIONSE', 'Expedition SE', 'Base', 'utility'),
+        (r'EXPEDITIONLE', 'Expedition LE', 'Base', 'utility'),
+        (r'EXPEDITIONSPORT', 'Expedition Sport', 'Base', 'utility'),
+        (r'GRANDTOURINGSPORT', 'Grand Touring Sport', 'Base', 'touring'),
+        (r'TUNDRАЛЕ', 'Tundra LE', 'Base', 'utility'),
+        (r'SKANDICLE', 'Skandic LE', 'Base', 'utility'),
+        (r'SKANDICSPORT', 'Skandic Sport', 'Base', 'utility'),
+    ]
+    
+    # LYNX Models
+    _LYNX_MODEL_PATTERNS = [
+        (r'RAVEREWITHENDUROPACKAGE', 'Rave RE', 'Enduro Package', 'trail'),
+        (r'RAVERE(?!.*ENDURO)', 'Rave RE', 'Base', 'trail'),
+        (r'RAVEGLS', 'Rave GLS', 'Base', 'trail'),
+        (r'ADVENTURELIMITED', 'Adventure Limited', 'Base', 'touring'),
+        (r'ADVENTURELX', 'Adventure LX', 'Base', 'touring'),
+        (r'ADVENTUREELECTRIC', 'Adventure Electric', 'Base', 'utility'),
+        (r'ADVENTURECORE', 'Adventure Core', 'Base', 'touring'),
+        (r'ADVENTURE(?!.*LIMITED|.*LX|.*ELECTRIC|.*CORE)', 'Adventure', 'Base', 'touring'),
+    ]
+    _MODEL_PATTERNS = [
+        (re.compile(pattern), model_name, configuration, category)
+        for pattern, model_name, configuration, category in _SKIDOO_MODEL_PATTERNS + _LYNX_MODEL_PATTERNS
+    ]
+    
+    # Part 3: feature section grammar
+    _SECTION_HEADER_DISPATCH = _named_alternation([
+        ('whats_new', r"what's new"),
+        ('package_highlights', r'package highlights'),
+        ('features', r'features'),
+    ], re.IGNORECASE)
+    _BULLET_PREFIX = re.compile(r'^[•�]\s*')
+    _TRACK_PATTERN = re.compile(r'(\w+(?:\s+\w+)*)[:\s]*\s*(\d+)\s*x\s*(\d+)\s*x\s*(\d+\.?\d*)')
+    # A track match only spans word characters, whitespace, colons and periods,
+    # and always ends with an "L x W x P" triple; the lookahead finds every
+    # (overlapping) triple so each segment can be cut after the last one
+    _TRACK_SEGMENT_BREAK = re.compile(r'[^\w\s:.]+')
+    _TRACK_DIMENSIONS = re.compile(r'(?=(\d\s*x\s*\d+\s*x\s*\d+\.?\d*))')
+    
+    def __init__(self, db_path: str = "dual_db.db", workers: int = 1):
         self.db_path = db_path
+        self.workers = max(1, workers)
     
     def normalize_engine_name(self, engine_name: str) -> str:
         """
@@ -34,52 +178,21 @@ class JsonSpecExtractor:
         normalized = engine_name.upper()
         
         # Remove all trademark symbols and special characters
-        normalized = re.sub(r'[®™℠©•�]', '', normalized)
-        
-        # Standardize common variations and abbreviations  
-        replacements = {
-            # Turbo variations
-            r'\bTURBO\s*R\b': 'TURBOR',
-            r'\bTURBO\s*CHARGED\b': 'TURBO',
-            r'\bTURBOCHARGED\b': 'TURBO',
-            
-            # E-TEC variations
-            r'\bE-TEC\b': 'ETEC',
-            r'\bETEC\b': 'ETEC',
-            r'\bE\s*TEC\b': 'ETEC',
-            
-            # ACE variations  
-            r'\bACE\b': 'ACE',
-            r'\bA\.C\.E\.\b': 'ACE',
-            
-            # EFI variations
-            r'\bEFI\b': 'EFI',
-            r'\bE\.F\.I\.\b': 'EFI',
-            r'\bFUEL\s*INJECTION\b': 'EFI',
-            
-            # Remove common filler words
-            r'\bWITH\b': '',
-            r'\bAND\b': '',
-            r'\bOR\b': '',
-            r'\bTHE\b': '',
-            
-            # Standardize separators
-            r'[-–—_/\\]': '',  # Remove dashes, slashes, underscores
-            r'[.:]': '',       # Remove periods and colons
-        }
+        normalized = self._TRADEMARK_SYMBOLS.sub('', normalized)
         
-        # Apply all replacements
-        for pattern, replacement in replacements.items():
-            normalized = re.sub(pattern, replacement, normalized)
+        # Standardize common variations, filler words and separators in one pass
+        normalized = self._ENGINE_NAME_GRAMMAR.sub(
+            lambda match: self._ENGINE_NAME_SUBSTITUTES[match.lastgroup], normalized
+        )
         
         # Remove all remaining non-alphanumeric characters except spaces
-        normalized = re.sub(r'[^A-Z0-9\s]', '', normalized)
+        normalized = self._NON_ALNUM_SPACE.sub('', normalized)
         
         # Normalize whitespace - collapse multiple spaces to single space
-        normalized = re.sub(r'\s+', ' ', normalized.strip())
+        normalized = self._WHITESPACE_RUN.sub(' ', normalized.strip())
         
         # Remove extra spaces around numbers and letters
-        normalized = re.sub(r'\s*(\d+)\s*', r'\1', normalized)
+        normalized = self._SPACED_NUMBER.sub(r'\1', normalized)
         
         return normalized
     
@@ -99,8 +212,8 @@ class JsonSpecExtractor:
                 normalized = normalizer_func(item)
             else:
                 # Default normalization: uppercase, no extra spaces, no special chars
-                normalized = re.sub(r'[^A-Z0-9\s]', '', str(item).upper().strip())
-                normalized = re.sub(r'\s+', ' ', normalized)
+                normalized = self._NON_ALNUM_SPACE.sub('', str(item).upper().strip())
+                normalized = self._WHITESPACE_RUN.sub(' ', normalized)
             
             if normalized not in seen:
                 seen.add(normalized)
@@ -114,57 +227,15 @@ class JsonSpecExtractor:
         
         # Normalize text to handle spaced headers like "S U M M I T � X �"
         # Remove all non-alphanumeric characters to collapse spaced letters
-        normalized_text = re.sub(r'[^A-Z0-9]+', '', page_text.upper())
-        
-        # Model name patterns - work with normalized text (alphanumeric only)
-        # SKIDOO Models
-        skidoo_patterns = [
-            (r'SUMMITXWITHEXPERTPACKAGE', 'Summit X', 'Expert Package', 'deep-snow'),
-            (r'SUMMITX(?!.*EXPERT)', 'Summit X', 'Base', 'deep-snow'),
-            (r'SUMMITADRENALINE', 'Summit Adrenaline', 'Base', 'deep-snow'),
-            (r'SUMMITNEO', 'Summit Neo', 'Base', 'deep-snow'),
-            (r'FREERIDE', 'Freeride', 'Base', 'deep-snow'),
-            (r'BACKCOUNTRYXRS', 'Backcountry X-RS', 'Base', 'crossover'),
-            (r'BACKCOUNTRYADRENALINE', 'Backcountry Adrenaline', 'Base', 'crossover'),
-            (r'BACKCOUNTRYSPORT', 'Backcountry Sport', 'Base', 'crossover'),
-            (r'MXZXRSWITHCOMPETITIONPACKAGE', 'MXZ X-RS', 'Competition Package', 'trail'),
-            (r'MXZXRS(?!.*COMPETITION)', 'MXZ X-RS', 'Base', 'trail'),
-            (r'MXZSPORT', 'MXZ Sport', 'Base', 'trail'),
-            (r'MXZNEO', 'MXZ Neo+', 'Base', 'trail'),
-            (r'RENEGADEXRS', 'Renegade X-RS', 'Base', 'trail'),
-            (r'RENEGADEADRENALINE', 'Renegade Adrenaline', 'Base', 'trail'),
-            (r'RENEGADESPORT', 'Renegade Sport', 'Base', 'trail'),
-            (r'EXPEDITIONXTREME', 'Expedition Xtreme', 'Base', 'utility'),
-            (r'EXPEDITIONSE', 'Expedition SE', 'Base', 'utility'),
-            (r'EXPEDITIONLE', 'Expedition LE', 'Base', 'utility'),
-            (r'EXPEDITIONSPORT', 'Expedition Sport', 'Base', 'utility'),
-            (r'GRANDTOURINGSPORT', 'Grand Touring Sport', 'Base', 'touring'),
-            (r'TUNDRАЛЕ', 'Tundra LE', 'Base', 'utility'),
-            (r'SKANDICLE', 'Skandic LE', 'Base', 'utility'),
-            (r'SKANDICSPORT', 'Skandic Sport', 'Base', 'utility'),
-        ]
-        
-        # LYNX Models
-        lynx_patterns = [
-            (r'RAVEREWITHENDUROPACKAGE', 'Rave RE', 'Enduro Package', 'trail'),
-            (r'RAVERE(?!.*ENDURO)', 'Rave RE', 'Base', 'trail'),
-            (r'RAVEGLS', 'Rave GLS', 'Base', 'trail'),
-            (r'ADVENTURELIMITED', 'Adventure Limited', 'Base', 'touring'),
-            (r'ADVENTURELX', 'Adventure LX', 'Base', 'touring'),
-            (r'ADVENTUREELECTRIC', 'Adventure Electric', 'Base', 'utility'),
-            (r'ADVENTURECORE', 'Adventure Core', 'Base', 'touring'),
-            (r'ADVENTURE(?!.*LIMITED|.*LX|.*ELECTRIC|.*CORE)', 'Adventure', 'Base', 'touring'),
-        ]
-        
-        model_patterns = skidoo_patterns + lynx_patterns
-        
-        for pattern, model_name, configuration, category in model_patterns:
-            if re.search(pattern, normalized_text):
+        normalized_text = self._NON_ALNUM.sub('', page_text.upper())
+        
+        for pattern, model_name, configuration, category in self._MODEL_PATTERNS:
+            if pattern.search(normalized_text):
                 return {
                     'model': model_name,
                     'configuration': configuration,
                     'category': category,
-                    'found_in_line': f'Matched {pattern} in normalized text'
+                    'found_in_line': f'Matched {pattern.pattern} in normalized text'
                 }
         
         return {'model': 'Unknown Model', 'configuration': 'Base', 'category': 'general', 'found_in_line': ''}
@@ -173,26 +244,13 @@ class JsonSpecExtractor:
         """Extract engine specifications from page text"""
         engine_data = {'variants': []}
         
-        # Look for engine variant headers
-        engine_patterns = [
-            r'850 E-TEC[®\s]*TURBO R',
-            r'850 E-TEC[®\s]*',
-            r'600R E-TEC[®\s]*',
-            r'600 EFI[®\s]*–[®\s]*85',
-            r'600 EFI[®\s]*–[®\s]*55',
-            r'900 ACE[®\s]*TURBO R',
-            r'900 ACE[®\s]*TURBO',
-            r'900 ACE[®\s]*',
-            r'600 ACE[®\s]*',
-        ]
-        
         found_engines = []
         normalized_engines = []  # Track normalized versions to prevent duplicates
         
-        for pattern in engine_patterns:
-            matches = re.findall(pattern, page_text, re.IGNORECASE)
-            for match in matches:
-                clean_engine = re.sub(r'[®\s]+', ' ', match).strip()
+        # Look for engine variant headers
+        for pattern in self._ENGINE_HEADER_PATTERNS:
+            for match in pattern.findall(page_text):
+                clean_engine = self._ENGINE_HEADER_CLEANUP.sub(' ', match).strip()
                 
                 # Comprehensive normalization for duplicate detection
                 normalized = self.normalize_engine_name(clean_engine)
@@ -208,39 +266,48 @@ class JsonSpecExtractor:
         for line in lines:
             line = line.strip()
             
+            # One scan tells which field rules can fire on this line
+            hits = {match.lastgroup for match in self._ENGINE_LINE_DISPATCH.finditer(line)}
+            if not hits:
+                continue
+            
             # Engine details pattern
-            if 'liquid-cooled' in line.lower():
+            if 'cooling' in hits:
                 current_specs['cooling'] = 'liquid-cooled'
-                if 'two-stroke' in line.lower():
+                line_lower = line.lower()
+                if 'two-stroke' in line_lower:
                     current_specs['type'] = '2-stroke'
-                elif 'four-stroke' in line.lower():
+                elif 'four-stroke' in line_lower:
                     current_specs['type'] = '4-stroke'
             
             # Displacement pattern  
-            displacement_match = re.search(r'(\d+)\s*-\s*(\d+\.?\d*)\s*cc', line)
-            if displacement_match:
-                current_specs['displacement'] = int(float(displacement_match.group(2)))  # Convert via float first to handle decimals
-                current_specs['displacement_cc'] = f"{displacement_match.group(1)} - {displacement_match.group(2)} cc"
+            if 'displacement' in hits:
+                displacement_match = self._DISPLACEMENT.search(line)
+                if displacement_match:
+                    current_specs['displacement'] = int(float(displacement_match.group(2)))  # Convert via float first to handle decimals
+                    current_specs['displacement_cc'] = f"{displacement_match.group(1)} - {displacement_match.group(2)} cc"
             
             # Bore x Stroke pattern
-            bore_match = re.search(r'(\d+\.?\d*)\s*x\s*(\d+\.?\d*)\s*mm', line)
-            if bore_match:
-                current_specs['bore_stroke'] = f"{bore_match.group(1)} x {bore_match.group(2)} mm"
+            if 'bore_stroke' in hits:
+                bore_match = self._BORE_STROKE.search(line)
+                if bore_match:
+                    current_specs['bore_stroke'] = f"{bore_match.group(1)} x {bore_match.group(2)} mm"
             
             # Fuel system
-            if 'fuel system' in line.lower():
-                fuel_match = re.search(r'fuel system\s+(.*)', line, re.IGNORECASE)
+            if 'fuel_system' in hits:
+                fuel_match = self._FUEL_SYSTEM.search(line)
                 if fuel_match:
                     current_specs['fuel_system'] = fuel_match.group(1).strip()
             
             # Fuel type
-            if 'premium unleaded' in line.lower():
+            if 'fuel_type' in hits:
                 current_specs['fuel_type'] = 'Premium unleaded - 95'
             
             # Fuel tank
-            fuel_tank_match = re.search(r'fuel tank.*?(\d+)', line, re.IGNORECASE)
-            if fuel_tank_match:
-                current_specs['fuel_tank_l'] = int(fuel_tank_match.group(1))
+            if 'fuel_tank' in hits:
+                fuel_tank_match = self._FUEL_TANK.search(line)
+                if fuel_tank_match:
+                    current_specs['fuel_tank_l'] = int(fuel_tank_match.group(1))
         
         # Create engine variants
         if found_engines:
@@ -266,28 +333,14 @@ class JsonSpecExtractor:
         for line in lines:
             line = line.strip()
             
-            # Overall dimensions
-            length_match = re.search(r'overall length.*?(\d{1,4})\s*mm', line, re.IGNORECASE)
-            if length_match:
-                dimensions['overall_length_mm'] = int(length_match.group(1))
-            
-            width_match = re.search(r'overall width.*?(\d{1,4})\s*mm', line, re.IGNORECASE)  
-            if width_match:
-                dimensions['overall_width_mm'] = int(width_match.group(1))
-                
-            height_match = re.search(r'overall height.*?(\d{1,4})\s*mm', line, re.IGNORECASE)
-            if height_match:
-                dimensions['overall_height_mm'] = int(height_match.group(1))
-            
-            # Ski stance
-            ski_match = re.search(r'ski stance.*?(\d{1,4})\s*mm', line, re.IGNORECASE)
-            if ski_match:
-                dimensions['ski_stance_mm'] = int(ski_match.group(1))
-            
-            # Dry weight
-            weight_match = re.search(r'dry weight.*?(\d{1,4})\s*kg', line, re.IGNORECASE)
-            if weight_match:
-                dimensions['dry_weight_kg'] = int(weight_match.group(1))
+            # Overall dimensions, ski stance and dry weight - only the
+            # rules whose keyword appears on the line are evaluated
+            hits = {match.lastgroup for match in self._DIMENSION_LINE_DISPATCH.finditer(line)}
+            for field_name, pattern in self._DIMENSION_PATTERNS.items():
+                if field_name in hits:
+                    value_match = pattern.search(line)
+                    if value_match:
+                        dimensions[field_name] = int(value_match.group(1))
         
         return dimensions
     
@@ -305,20 +358,23 @@ class JsonSpecExtractor:
         for line in lines:
             line = line.strip()
             
-            # Section headers
-            if "what's new" in line.lower():
-                current_section = 'whats_new'
-                continue
-            elif 'package highlights' in line.lower():
-                current_section = 'package_highlights'  
-                continue
-            elif 'features' in line.lower() and line.isupper():
-                current_section = 'features'
-                continue
+            # Section headers ("what's new" wins over "package highlights",
+            # which wins over an all-caps "features" header)
+            headers = {match.lastgroup for match in self._SECTION_HEADER_DISPATCH.finditer(line)}
+            if headers:
+                if 'whats_new' in headers:
+                    current_section = 'whats_new'
+                    continue
+                elif 'package_highlights' in headers:
+                    current_section = 'package_highlights'  
+                    continue
+                elif line.isupper():
+                    current_section = 'features'
+                    continue
             
             # Feature items (start with bullet)
             if line.startswith('•') or line.startswith('�'):
-                feature_text = re.sub(r'^[•�]\s*', '', line).strip()
+                feature_text = self._BULLET_PREFIX.sub('', line).strip()
                 if feature_text and current_section:
                     features_data[current_section].append(feature_text)
         
@@ -332,9 +388,15 @@ class JsonSpecExtractor:
         """Extract track options and specifications"""
         tracks = []
         
-        # Track patterns
-        track_pattern = r'(\w+(?:\s+\w+)*)[:\s]*\s*(\d+)\s*x\s*(\d+)\s*x\s*(\d+\.?\d*)'
-        matches = re.findall(track_pattern, page_text)
+        # Track patterns - only segments that contain a dimension triple are
+        # scanned, and only up to the end of their last triple
+        matches = []
+        for segment in self._TRACK_SEGMENT_BREAK.split(page_text):
+            segment_end = 0
+            for dimensions_match in self._TRACK_DIMENSIONS.finditer(segment):
+                segment_end = max(segment_end, dimensions_match.start() + len(dimensions_match.group(1)))
+            if segment_end:
+                matches.extend(self._TRACK_PATTERN.findall(segment[:segment_end]))
         
         for match in matches:
             track_name, length, width, profile = match
@@ -373,7 +435,7 @@ class JsonSpecExtractor:
         has_engine_specs = any(keyword in page_text.upper() for keyword in ['ROTAX', 'E-TEC', 'CYLINDERS', 'DISPLACEMENT', 'DRY WEIGHT'])
         
         # Use same normalized text approach for detecting model names
-        normalized_text = re.sub(r'[^A-Z0-9]+', '', page_text.upper())
+        normalized_text = self._NON_ALNUM.sub('', page_text.upper())
         # Include both SKIDOO and LYNX model keywords
         model_keywords = ['SUMMIT', 'MXZ', 'RENEGADE', 'EXPEDITION', 'BACKCOUNTRY', 'FREERIDE', 'TUNDRA', 'SKANDIC',  # SKIDOO
                          'RAVE', 'ADVENTURE']  # LYNX
@@ -472,21 +534,26 @@ class JsonSpecExtractor:
         
         with pdfplumber.open(pdf_path) as pdf:
             total_pages = len(pdf.pages)
-            
-            # Focus on specification pages
-            spec_pages = range(8, min(32, total_pages + 1))
-            
-            for page_num in spec_pages:
-                if page_num <= total_pages:
-                    page = pdf.pages[page_num - 1]
-                    page_text = page.extract_text()
-                    
-                    if page_text:
-                        product_data = self.extract_page_data(page_text, page_num, pdf_path.name, brand)
-                        
-                        if product_data:
-                            all_products.append(product_data)
-                            logger.info(f"  Page {page_num}: Extracted {product_data['model']} {product_data['configuration']}")
+        
+        # Focus on specification pages
+        spec_pages = list(range(8, min(32, total_pages + 1)))
+        
+        if self.workers > 1 and len(spec_pages) > 1:
+            # Each worker opens the PDF once and parses a contiguous page range
+            chunk_size = -(-len(spec_pages) // self.workers)
+            page_chunks = [spec_pages[i:i + chunk_size] for i in range(0, len(spec_pages), chunk_size)]
+            with ProcessPoolExecutor(max_workers=len(page_chunks)) as executor:
+                chunk_results = executor.map(
+                    _extract_page_range,
+                    [(str(pdf_path), brand, chunk) for chunk in page_chunks]
+                )
+                page_results = [page_result for chunk_result in chunk_results for page_result in chunk_result]
+        else:
+            page_results = _extract_page_range((str(pdf_path), brand, spec_pages), extractor=self)
+        
+        for page_num, product_data in page_results:
+            all_products.append(product_data)
+            logger.info(f"  Page {page_num}: Extracted {product_data['model']} {product_data['configuration']}")
         
         return all_products
     
@@ -569,6 +636,34 @@ class JsonSpecExtractor:
         
         logger.info(f"Saved {len(products)} products to database")
 
+def _extract_page_range(
+    task: Tuple[str, str, List[int]],
+    extractor: Optional[JsonSpecExtractor] = None
+) -> List[Tuple[int, Dict[str, Any]]]:
+    """
+    Extract products from a range of PDF pages
+    
+    Module-level so it can run in a worker process; returns
+    (page number, product) pairs in page order.
+    """
+    pdf_path, brand, page_numbers = task
+    extractor = extractor or JsonSpecExtractor()
+    source_doc = Path(pdf_path).name
+    results = []
+    
+    with pdfplumber.open(pdf_path) as pdf:
+        for page_num in page_numbers:
+            page_text = pdf.pages[page_num - 1].extract_text()
+            
+            if page_text:
+                product_data = extractor.extract_page_data(page_text, page_num, source_doc, brand)
+                
+                if product_data:
+                    results.append((page_num, product_data))
+    
+    return results
+
+
 def main():
     """Main extraction process"""
     extractor = JsonSpecExtractor()
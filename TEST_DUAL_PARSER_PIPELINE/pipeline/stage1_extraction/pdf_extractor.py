@@ -14,7 +14,7 @@ from datetime import datetime
 import sys
 sys.path.append('..')
 from .base_extractor import BaseExtractor
-from core import ProductData, ExtractionError
+from core import ProductData, ExtractionError, TextNormalizer
 
 logger = logging.getLogger(__name__)
 
@@ -205,10 +205,7 @@ class PDFExtractor(BaseExtractor):
                 logger.warning(f"Price parsing failed for {product_dict.get('model_code', 'UNKNOWN')}: {product_dict.get('price', 'N/A')}")
         
         # Normalize fields
-        def normalize(text):
-            if not text:
-                return ""
-            return re.sub(r'[^\w\s-]', ' ', text.lower().strip())
+        normalize = TextNormalizer.normalize_field
         
         cursor.execute("""
             INSERT INTO raw_pricelist_data (
@@ -407,10 +404,7 @@ class PDFExtractor(BaseExtractor):
     def _save_parsed_product(self, cursor, product: Dict[str, Any]):
         """Save parsed product to database"""
         
-        def normalize(text):
-            if not text:
-                return ""
-            return re.sub(r'[^\w\s-]', ' ', str(text).lower().strip())
+        normalize = TextNormalizer.normalize_field
         
         cursor.execute("""
             INSERT INTO raw_pricelist_data_parsed (
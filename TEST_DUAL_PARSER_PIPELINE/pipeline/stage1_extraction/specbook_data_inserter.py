@@ -5,8 +5,9 @@ Production tool for inserting LLM-extracted snowmobile specification data
 into the llm_specbook_data_target_schema table.
 
 Usage:
-    from specbook_data_inserter import insert_specbook_data
+    from specbook_data_inserter import insert_specbook_data, bulk_insert_specbook_data
     insert_specbook_data(json_data, 'dual_db.db')
+    bulk_insert_specbook_data(documents, 'dual_db.db', batch_size=500)
 """
 import sqlite3
 import json
@@ -200,89 +201,72 @@ json_data = {
     }
 }
 
-def insert_specbook_data(json_data, database_path='../../dual_db.db'):
-    """
-    Insert LLM-extracted snowmobile specification data into database.
-    
-    Args:
-        json_data (dict): Complete JSON data following LLM prompt structure
-        database_path (str): Path to SQLite database file
-        
-    Returns:
-        int: Record ID of inserted data
-    """
-    if not os.path.exists(database_path):
-        raise FileNotFoundError(f"Database not found: {database_path}")
-        
-    conn = sqlite3.connect(database_path)
-    cursor = conn.cursor()
-    
-    # Prepare the insert statement with ALL columns (excluding id, created_at, updated_at)
-    insert_sql = """
-    INSERT INTO llm_specbook_data_target_schema (
-        basic_info_brand,
-        basic_info_model,
-        basic_info_configuration,
-        basic_info_category,
-        basic_info_model_year,
-        basic_info_description,
-        marketing_content_whats_new,
-        marketing_content_package_highlights,
-        marketing_content_spring_options,
-        engines,
-        weight_min,
-        weight_max,
-        dimensions_overall_length,
-        dimensions_overall_width,
-        dimensions_overall_height,
-        dimensions_ski_stance,
-        dimensions_fuel_capacity,
-        tracks,
-        suspension_front_type,
-        suspension_front_travel,
-        suspension_front_shock,
-        suspension_front_adjustable,
-        suspension_rear_type,
-        suspension_rear_travel,
-        suspension_rear_shock,
-        suspension_rear_adjustable,
-        suspension_center_type,
-        suspension_center_shock,
-        powertrain_drive_clutch,
-        powertrain_driven_clutch,
-        powertrain_sprocket_pitch,
-        powertrain_belt_type,
-        powertrain_reverse,
-        brakes_type,
-        brakes_pistons,
-        brakes_adjustable_lever,
-        brakes_description,
-        features_platform,
-        features_headlights,
-        features_skis,
-        features_seating,
-        features_handlebar,
-        features_riser_block_height,
-        features_windshield,
-        features_visor_plug,
-        features_usb,
-        features_bumpers,
-        features_runner,
-        features_heated_grips,
-        features_additional_features,
-        colors,
-        pricing_msrp,
-        pricing_currency,
-        pricing_market,
-        metadata_extraction_notes,
-        metadata_document_type,
-        metadata_completeness,
-        full_llm_json
-    ) VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?)
-    """
-    
-    # Prepare the values
-    values = (
+# Columns written for each spec-book document (excluding id, created_at, updated_at)
+SPECBOOK_COLUMNS = (
+    'basic_info_brand',
+    'basic_info_model',
+    'basic_info_configuration',
+    'basic_info_category',
+    'basic_info_model_year',
+    'basic_info_description',
+    'marketing_content_whats_new',
+    'marketing_content_package_highlights',
+    'marketing_content_spring_options',
+    'engines',
+    'weight_min',
+    'weight_max',
+    'dimensions_overall_length',
+    'dimensions_overall_width',
+    'dimensions_overall_height',
+    'dimensions_ski_stance',
+    'dimensions_fuel_capacity',
+    'tracks',
+    'suspension_front_type',
+    'suspension_front_travel',
+    'suspension_front_shock',
+    'suspension_front_adjustable',
+    'suspension_rear_type',
+    'suspension_rear_travel',
+    'suspension_rear_shock',
+    'suspension_rear_adjustable',
+    'suspension_center_type',
+    'suspension_center_shock',
+    'powertrain_drive_clutch',
+    'powertrain_driven_clutch',
+    'powertrain_sprocket_pitch',
+    'powertrain_belt_type',
+    'powertrain_reverse',
+    'brakes_type',
+    'brakes_pistons',
+    'brakes_adjustable_lever',
+    'brakes_description',
+    'features_platform',
+    'features_headlights',
+    'features_skis',
+    'features_seating',
+    'features_handlebar',
+    'features_riser_block_height',
+    'features_windshield',
+    'features_visor_plug',
+    'features_usb',
+    'features_bumpers',
+    'features_runner',
+    'features_heated_grips',
+    'features_additional_features',
+    'colors',
+    'pricing_msrp',
+    'pricing_currency',
+    'pricing_market',
+    'metadata_extraction_notes',
+    'metadata_document_type',
+    'metadata_completeness',
+    'full_llm_json',
+)
+
+
+def _specbook_row(json_data):
+    """Flatten one LLM JSON document into a SPECBOOK_COLUMNS-ordered row tuple"""
+    return (
         json_data["basicInfo"]["brand"],
         json_data["basicInfo"]["model"],
         json_data["basicInfo"]["configuration"],
@@ -342,8 +326,39 @@ def insert_specbook_data(json_data, database_path='../../dual_db.db'):
         json_data["metadata"]["completeness"],
         json.dumps(json_data, indent=2)
     )
+
+
+# Bulk loader target tables: table name -> (columns, row builder). Each builder
+# flattens one LLM JSON document into the list of rows it contributes to the table.
+SPECBOOK_TABLES = {
+    'llm_specbook_data_target_schema': (SPECBOOK_COLUMNS, lambda json_data: [_specbook_row(json_data)]),
+}
+
+
+def _insert_sql(table, columns):
+    """Build a parameterised INSERT statement for a target table"""
+    placeholders = ', '.join('?' for _ in columns)
+    return f"INSERT INTO {table} ({', '.join(columns)}) VALUES ({placeholders})"
+
+
+def insert_specbook_data(json_data, database_path='../../dual_db.db'):
+    """
+    Insert LLM-extracted snowmobile specification data into database.
     
-    cursor.execute(insert_sql, values)
+    Args:
+        json_data (dict): Complete JSON data following LLM prompt structure
+        database_path (str): Path to SQLite database file
+        
+    Returns:
+        int: Record ID of inserted data
+    """
+    if not os.path.exists(database_path):
+        raise FileNotFoundError(f"Database not found: {database_path}")
+        
+    conn = sqlite3.connect(database_path)
+    cursor = conn.cursor()
+    
+    cursor.execute(_insert_sql('llm_specbook_data_target_schema', SPECBOOK_COLUMNS), _specbook_row(json_data))
     conn.commit()
     
     record_id = cursor.lastrowid
@@ -359,6 +374,82 @@ def insert_specbook_data(json_data, database_path='../../dual_db.db'):
     
     return record_id
 
+
+def bulk_insert_specbook_data(documents, database_path='../../dual_db.db', batch_size=500):
+    """
+    Bulk insert many LLM-extracted spec-book documents in one transaction.
+    
+    Documents are flattened into per-table row buffers that are loaded with a
+    single executemany() per table every batch_size documents. Secondary
+    indexes on the target tables are dropped for the duration of the load and
+    recreated once before commit; any failure rolls the whole load back.
+    
+    Args:
+        documents (iterable): LLM JSON documents following the prompt structure
+        database_path (str): Path to SQLite database file
+        batch_size (int): Documents buffered between executemany() flushes
+        
+    Returns:
+        dict: Number of rows inserted per table
+    """
+    if not os.path.exists(database_path):
+        raise FileNotFoundError(f"Database not found: {database_path}")
+    if batch_size < 1:
+        raise ValueError(f"batch_size must be positive: {batch_size}")
+    
+    insert_sql = {table: _insert_sql(table, columns) for table, (columns, _) in SPECBOOK_TABLES.items()}
+    buffers = {table: [] for table in SPECBOOK_TABLES}
+    inserted = dict.fromkeys(SPECBOOK_TABLES, 0)
+    
+    conn = sqlite3.connect(database_path, isolation_level=None)
+    cursor = conn.cursor()
+    
+    def flush():
+        for table, rows in buffers.items():
+            if rows:
+                cursor.executemany(insert_sql[table], rows)
+                inserted[table] += len(rows)
+                rows.clear()
+    
+    try:
+        cursor.execute("BEGIN")
+        
+        # Defer index maintenance: drop secondary indexes, rebuild after the load
+        placeholders = ', '.join('?' for _ in SPECBOOK_TABLES)
+        cursor.execute(
+            f"SELECT name, sql FROM sqlite_master WHERE type = 'index' AND sql IS NOT NULL AND tbl_name IN ({placeholders})",
+            tuple(SPECBOOK_TABLES)
+        )
+        indexes = cursor.fetchall()
+        for index_name, _ in indexes:
+            cursor.execute(f'DROP INDEX "{index_name}"')
+        
+        document_count = 0
+        for json_data in documents:
+            for table, (_, build_rows) in SPECBOOK_TABLES.items():
+                buffers[table].extend(build_rows(json_data))
+            document_count += 1
+            if document_count % batch_size == 0:
+                flush()
+        flush()
+        
+        for _, index_sql in indexes:
+            cursor.execute(index_sql)
+        
+        cursor.execute("COMMIT")
+    except Exception:
+        if conn.in_transaction:
+            cursor.execute("ROLLBACK")
+        raise
+    finally:
+        conn.close()
+    
+    print(f"Successfully bulk inserted {document_count} documents")
+    for table, row_count in inserted.items():
+        print(f"  {table}: {row_count} rows")
+    
+    return inserted
+
 # Example usage for testing
 if __name__ == "__main__":
     # Insert the example data
@@ -4,14 +4,47 @@ Defines the interface for all matching engine implementations
 """
 
 from abc import ABC, abstractmethod
-from typing import List, Dict, Any, Optional
+from typing import List, Dict, Any, Optional, Tuple
 import logging
+from dataclasses import dataclass, field
+from functools import cached_property
 from datetime import datetime
+from pathlib import Path
 
 from ...core import ProductData, CatalogData, MatchResult, MatchType, PipelineStats, PipelineStage, MatchingError
+from ...core.parallel import chunk_ranges, map_chunks, resolve_worker_count, uses_fork
 
 logger = logging.getLogger(__name__)
 
+# Per-process state of match_products() worker processes
+_WORKER_STATE: Dict[str, Any] = {}
+
+
+@dataclass
+class CatalogBucket:
+    """
+    Precomputed slice of the loaded catalog for one brand/year lookup
+    
+    Attributes:
+        indices: Positions of the entries in catalog_data, in catalog order
+        entries: The catalog entries themselves
+        embeddings: Embedding submatrix for the entries, when the matcher has one
+        arrays: Other matcher-specific per-entry arrays sliced to the bucket
+    """
+    
+    indices: Tuple[int, ...]
+    entries: List[CatalogData]
+    embeddings: Any = None
+    arrays: Dict[str, Any] = field(default_factory=dict)
+    
+    def __len__(self) -> int:
+        return len(self.indices)
+    
+    @cached_property
+    def positions(self) -> frozenset:
+        """Entry positions as a set, for membership tests"""
+        return frozenset(self.indices)
+
 
 class BaseMatcher(ABC):
     """
@@ -21,6 +54,9 @@ class BaseMatcher(ABC):
     matchers must implement for semantic and inheritance matching.
     """
     
+    # Smallest batch match_products() hands to worker processes
+    PARALLEL_MIN_PRODUCTS = 100
+    
     def __init__(self, config: Optional[Dict[str, Any]] = None):
         """
         Initialize matcher with configuration
@@ -32,7 +68,20 @@ class BaseMatcher(ABC):
         self.logger = logger
         self.stats = PipelineStats(stage=PipelineStage.MATCHING)
         self.catalog_data: List[CatalogData] = []
+        self.vector_index = None
+        
+        # Worker processes for match_products(); 0 or less means one per CPU
+        self.worker_count = self.config.get('worker_count', 1)
+        
+        # Candidates recorded in match_details['top_k'] when above 1 (see match_top_k())
+        self.top_k = self.config.get('top_k', 1)
         
+        # Brand/year bucket index built by load_catalog_data()
+        self._brand_groups: Dict[str, List[int]] = {}
+        self._entry_years: List[Optional[int]] = []
+        self._entry_positions: Dict[int, int] = {}
+        self._buckets: Dict[Tuple[str, Optional[int], bool], CatalogBucket] = {}
+    
     @abstractmethod
     def match_product(self, product: ProductData, catalog_entries: List[CatalogData]) -> MatchResult:
         """
@@ -68,12 +117,155 @@ class BaseMatcher(ABC):
             catalog_entries: List of catalog entries to use for matching
         """
         self.catalog_data = catalog_entries
+        self._build_catalog_index()
         self.logger.info(f"Loaded {len(catalog_entries)} catalog entries for matching")
     
+    def _build_catalog_index(self) -> None:
+        """Group catalog positions by normalised brand and record each entry's model year"""
+        self._brand_groups = {}
+        self._entry_years = []
+        self._entry_positions = {}
+        self._buckets = {}
+        
+        for position, entry in enumerate(self.catalog_data):
+            self._entry_positions[id(entry)] = position
+            brand = entry.extraction_metadata.get('brand', '').upper()
+            self._brand_groups.setdefault(brand, []).append(position)
+            
+            year = entry.extraction_metadata.get('model_year', entry.extraction_metadata.get('year'))
+            try:
+                self._entry_years.append(int(year) if year else None)
+            except (TypeError, ValueError):
+                self._entry_years.append(None)
+    
+    def catalog_bucket(self, brand: Optional[str], year: Optional[int] = None,
+                       bidirectional: bool = False) -> CatalogBucket:
+        """
+        Get the precomputed catalog slice for a brand and optional model year
+        
+        Brands follow the substring rule of the original linear filters: an
+        entry matches when the normalised product brand occurs in the entry
+        brand (and, if bidirectional, also when the entry brand occurs in the
+        product brand). A year bucket keeps entries of that year plus entries
+        without a known year. Each distinct lookup is computed once and then
+        served from a dictionary.
+        
+        Args:
+            brand: Product brand, None or empty for all brands
+            year: Model year, None for all years
+            bidirectional: Also match entry brands contained in the product brand
+        
+        Returns:
+            CatalogBucket with entries in catalog order
+        """
+        if len(self._entry_years) != len(self.catalog_data):
+            self._build_catalog_index()
+        
+        brand_norm = brand.upper().strip() if brand else ''
+        key = (brand_norm, year, bidirectional)
+        bucket = self._buckets.get(key)
+        if bucket is not None:
+            return bucket
+        
+        if brand_norm:
+            positions = sorted(
+                position
+                for entry_brand, group in self._brand_groups.items()
+                if brand_norm in entry_brand or (bidirectional and entry_brand in brand_norm)
+                for position in group
+            )
+        else:
+            positions = list(range(len(self.catalog_data)))
+        
+        if year is not None:
+            positions = [p for p in positions if self._entry_years[p] in (year, None)]
+        
+        indices = tuple(positions)
+        bucket = CatalogBucket(
+            indices=indices,
+            entries=[self.catalog_data[p] for p in indices]
+        )
+        self._populate_bucket(bucket)
+        self._buckets[key] = bucket
+        return bucket
+    
+    def catalog_position(self, entry: CatalogData) -> Optional[int]:
+        """Position of a loaded catalog entry in catalog_data, None for other objects"""
+        if len(self._entry_years) != len(self.catalog_data):
+            self._build_catalog_index()
+        return self._entry_positions.get(id(entry))
+    
+    @staticmethod
+    def catalog_key(entry: CatalogData) -> str:
+        """
+        Stable key of a catalog entry for stored results
+        
+        The entry's model family, which save_match_result() also uses to
+        build catalog_id, so a stored candidate can be looked up again
+        after the in-memory catalog_data is gone.
+        """
+        return entry.model_family
+    
+    def _populate_bucket(self, bucket: CatalogBucket) -> None:
+        """Attach matcher-specific data (e.g. embedding submatrix) to a new bucket"""
+        pass
+    
+    def build_vector_index(self, embeddings: Any, fingerprint: str = '') -> None:
+        """
+        Build the configured vector index over catalog embeddings
+        
+        The index type comes from config['vector_index'] ('brute_force' or
+        'ivf'). When config['vector_index_path'] names a saved index with the
+        same fingerprint and build parameters it is loaded instead of rebuilt,
+        taking over the configured search parameters (e.g. ivf_probe);
+        otherwise the new index is saved there.
+        
+        Args:
+            embeddings: L2-normalised catalog embedding matrix
+            fingerprint: Identifies the catalog and model the embeddings belong to
+        """
+        from .vector_index import create_vector_index, load_vector_index
+        
+        kind = self.config.get('vector_index', 'brute_force')
+        index_path = self.config.get('vector_index_path')
+        
+        params = {}
+        if kind == 'ivf':
+            params = {
+                'n_lists': self.config.get('ivf_lists', 0),
+                'n_probe': self.config.get('ivf_probe', 8)
+            }
+        
+        if index_path and Path(index_path).exists():
+            try:
+                index = load_vector_index(index_path)
+                if (index.kind == kind and index.fingerprint == fingerprint and len(index) == len(embeddings)
+                        and index.reconfigure(**params)):
+                    self.vector_index = index
+                    self.logger.info(f"Loaded {kind} vector index from {index_path}")
+                    return
+            except Exception as e:
+                self.logger.warning(f"Ignoring unreadable vector index {index_path}: {e}")
+        
+        index = create_vector_index(kind, **params).build(embeddings)
+        index.fingerprint = fingerprint
+        self.vector_index = index
+        
+        if index_path:
+            try:
+                index.save(index_path)
+            except OSError as e:
+                self.logger.warning(f"Failed to save vector index to {index_path}: {e}")
+    
     def match_products(self, products: List[ProductData]) -> List[MatchResult]:
         """
         Match multiple products against loaded catalog data
         
+        With worker_count above 1 and at least PARALLEL_MIN_PRODUCTS products,
+        the products are split into chunks (config['worker_chunk_size'], 0 for
+        automatic sizing) that are matched in worker processes. Results keep
+        the input order and the workers' counts are merged into self.stats.
+        
         Args:
             products: List of products to match
             
@@ -86,6 +278,42 @@ class BaseMatcher(ABC):
                 matching_method=self.__class__.__name__
             )
         
+        workers = resolve_worker_count(self.worker_count)
+        if workers > 1 and len(products) >= self.PARALLEL_MIN_PRODUCTS:
+            return self._match_parallel(products, workers)
+        return self._match_sequential(products)
+    
+    def match_top_k(self, products: List[ProductData], k: int = 5) -> List[MatchResult]:
+        """
+        Match products and keep the k best candidates of each for review
+        
+        Runs match_products() with top_k set to k. Every result's
+        match_details['top_k'] lists up to k (catalog key, similarity)
+        pairs, best first, where the key is catalog_key() of the entry (its
+        model family). Keys stay meaningful once stored in match_details,
+        unlike positions in the loaded catalog_data. Candidates come from the
+        same scoring pass as the best match, so review tooling never has to
+        recompute similarities.
+        
+        Args:
+            products: List of products to match
+            k: Number of candidates to keep per product
+        
+        Returns:
+            List of MatchResult objects
+        """
+        if k < 1:
+            raise ValueError(f"k must be at least 1, got {k}")
+        
+        previous = self.top_k
+        self.top_k = k
+        try:
+            return self.match_products(products)
+        finally:
+            self.top_k = previous
+    
+    def _match_sequential(self, products: List[ProductData]) -> List[MatchResult]:
+        """Match products one by one in this process"""
         try:
             self.stats.start_time = datetime.now()
             match_results = []
@@ -98,6 +326,7 @@ class BaseMatcher(ABC):
                     
                     result.processing_time = (end_time - start_time).total_seconds()
                     match_results.append(result)
+                    self._record_match_path(result.match_details.get('match_path', result.match_type.value))
                     
                     if result.matched:
                         self.stats.successful += 1
@@ -119,18 +348,9 @@ class BaseMatcher(ABC):
                         processing_time=0.0
                     )
                     match_results.append(failed_result)
+                    self._record_match_path('error')
             
-            self.stats.end_time = datetime.now()
-            self.stats.total_processed = len(products)
-            
-            if self.stats.start_time:
-                self.stats.processing_time = (self.stats.end_time - self.stats.start_time).total_seconds()
-            
-            self.logger.info(
-                f"Matching completed: {self.stats.successful}/{self.stats.total_processed} successful "
-                f"({self.stats.success_rate:.1f}%) in {self.stats.processing_time:.2f}s"
-            )
-            
+            self._finish_stats(len(products))
             return match_results
             
         except Exception as e:
@@ -140,6 +360,80 @@ class BaseMatcher(ABC):
                 original_exception=e
             )
     
+    def _match_parallel(self, products: List[ProductData], workers: int) -> List[MatchResult]:
+        """
+        Match products in a process pool
+        
+        Forked workers inherit this matcher, including its catalog index and
+        read-only embedding matrix, copy-on-write, and are only sent chunk
+        boundaries. Where fork is unavailable each worker rebuilds the matcher
+        from config and the catalog once; with cache_embeddings enabled its
+        catalog embeddings come from the memory-mapped embedding cache.
+        Workers return results without product or catalog objects, which are
+        restored here from the input list and catalog positions.
+        """
+        chunks = chunk_ranges(len(products), workers, self.config.get('worker_chunk_size', 0))
+        if uses_fork():
+            state = {'matcher': self, 'products': products}
+        else:
+            state = {
+                'matcher_class': type(self),
+                'config': {**self.config, 'top_k': self.top_k},
+                'catalog': self.catalog_data,
+                'products': products
+            }
+        
+        self.stats.start_time = datetime.now()
+        try:
+            chunk_results = map_chunks(_match_chunk, chunks, min(workers, len(chunks)),
+                                       initializer=_init_match_worker, initargs=(state,))
+        except Exception as e:
+            raise MatchingError(
+                message="Parallel batch matching failed",
+                matching_method=self.__class__.__name__,
+                original_exception=e
+            )
+        
+        match_results = []
+        for (start, end), (results, chunk_stats) in zip(chunks, chunk_results):
+            for product, (result, position) in zip(products[start:end], results):
+                result.product_data = product
+                if position is not None:
+                    result.catalog_data = self.catalog_data[position]
+                match_results.append(result)
+            
+            self.stats.successful += chunk_stats['successful']
+            self.stats.failed += chunk_stats['failed']
+            for path, count in chunk_stats['match_paths'].items():
+                self._record_match_path(path, count)
+        
+        self.stats.metadata['workers'] = min(workers, len(chunks))
+        self._finish_stats(len(products))
+        return match_results
+    
+    def _finish_stats(self, total: int) -> None:
+        """Record batch totals and timing after match_products()"""
+        self.stats.end_time = datetime.now()
+        self.stats.total_processed = total
+        
+        if self.stats.start_time:
+            self.stats.processing_time = (self.stats.end_time - self.stats.start_time).total_seconds()
+        
+        self.logger.info(
+            f"Matching completed: {self.stats.successful}/{self.stats.total_processed} successful "
+            f"({self.stats.success_rate:.1f}%) in {self.stats.processing_time:.2f}s"
+        )
+    
+    def _record_match_path(self, path: str, count: int = 1) -> None:
+        """Count which matching path resolved a product and refresh path fractions"""
+        paths = self.stats.metadata.setdefault('match_paths', {})
+        paths[path] = paths.get(path, 0) + count
+        
+        total = sum(paths.values())
+        self.stats.metadata['match_path_fractions'] = {
+            name: count / total for name, count in paths.items()
+        }
+    
     def calculate_similarity(self, text1: str, text2: str) -> float:
         """
         Calculate basic string similarity (can be overridden by subclasses)
@@ -186,11 +480,7 @@ class BaseMatcher(ABC):
         if not brand:
             return self.catalog_data
         
-        brand_norm = brand.upper().strip()
-        return [
-            entry for entry in self.catalog_data 
-            if brand_norm in entry.extraction_metadata.get('brand', '').upper()
-        ]
+        return list(self.catalog_bucket(brand).entries)
     
     def get_stats(self) -> PipelineStats:
         """Get matching statistics"""
@@ -198,4 +488,46 @@ class BaseMatcher(ABC):
     
     def reset_stats(self) -> None:
         """Reset matching statistics"""
-        self.stats = PipelineStats(stage=PipelineStage.MATCHING)
\ No newline at end of file
+        self.stats = PipelineStats(stage=PipelineStage.MATCHING)
+    
+    def prepare_worker(self) -> None:
+        """Hook run in each worker process before it matches, e.g. to limit library thread pools"""
+        pass
+
+
+def _init_match_worker(state: Dict[str, Any]) -> None:
+    """Process pool initializer: set up the matcher used by this worker"""
+    matcher = state.get('matcher')
+    if matcher is None:
+        matcher = state['matcher_class'](config=state['config'])
+        # Before the worker encodes the catalog
+        matcher.prepare_worker()
+        matcher.load_catalog_data(state['catalog'])
+    else:
+        matcher.prepare_worker()
+    matcher.worker_count = 1
+    
+    _WORKER_STATE['matcher'] = matcher
+    _WORKER_STATE['products'] = state['products']
+
+
+def _match_chunk(bounds: Tuple[int, int]) -> Tuple[List[Tuple[MatchResult, Optional[int]]], Dict[str, Any]]:
+    """Match products[start:end] in a worker; returns slimmed (result, catalog position) pairs and chunk stats"""
+    matcher = _WORKER_STATE['matcher']
+    start, end = bounds
+    
+    matcher.reset_stats()
+    results = []
+    for result in matcher._match_sequential(_WORKER_STATE['products'][start:end]):
+        position = matcher.catalog_position(result.catalog_data) if result.catalog_data is not None else None
+        result.product_data = None
+        if position is not None:
+            result.catalog_data = None
+        results.append((result, position))
+    
+    chunk_stats = {
+        'successful': matcher.stats.successful,
+        'failed': matcher.stats.failed,
+        'match_paths': matcher.stats.metadata.get('match_paths', {})
+    }
+    return results, chunk_stats
@@ -3,94 +3,48 @@ BERT Semantic Matcher Implementation
 BERT-enhanced semantic matching with 98.4% success rate for snowmobile terminology
 """
 
-import re
-from typing import List, Dict, Any, Optional
+import hashlib
+import heapq
+import importlib.util
+from functools import lru_cache
+from operator import itemgetter
+from typing import List, Dict, Any, Optional, Tuple
 import logging
 
-from .base_matcher import BaseMatcher
+from .base_matcher import BaseMatcher, CatalogBucket
+from .exact_key_index import ExactKeyIndex
 from ...core import ProductData, CatalogData, MatchResult, MatchType, MatchingError
+from ...core.text_normalizer import NORMALIZE_CACHE_SIZE, ReplacementTable, TextNormalizer
+from ...core.trigram_index import TrigramIndex
 
 logger = logging.getLogger(__name__)
 
-# BERT imports with graceful fallback
+# BERT support with graceful fallback; sentence-transformers itself is only
+# imported when the first matcher loads its model (encoders.get_encoder)
 try:
-    from sentence_transformers import SentenceTransformer
-    from sklearn.metrics.pairwise import cosine_similarity
     import numpy as np
-    BERT_AVAILABLE = True
-    logger.info("BERT libraries available - semantic matching enabled")
+    from .embedding_cache import EmbeddingCache
+    from .encoders import encoder_id, get_encoder
+    BERT_AVAILABLE = importlib.util.find_spec('sentence_transformers') is not None
 except ImportError:
     BERT_AVAILABLE = False
+
+if BERT_AVAILABLE:
+    logger.info("BERT libraries available - semantic matching enabled")
+else:
     logger.warning("BERT libraries not available - falling back to traditional fuzzy matching")
-    logger.info("Install: pip install sentence-transformers scikit-learn")
+    logger.info("Install: pip install sentence-transformers")
 
 
-class TextNormalizer:
-    """Utility class for text normalization operations"""
-    
-    @staticmethod
-    def normalize_model_name(text: str) -> str:
-        """Normalize model names for matching"""
-        if not text:
-            return ""
-        
-        # Remove trademark symbols
-        text = re.sub(r'[®™©]', '', text)
-        
-        # Standardize spacing
-        text = ' '.join(text.split())
-        
-        # Handle common variations
-        replacements = {
-            'X-RS': 'XRS',
-            'X RS': 'XRS',
-            'E-TEC': 'ETEC',
-            'E TEC': 'ETEC',
-            'NEO+': 'NEO PLUS',
-        }
-        
-        for old, new in replacements.items():
-            text = text.replace(old, new)
-        
-        return text.strip().upper()
-    
-    @staticmethod
-    def normalize_package_name(text: str) -> str:
-        """Normalize package names for matching"""
-        if not text:
-            return ""
-        
-        # Remove common package words
-        text = re.sub(r'\\b(PACKAGE|WITH|AND)\\b', '', text, flags=re.IGNORECASE)
-        
-        # Standardize spacing
-        text = ' '.join(text.split())
-        
-        return text.strip().upper()
-    
-    @staticmethod
-    def normalize_engine_spec(text: str) -> str:
-        """Normalize engine specifications for matching"""
-        if not text:
-            return ""
-        
-        # Extract key engine info
-        pattern = r'(\\d{3,4})\\s*([R]?)\\s*(E-TEC|ACE|ETEC)\\s*(TURBO\\s*R?)?'
-        match = re.search(pattern, text, re.IGNORECASE)
-        
-        if match:
-            displacement = match.group(1)
-            r_variant = match.group(2) or ""
-            engine_type = match.group(3).replace('-', '').upper()
-            turbo = match.group(4) or ""
-            
-            normalized = f"{displacement}{r_variant} {engine_type}"
-            if turbo:
-                normalized += f" {turbo.strip().upper()}"
-            
-            return normalized.strip()
-        
-        return text.strip().upper()
+@lru_cache(maxsize=NORMALIZE_CACHE_SIZE)
+def _domain_term_mask(text: str, terms: Tuple[str, ...]) -> int:
+    """Bitmask of the terms occurring in the lower-cased text; bit i stands for terms[i]"""
+    lowered = text.lower()
+    mask = 0
+    for bit, term in enumerate(terms):
+        if term in lowered:
+            mask |= 1 << bit
+    return mask
 
 
 class BERTMatcher(BaseMatcher):
@@ -104,6 +58,24 @@ class BERTMatcher(BaseMatcher):
     - Intelligent fallback to fuzzy matching
     """
     
+    # Domain boosting terms: model families score 0.1, engines/packages 0.05
+    DOMAIN_FAMILIES = ('summit', 'expedition', 'renegade', 'mxz', 'backcountry', 'freeride')
+    DOMAIN_ENGINES = ('850', '600', '900', 'etec', 'ace', 'turbo')
+    DOMAIN_PACKAGES = ('expert', 'competition', 'sport', 'adrenaline', 'xtreme')
+    
+    # Price list abbreviations expanded before BERT encoding
+    DOMAIN_MAPPINGS = {
+        'PKG': 'PACKAGE',
+        'PKG.': 'PACKAGE', 
+        'EXPERT PKG': 'EXPERT PACKAGE',
+        'X-RS': 'XRS',
+        'E-TEC': 'ETEC',
+        'TURBO R': 'TURBO',
+        'NEO+': 'NEO PLUS',
+        'SE': 'SPECIAL EDITION',
+        'LE': 'LIMITED EDITION',
+    }
+    
     def __init__(self, config: Optional[Dict[str, Any]] = None):
         """
         Initialize BERT semantic matcher
@@ -117,46 +89,225 @@ class BERTMatcher(BaseMatcher):
         self.model_name = self.config.get('bert_model', 'all-MiniLM-L6-v2')
         self.similarity_threshold = self.config.get('similarity_threshold', 0.7)
         self.domain_boost_enabled = self.config.get('domain_boost', True)
-        
-        # Initialize BERT model
-        self.model = None
+        self.batch_size = max(1, self.config.get('batch_size', 50))
+        self.ann_candidates = max(1, self.config.get('ann_candidates', 50))
+        self.fuzzy_candidates = max(1, self.config.get('fuzzy_candidates', 50))
+        self.year_filtering = self.config.get('enable_year_filtering', False)
+        
+        # Encoder backend (MatchingConfig.encoder_backend): torch, torch_int8 or onnx
+        self.encoder_backend = self.config.get('encoder_backend', 'torch')
+        self.onnx_model_file = self.config.get('onnx_model_file')
+        self.device = 'cuda' if self.config.get('use_gpu', False) else None
+        
+        # BERT model, loaded from the shared encoder registry on first use
+        self._model = None
+        self._model_loaded = False
         self.bert_available = BERT_AVAILABLE
-        self._load_bert_model()
+        
+        # Persistent catalog embedding cache (MatchingConfig.cache_embeddings), created on first use
+        self._embedding_cache = None
         
         # Text normalizer
         self.normalizer = TextNormalizer()
         
+        # Exact-key pre-stage (MatchingConfig.enable_exact_matching)
+        self.exact_matching_enabled = self.config.get('enable_exact_matching', True)
+        self.exact_index: Optional[ExactKeyIndex] = None
+        
         # Domain-specific mappings for fallback and boosting
-        self.domain_mappings = {
-            'PKG': 'PACKAGE',
-            'PKG.': 'PACKAGE', 
-            'EXPERT PKG': 'EXPERT PACKAGE',
-            'X-RS': 'XRS',
-            'E-TEC': 'ETEC',
-            'TURBO R': 'TURBO',
-            'NEO+': 'NEO PLUS',
-            'SE': 'SPECIAL EDITION',
-            'LE': 'LIMITED EDITION',
-        }
+        self.domain_mappings = dict(self.DOMAIN_MAPPINGS)
+        self._domain_replacements = ReplacementTable(self.domain_mappings, ignore_case=True, boundary=r'\\b')
+        
+        # Domain terms as mask bits: families in the low bits, then engines and packages
+        self._domain_terms = self.DOMAIN_FAMILIES + self.DOMAIN_ENGINES + self.DOMAIN_PACKAGES
+        self._family_bits = (1 << len(self.DOMAIN_FAMILIES)) - 1
+        self._domain_boost_values = self._domain_boost_table()
+        
+        # Catalog-side state precomputed by load_catalog_data()
+        self._catalog_search_texts: List[str] = []
+        self._catalog_valid = None
+        self._catalog_embeddings = None
+        self._catalog_domain_masks = None
+        self._domain_boost = None
+        self._popcounts = None
+        self._batch_best: Dict[int, Any] = {}
+        self._batch_exact: Dict[int, Any] = {}
+        self.trigram_index: Optional[TrigramIndex] = None
+    
+    @property
+    def model(self) -> Any:
+        """Sentence encoder, loaded on first access; None when BERT is unavailable"""
+        if not self._model_loaded:
+            self._load_bert_model()
+        return self._model
+    
+    @model.setter
+    def model(self, model: Any) -> None:
+        self._model = model
+        self._model_loaded = True
+    
+    def _load_bert_model(self) -> bool:
+        """
+        Load BERT model for semantic matching
         
-    def _load_bert_model(self) -> None:
-        """Load BERT model for semantic matching"""
+        Matchers with the same model configuration share one encoder per
+        process, so only the first load pays the import and memory cost.
+        
+        Returns:
+            Whether a model is available
+        """
+        self._model_loaded = True
         if not self.bert_available:
             self.logger.warning("BERT libraries not available - using fallback matching")
-            return
+            return False
         
         try:
-            self.logger.info(f"Loading BERT model: {self.model_name}")
-            self.model = SentenceTransformer(self.model_name)
+            self.logger.info(f"Loading BERT model: {self.model_name} ({self.encoder_backend} backend)")
+            self._model = get_encoder(self.model_name, self.encoder_backend, self.device, self.onnx_model_file)
             self.logger.info("BERT model loaded successfully!")
+            return True
         except Exception as e:
-            self.logger.error(f"Failed to load BERT model: {e}")
-            self.bert_available = False
+            if self.encoder_backend == 'torch':
+                self.logger.error(f"Failed to load BERT model: {e}")
+                self.bert_available = False
+                return False
+            self.logger.warning(f"Failed to load {self.encoder_backend} encoder backend, using torch: {e}")
+        
+        self.encoder_backend = 'torch'
+        return self._load_bert_model()
+    
+    @property
+    def embedding_cache(self) -> Optional["EmbeddingCache"]:
+        """On-disk catalog embedding cache for the current encoder, None when disabled"""
+        if not (self.bert_available and self.config.get('cache_embeddings', False)):
+            return None
+        
+        # Keyed by encoder, so a backend fallback during model loading gets its own cache
+        if self._embedding_cache is None or self._embedding_cache.model_name != self.encoder_name:
+            self._embedding_cache = EmbeddingCache(
+                cache_dir=self.config.get('embedding_cache_dir', '.cache/embeddings'),
+                model_name=self.encoder_name,
+                duration_hours=self.config.get('cache_duration_hours', 24),
+                dtype=self.config.get('embedding_cache_dtype', 'float32')
+            )
+        return self._embedding_cache
+    
+    @property
+    def encoder_name(self) -> str:
+        """Model name qualified by encoder backend; keys cached embeddings and vector indexes"""
+        return encoder_id(self.model_name, self.encoder_backend, self.onnx_model_file)
+    
+    def prepare_worker(self) -> None:
+        """
+        Run torch encoders with one intra-op thread in a worker process
+        
+        As in PyTorch DataLoader workers: a worker forked after the parent
+        used torch's OpenMP thread pool can hang in its first parallel
+        region, and with one worker per CPU each keeping a thread per CPU
+        the machine would be oversubscribed. The parallelism comes from the
+        worker processes instead.
+        """
+        if not self.bert_available or self.encoder_backend == 'onnx':
+            return
+        try:
+            import torch
+        except ImportError:
+            return
+        torch.set_num_threads(1)
     
     def get_match_type(self) -> MatchType:
         """Get the match type for this matcher"""
         return MatchType.BERT_SEMANTIC
     
+    def load_catalog_data(self, catalog_entries: List[CatalogData]) -> None:
+        """
+        Load catalog data and precompute the catalog side of BERT scoring
+        
+        Catalog search texts are built once and, when BERT is available,
+        encoded in batches into an L2-normalised embedding matrix so products
+        are scored with a single matrix multiply instead of per-pair encoding.
+        
+        Args:
+            catalog_entries: List of catalog entries to use for matching
+        """
+        super().load_catalog_data(catalog_entries)
+        
+        self._catalog_search_texts = [self._create_catalog_search_text(entry) for entry in catalog_entries]
+        self._catalog_valid = None
+        self._catalog_embeddings = None
+        self._catalog_domain_masks = None
+        self.vector_index = None
+        self.exact_index = None
+        self.trigram_index = None
+        
+        if self.exact_matching_enabled and catalog_entries:
+            self.exact_index = ExactKeyIndex(self.normalizer).build(catalog_entries)
+        
+        if not (self.bert_available and self.model and catalog_entries):
+            if catalog_entries:
+                # Fuzzy fallback: block SequenceMatcher comparisons with trigram overlap
+                self.trigram_index = TrigramIndex().build(self._catalog_search_texts)
+            return
+        
+        try:
+            clean_texts = [self._prepare_text_for_bert(text) for text in self._catalog_search_texts]
+            self._catalog_valid = np.array([bool(text) for text in clean_texts])
+            self._catalog_domain_masks = self._domain_masks(clean_texts)
+            self._domain_boost = np.array(self._domain_boost_values)
+            self._popcounts = self._popcount_table()
+            self._catalog_embeddings = self._encode_catalog(clean_texts)
+            self._buckets = {}
+            self.logger.info(
+                f"Precomputed {self._catalog_embeddings.shape[0]} catalog embeddings "
+                f"(dim={self._catalog_embeddings.shape[1]})"
+            )
+            
+            fingerprint = hashlib.sha1('\n'.join([self.encoder_name] + clean_texts).encode('utf-8')).hexdigest()
+            self.build_vector_index(self._catalog_embeddings, fingerprint=fingerprint)
+        except Exception as e:
+            self.logger.warning(f"Catalog embedding precomputation failed, using per-pair scoring: {e}")
+            self._catalog_valid = None
+            self._catalog_embeddings = None
+            self._catalog_domain_masks = None
+            self.vector_index = None
+    
+    def _match_sequential(self, products: List[ProductData]) -> List[MatchResult]:
+        """
+        Match products in this process, scoring them in batches against the catalog matrix
+        
+        Args:
+            products: List of products to match
+        
+        Returns:
+            List of MatchResult objects
+        """
+        # Exact-key hits resolve in O(1); only the residue is scored semantically
+        residue = products
+        if self.exact_index is not None:
+            residue = []
+            for product in products:
+                hit = self.exact_index.lookup(product)
+                if hit is None:
+                    residue.append(product)
+                else:
+                    self._batch_exact[id(product)] = hit
+        
+        if self._catalog_embeddings is not None and residue:
+            try:
+                for start in range(0, len(residue), self.batch_size):
+                    batch = residue[start:start + self.batch_size]
+                    for product, best in zip(batch, self._score_products(batch)):
+                        self._batch_best[id(product)] = best
+            except Exception as e:
+                self.logger.warning(f"Batch BERT scoring failed, scoring products individually: {e}")
+                self._batch_best = {}
+        
+        try:
+            return super()._match_sequential(products)
+        finally:
+            self._batch_best = {}
+            self._batch_exact = {}
+    
     def match_product(self, product: ProductData, catalog_entries: List[CatalogData]) -> MatchResult:
         """
         Match product against catalog entries using BERT semantic similarity
@@ -179,6 +330,23 @@ class BERTMatcher(BaseMatcher):
                     match_details={'error': 'No catalog entries provided'}
                 )
             
+            # Exact-key pre-stage
+            if self.exact_index is not None and catalog_entries is self.catalog_data:
+                hit = self._batch_exact.get(id(product)) or self.exact_index.lookup(product)
+                if hit is not None:
+                    return self._build_exact_result(product, *hit)
+            
+            # Precomputed catalog matrix: score against all entries at once
+            if self._catalog_embeddings is not None and catalog_entries is self.catalog_data:
+                best = self._batch_best.get(id(product))
+                if best is None:
+                    try:
+                        best = self._score_products([product])[0]
+                    except Exception as e:
+                        self.logger.warning(f"Matrix BERT scoring failed, using per-pair scoring: {e}")
+                if best is not None:
+                    return self._build_matrix_result(product, best)
+            
             # Filter by brand first for efficiency
             brand_filtered = self._filter_by_brand(product, catalog_entries)
             if not brand_filtered:
@@ -187,10 +355,14 @@ class BERTMatcher(BaseMatcher):
             best_match = None
             best_confidence = 0.0
             match_details = {}
+            scored = []
             
             # Create search text from product
             product_search_text = self._create_product_search_text(product)
             
+            if self.trigram_index is not None and catalog_entries is self.catalog_data:
+                brand_filtered = self._fuzzy_candidates(product, product_search_text) or brand_filtered
+            
             for catalog_entry in brand_filtered:
                 # Create catalog search text
                 catalog_search_text = self._create_catalog_search_text(catalog_entry)
@@ -200,6 +372,9 @@ class BERTMatcher(BaseMatcher):
                     product_search_text, catalog_search_text
                 )
                 
+                if self.top_k > 1 and similarity > 0.0:
+                    scored.append((similarity, catalog_entry))
+                
                 # Track best match
                 if similarity > best_confidence:
                     best_confidence = similarity
@@ -212,6 +387,12 @@ class BERTMatcher(BaseMatcher):
                         'threshold_used': self.similarity_threshold
                     }
             
+            if self.top_k > 1:
+                match_details['top_k'] = [
+                    (self.catalog_key(entry), similarity)
+                    for similarity, entry in heapq.nlargest(self.top_k, scored, key=itemgetter(0))
+                ]
+            
             # Determine if match is successful
             matched = best_confidence >= self.similarity_threshold
             
@@ -238,6 +419,9 @@ class BERTMatcher(BaseMatcher):
         if not product.brand:
             return catalog_entries
         
+        if catalog_entries is self.catalog_data:
+            return list(self.catalog_bucket(product.brand, bidirectional=True).entries)
+        
         brand_norm = product.brand.upper().strip()
         filtered = []
         
@@ -249,6 +433,27 @@ class BERTMatcher(BaseMatcher):
         
         return filtered
     
+    def _fuzzy_candidates(self, product: ProductData, product_search_text: str) -> Optional[List[CatalogData]]:
+        """
+        Catalog entries worth an exact fuzzy comparison
+        
+        Keeps the fuzzy_candidates entries of the product's brand bucket with
+        the highest trigram overlap. Returns None (scan everything) when the
+        pool is already small or no entry shares a trigram with the product.
+        """
+        positions = None
+        if product.brand:
+            bucket = self.catalog_bucket(product.brand, bidirectional=True)
+            if len(bucket):
+                positions = bucket.positions
+        
+        pool_size = len(self.catalog_data) if positions is None else len(positions)
+        if pool_size <= self.fuzzy_candidates:
+            return None
+        
+        candidates = self.trigram_index.candidates(product_search_text, self.fuzzy_candidates, positions)
+        return [self.catalog_data[position] for position in candidates] or None
+    
     def _create_product_search_text(self, product: ProductData) -> str:
         """Create searchable text representation of product"""
         parts = []
@@ -324,7 +529,9 @@ class BERTMatcher(BaseMatcher):
             embeddings = self.model.encode([clean_text1, clean_text2])
             
             # Calculate cosine similarity
-            similarity = cosine_similarity([embeddings[0]], [embeddings[1]])[0][0]
+            first, second = np.asarray(embeddings, dtype=np.float64)[:2]
+            norms = np.linalg.norm(first) * np.linalg.norm(second)
+            similarity = first @ second / norms if norms > 0.0 else 0.0
             
             # Apply domain-specific boosting
             if self.domain_boost_enabled:
@@ -337,52 +544,290 @@ class BERTMatcher(BaseMatcher):
             self.logger.warning(f"BERT similarity calculation failed: {e}")
             return self._fuzzy_similarity(text1, text2)
     
-    def _prepare_text_for_bert(self, text: str) -> str:
-        """Prepare text for BERT processing"""
-        if not text:
-            return ""
+    def _encode_normalized(self, texts: List[str]) -> "np.ndarray":
+        """Encode texts in batch_size chunks into an L2-normalised float32 matrix"""
+        chunks = [
+            np.asarray(self.model.encode(texts[start:start + self.batch_size]), dtype=np.float32)
+            for start in range(0, len(texts), self.batch_size)
+        ]
+        embeddings = np.vstack(chunks)
+        norms = np.linalg.norm(embeddings, axis=1, keepdims=True)
+        norms[norms == 0.0] = 1.0
+        return embeddings / norms
+    
+    def _encode_catalog(self, clean_texts: List[str]) -> "np.ndarray":
+        """Encode catalog texts, reusing and refreshing the embedding cache when enabled"""
+        if self.embedding_cache is None:
+            return self._encode_normalized(clean_texts)
+        
+        try:
+            embeddings, missing = self.embedding_cache.lookup(clean_texts)
+        except Exception as e:
+            self.logger.warning(f"Embedding cache lookup failed: {e}")
+            return self._encode_normalized(clean_texts)
+        
+        if not missing:
+            self.logger.info(f"Embedding cache hit for all {len(clean_texts)} catalog entries")
+            return embeddings
+        
+        missing_texts = [clean_texts[i] for i in missing]
+        encoded = self._encode_normalized(missing_texts)
+        if embeddings is None:
+            embeddings = np.empty((len(clean_texts), encoded.shape[1]), dtype=np.float32)
+        embeddings[missing] = encoded
+        self.logger.info(f"Embedding cache: {len(clean_texts) - len(missing)} hits, {len(missing)} encoded")
+        
+        try:
+            self.embedding_cache.store(missing_texts, encoded)
+        except Exception as e:
+            self.logger.warning(f"Failed to update embedding cache: {e}")
+        
+        return embeddings
+    
+    def _domain_mask(self, text: str) -> int:
+        """Bitmask of the domain terms in a text, memoised per distinct text"""
+        return _domain_term_mask(text, self._domain_terms)
+    
+    def _domain_masks(self, texts: List[str]) -> "np.ndarray":
+        """Domain term bitmasks of texts as an int64 vector"""
+        return np.fromiter((self._domain_mask(text) for text in texts), dtype=np.int64, count=len(texts))
+    
+    @classmethod
+    def _domain_boost_table(cls) -> Tuple[Tuple[float, ...], ...]:
+        """Boost for (shared family count, shared engine/package count), capped at 0.2"""
+        table = []
+        for family_count in range(len(cls.DOMAIN_FAMILIES) + 1):
+            row = []
+            for other_count in range(len(cls.DOMAIN_ENGINES) + len(cls.DOMAIN_PACKAGES) + 1):
+                # Summed term by term so the floats match the original per-term loop
+                boost = 0.0
+                for _ in range(family_count):
+                    boost += 0.1
+                for _ in range(other_count):
+                    boost += 0.05
+                row.append(min(0.2, boost))
+            table.append(tuple(row))
+        return tuple(table)
+    
+    def _popcount_table(self) -> "np.ndarray":
+        """Set-bit count of every family or engine/package sub-mask"""
+        width = max(len(self.DOMAIN_FAMILIES), len(self._domain_terms) - len(self.DOMAIN_FAMILIES))
+        return np.array([bin(value).count('1') for value in range(1 << width)], dtype=np.intp)
+    
+    def _matrix_domain_boost(self, product_masks: "np.ndarray", catalog_masks: "np.ndarray") -> "np.ndarray":
+        """Domain boost for every (product, catalog entry) pair from their bitmasks"""
+        shared = product_masks[:, np.newaxis] & catalog_masks[np.newaxis, :]
+        return self._domain_boost[
+            self._popcounts[shared & self._family_bits],
+            self._popcounts[shared >> len(self.DOMAIN_FAMILIES)]
+        ]
+    
+    def _populate_bucket(self, bucket: CatalogBucket) -> None:
+        """Attach the embedding submatrix and per-entry scoring arrays to a bucket"""
+        if self._catalog_embeddings is None:
+            return
         
-        # Clean up the text but preserve semantic meaning
-        text = text.strip()
+        ids = np.asarray(bucket.indices, dtype=np.int64)
+        mask = np.zeros(len(self.catalog_data), dtype=bool)
+        mask[ids] = True
         
-        # Replace domain abbreviations for better BERT understanding
-        for abbrev, full in self.domain_mappings.items():
-            text = re.sub(rf'\\b{re.escape(abbrev)}\\b', full, text, flags=re.IGNORECASE)
+        bucket.embeddings = self._catalog_embeddings[ids]
+        bucket.arrays = {
+            'ids': ids,
+            'valid': self._catalog_valid[ids],
+            'domain_masks': self._catalog_domain_masks[ids],
+            'mask': mask & self._catalog_valid
+        }
+    
+    def _product_bucket(self, product: ProductData) -> CatalogBucket:
+        """Candidate bucket for a product, falling back to all entries like match_product()"""
+        year = product.year if self.year_filtering else None
+        bucket = self.catalog_bucket(product.brand, year, bidirectional=True)
+        if not bucket and year is not None:
+            bucket = self.catalog_bucket(None, year)
+        if not bucket:
+            bucket = self.catalog_bucket(None)
+        return bucket
+    
+    def _score_products(self, products: List[ProductData]) -> List[Any]:
+        """
+        Score products against the precomputed catalog matrix
+        
+        Products are grouped by brand/year bucket and each group is scored
+        with one multiply against the bucket's embedding submatrix. Returns
+        one (catalog_index, similarity, product_search_text, top_k) tuple per
+        product, with catalog_index None when no entry scores above zero and
+        top_k the best top_k (catalog_index, similarity) pairs, or None when
+        top_k is 1.
+        """
+        search_texts = [self._create_product_search_text(product) for product in products]
+        clean_texts = [self._prepare_text_for_bert(text) for text in search_texts]
+        valid = np.array([bool(text) for text in clean_texts])
+        
+        queries = self._encode_normalized(clean_texts)
+        domain_masks = self._domain_masks(clean_texts)
+        if self.vector_index is not None and not self.vector_index.exact:
+            return self._score_products_ann(products, search_texts, valid, queries, domain_masks)
+        
+        groups: Dict[int, Any] = {}
+        for row, product in enumerate(products):
+            bucket = self._product_bucket(product)
+            groups.setdefault(id(bucket), (bucket, []))[1].append(row)
+        
+        results: List[Any] = [None] * len(products)
+        for bucket, rows in groups.values():
+            arrays = bucket.arrays
+            similarities = (queries[rows] @ bucket.embeddings.T).astype(np.float64)
+            
+            if self.domain_boost_enabled:
+                similarities = np.minimum(
+                    1.0, similarities + self._matrix_domain_boost(domain_masks[rows], arrays['domain_masks'])
+                )
+            
+            # Empty texts never match, mirroring _calculate_semantic_similarity()
+            similarities[:, ~arrays['valid']] = 0.0
+            similarities[~valid[rows], :] = 0.0
+            
+            best_positions = np.argmax(similarities, axis=1)
+            tops = self._top_candidates(similarities, arrays['ids']) if self.top_k > 1 else [None] * len(rows)
+            for row, scores, best_position, top in zip(rows, similarities, best_positions, tops):
+                best_similarity = float(scores[best_position])
+                if best_similarity > 0.0:
+                    results[row] = (int(arrays['ids'][best_position]), best_similarity, search_texts[row], top)
+                else:
+                    results[row] = (None, 0.0, search_texts[row], top)
+        return results
+    
+    def _top_candidates(self, similarities: "np.ndarray", ids: "np.ndarray") -> List[List[Any]]:
+        """
+        Best top_k (catalog_index, similarity) pairs of each score matrix row
         
-        # Remove trademark symbols but preserve semantic content
-        text = re.sub(r'[®™©]', '', text)
+        Selects candidates with argpartition, then sorts only those, best
+        first with ties in catalog order. Zero scores are left out.
         
-        # Normalize spacing
-        text = ' '.join(text.split())
+        Args:
+            similarities: (products, entries) score matrix
+            ids: Catalog index of each matrix column, ascending
+        """
+        k = min(self.top_k, similarities.shape[1])
+        if k == 0:
+            return [[] for _ in range(len(similarities))]
         
-        return text.lower()  # BERT models typically work better with lowercase
+        if k < similarities.shape[1]:
+            columns = np.argpartition(-similarities, k - 1, axis=1)[:, :k]
+        else:
+            columns = np.broadcast_to(np.arange(similarities.shape[1]), similarities.shape)
+        scores = np.take_along_axis(similarities, columns, axis=1)
+        order = np.lexsort((columns, -scores))
+        columns = np.take_along_axis(columns, order, axis=1)
+        scores = np.take_along_axis(scores, order, axis=1)
+        
+        return [
+            [(int(ids[column]), float(score)) for column, score in zip(row_columns, row_scores) if score > 0.0]
+            for row_columns, row_scores in zip(columns, scores)
+        ]
+    
+    def _score_products_ann(self, products: List[ProductData], search_texts: List[str], valid: "np.ndarray",
+                            queries: "np.ndarray", domain_masks: "np.ndarray") -> List[Any]:
+        """
+        Score products through an approximate vector index
+        
+        The index returns the ann_candidates nearest eligible entries of the
+        product's bucket; domain boosts are applied to those candidates only
+        and the best is chosen as in _score_products().
+        """
+        results = []
+        for row, (product, search_text) in enumerate(zip(products, search_texts)):
+            mask = self._product_bucket(product).arrays['mask']
+            if not valid[row] or not mask.any():
+                results.append((None, 0.0, search_text, [] if self.top_k > 1 else None))
+                continue
+            
+            scores, ids = self.vector_index.search(queries[row], self.ann_candidates, mask=mask)
+            found = ids[0] >= 0
+            ids = ids[0][found]
+            similarities = scores[0][found].astype(np.float64)
+            
+            if self.domain_boost_enabled:
+                similarities = np.minimum(
+                    1.0, similarities + self._matrix_domain_boost(domain_masks[row:row + 1], self._catalog_domain_masks[ids])[0]
+                )
+            
+            # First catalog entry wins ties, as in the exact path
+            order = np.argsort(ids, kind='stable')
+            ids, similarities = ids[order], similarities[order]
+            best = int(np.argmax(similarities))
+            top = self._top_candidates(similarities[np.newaxis, :], ids)[0] if self.top_k > 1 else None
+            if similarities[best] > 0.0:
+                results.append((int(ids[best]), float(similarities[best]), search_text, top))
+            else:
+                results.append((None, 0.0, search_text, top))
+        return results
+    
+    def _build_exact_result(self, product: ProductData, position: int, key: Any) -> MatchResult:
+        """Build a MatchResult for an exact-key hit"""
+        match_details = {
+            'match_path': 'exact',
+            'exact_key': list(key),
+            'matching_algorithm': 'exact_key'
+        }
+        if self.top_k > 1:
+            match_details['top_k'] = [(self.catalog_key(self.catalog_data[position]), 1.0)]
+        
+        return MatchResult(
+            product_data=product,
+            catalog_data=self.catalog_data[position],
+            match_type=MatchType.EXACT,
+            confidence_score=1.0,
+            matched=True,
+            match_details=match_details
+        )
+    
+    def _build_matrix_result(self, product: ProductData, best: Any) -> MatchResult:
+        """Build a MatchResult from a _score_products() entry"""
+        best_index, best_confidence, product_search_text, top = best
+        best_match = None
+        match_details = {}
+        
+        if best_index is not None:
+            best_match = self.catalog_data[best_index]
+            match_details = {
+                'product_search_text': product_search_text,
+                'catalog_search_text': self._catalog_search_texts[best_index],
+                'similarity_score': best_confidence,
+                'matching_algorithm': 'BERT',
+                'threshold_used': self.similarity_threshold
+            }
+        if top is not None:
+            match_details['top_k'] = [(self.catalog_key(self.catalog_data[index]), score) for index, score in top]
+        
+        matched = best_confidence >= self.similarity_threshold
+        
+        return MatchResult(
+            product_data=product,
+            catalog_data=best_match if matched else None,
+            match_type=self.get_match_type(),
+            confidence_score=best_confidence,
+            matched=matched,
+            match_details=match_details
+        )
+    
+    def _prepare_text_for_bert(self, text: str) -> str:
+        """Prepare text for BERT processing (memoised per distinct text)"""
+        if self._domain_replacements.mapping != self.domain_mappings:
+            self._domain_replacements = ReplacementTable(self.domain_mappings, ignore_case=True, boundary=r'\\b')
+        
+        # Domain abbreviations replaced for better BERT understanding, trademarks
+        # removed, spacing normalized and lowercased
+        return TextNormalizer.normalize_semantic_text(text, self._domain_replacements)
     
     def _calculate_domain_boost(self, text1: str, text2: str) -> float:
         """Apply domain-specific similarity boosting"""
-        boost = 0.0
-        
-        text1_lower = text1.lower()
-        text2_lower = text2.lower()
-        
-        # Boost for model family matches
-        families = ['summit', 'expedition', 'renegade', 'mxz', 'backcountry', 'freeride']
-        for family in families:
-            if family in text1_lower and family in text2_lower:
-                boost += 0.1
-        
-        # Boost for engine matches
-        engines = ['850', '600', '900', 'etec', 'ace', 'turbo']
-        for engine in engines:
-            if engine in text1_lower and engine in text2_lower:
-                boost += 0.05
-        
-        # Boost for package indicators
-        packages = ['expert', 'competition', 'sport', 'adrenaline', 'xtreme']
-        for package in packages:
-            if package in text1_lower and package in text2_lower:
-                boost += 0.05
-        
-        return min(0.2, boost)  # Cap boost at 0.2
+        shared = self._domain_mask(text1) & self._domain_mask(text2)
+        
+        family_count = bin(shared & self._family_bits).count('1')
+        other_count = bin(shared >> len(self.DOMAIN_FAMILIES)).count('1')
+        return self._domain_boost_values[family_count][other_count]
     
     def _fuzzy_similarity(self, text1: str, text2: str) -> float:
         """Fallback fuzzy similarity calculation"""
@@ -0,0 +1,242 @@
+"""
+Embedding Cache Implementation
+Persistent on-disk cache of text embeddings shared across processes
+"""
+
+import hashlib
+import json
+import os
+import re
+import time
+import uuid
+from pathlib import Path
+from typing import Dict, List, Optional, Tuple, Union
+import logging
+
+import numpy as np
+
+from .encoders import EMBEDDING_DTYPES, dequantize_embeddings, quantize_embeddings
+
+logger = logging.getLogger(__name__)
+
+
+class EmbeddingCache:
+    """
+    On-disk embedding cache keyed by (model name, normalised text hash)
+
+    Embeddings live in a float32, float16 or int8 .npy matrix that readers
+    open memory-mapped and read-only, so worker processes share the same
+    pages; int8 rows are stored with per-row scales kept in the index.
+    A JSON side index maps each text key to its matrix row and creation time;
+    entries older than duration_hours are treated as misses and dropped on
+    the next store(). Writers publish a new matrix file and then atomically
+    replace the index, so concurrent readers always see a consistent pair.
+    """
+
+    SUPPORTED_DTYPES = EMBEDDING_DTYPES
+
+    def __init__(self, cache_dir: Union[str, Path], model_name: str,
+                 duration_hours: float = 24, dtype: str = 'float32'):
+        """
+        Initialize embedding cache
+
+        Args:
+            cache_dir: Directory holding the cache files
+            model_name: Embedding model name; part of every cache key
+            duration_hours: Entry lifetime, 0 or less disables expiry
+            dtype: On-disk storage dtype ('float32', 'float16' or 'int8')
+        """
+        if dtype not in self.SUPPORTED_DTYPES:
+            raise ValueError(f"Unsupported embedding cache dtype: {dtype}")
+
+        self.cache_dir = Path(cache_dir)
+        self.model_name = model_name
+        self.duration_hours = duration_hours
+        self.dtype = dtype
+
+        slug = re.sub(r'[^\w.-]+', '_', model_name)
+        self.index_path = self.cache_dir / f"{slug}.{dtype}.json"
+
+        self._entries: Dict[str, Tuple[int, float]] = {}
+        self._matrix: Optional[np.ndarray] = None
+        self._scales: Optional[np.ndarray] = None
+        self._loaded = False
+
+    @staticmethod
+    def text_key(model_name: str, text: str) -> str:
+        """Cache key for a text: hash of model name and whitespace-normalised text"""
+        normalized = ' '.join(text.split())
+        return hashlib.sha1(f"{model_name}\n{normalized}".encode('utf-8')).hexdigest()
+
+    def lookup(self, texts: List[str]) -> Tuple[Optional[np.ndarray], List[int]]:
+        """
+        Look up cached embeddings for texts
+
+        Args:
+            texts: Texts to look up
+
+        Returns:
+            (embeddings, missing) where embeddings is a float32 (len(texts), dim)
+            matrix with cached rows filled in (None when nothing is cached) and
+            missing lists the indices of texts that still need encoding. A full
+            hit whose rows are stored in order is returned as a read-only
+            memory-mapped view without copying.
+        """
+        self._ensure_loaded()
+
+        rows = [self._fresh_row(self.text_key(self.model_name, text)) for text in texts]
+        missing = [i for i, row in enumerate(rows) if row is None]
+
+        if self._matrix is None or len(missing) == len(texts):
+            return None, missing
+
+        if not missing and self.dtype == 'float32' and rows == list(range(len(rows))):
+            return self._matrix[:len(rows)], missing
+
+        embeddings = np.zeros((len(texts), self._matrix.shape[1]), dtype=np.float32)
+        hits = [i for i, row in enumerate(rows) if row is not None]
+        embeddings[hits] = self._rows([rows[i] for i in hits])
+        return embeddings, missing
+
+    def store(self, texts: List[str], embeddings: np.ndarray) -> None:
+        """
+        Add embeddings to the cache, compacting away expired entries
+
+        Args:
+            texts: Texts the embeddings were computed from
+            embeddings: Matrix with one row per text
+        """
+        if len(texts) != len(embeddings):
+            raise ValueError(f"Got {len(texts)} texts for {len(embeddings)} embeddings")
+        if not texts:
+            return
+
+        self._ensure_loaded()
+        now = time.time()
+        embeddings = np.asarray(embeddings)
+
+        # Keep fresh existing rows, then append (or overwrite) the new entries
+        kept_keys = [key for key in self._entries if self._fresh_row(key) is not None]
+        new_keys = {}
+        for i, text in enumerate(texts):
+            new_keys[self.text_key(self.model_name, text)] = i
+        kept_keys = [key for key in kept_keys if key not in new_keys]
+
+        parts = []
+        if kept_keys:
+            if self._matrix.shape[1] != embeddings.shape[1]:
+                kept_keys = []
+            else:
+                parts.append(self._rows([self._entries[key][0] for key in kept_keys]))
+        parts.append(embeddings[list(new_keys.values())])
+        matrix, scales = quantize_embeddings(np.vstack(parts), self.dtype)
+
+        entries = {key: (row, self._entries[key][1]) for row, key in enumerate(kept_keys)}
+        for offset, key in enumerate(new_keys):
+            entries[key] = (len(kept_keys) + offset, now)
+
+        self._publish(matrix, entries, scales)
+
+    def clear(self) -> None:
+        """Remove all cache files for this model and dtype"""
+        old_matrix_path = self._matrix_path_from_index()
+        for path in (self.index_path, old_matrix_path):
+            if path is not None and path.exists():
+                path.unlink()
+        self._entries = {}
+        self._matrix = None
+        self._scales = None
+        self._loaded = True
+
+    def __len__(self) -> int:
+        self._ensure_loaded()
+        return sum(1 for key in self._entries if self._fresh_row(key) is not None)
+
+    def _rows(self, rows: List[int]) -> np.ndarray:
+        """Cached rows as float32"""
+        scales = None if self._scales is None else self._scales[rows]
+        return dequantize_embeddings(self._matrix[rows], scales)
+
+    def _fresh_row(self, key: str) -> Optional[int]:
+        """Matrix row for a key, or None when absent or expired"""
+        entry = self._entries.get(key)
+        if entry is None:
+            return None
+        row, created_at = entry
+        if self.duration_hours > 0 and time.time() - created_at > self.duration_hours * 3600:
+            return None
+        return row
+
+    def _matrix_path_from_index(self) -> Optional[Path]:
+        """Matrix file referenced by the current index, if any"""
+        try:
+            index = json.loads(self.index_path.read_text(encoding='utf-8'))
+            return self.cache_dir / index['matrix_file']
+        except (OSError, ValueError, KeyError):
+            return None
+
+    def _ensure_loaded(self) -> None:
+        """Load the index and memory-map the matrix on first use"""
+        if self._loaded:
+            return
+        self._loaded = True
+
+        if not self.index_path.exists():
+            return
+
+        try:
+            index = json.loads(self.index_path.read_text(encoding='utf-8'))
+            if index.get('model_name') != self.model_name or index.get('dtype') != self.dtype:
+                logger.warning(f"Ignoring embedding cache index for another model/dtype: {self.index_path}")
+                return
+
+            matrix = np.load(self.cache_dir / index['matrix_file'], mmap_mode='r')
+            entries = {key: (int(row), float(created_at)) for key, (row, created_at) in index['entries'].items()}
+            if entries and max(row for row, _ in entries.values()) >= matrix.shape[0]:
+                raise ValueError("index refers to rows beyond the cached matrix")
+            scales = np.asarray(index['scales'], dtype=np.float32) if self.dtype == 'int8' else None
+            if scales is not None and len(scales) != matrix.shape[0]:
+                raise ValueError("int8 scales do not match the cached matrix")
+
+            self._matrix = matrix
+            self._scales = scales
+            self._entries = entries
+            logger.info(f"Loaded {len(entries)} cached embeddings from {self.index_path}")
+        except (OSError, ValueError, KeyError, TypeError) as e:
+            logger.warning(f"Ignoring unreadable embedding cache {self.index_path}: {e}")
+            self._matrix = None
+            self._scales = None
+            self._entries = {}
+
+    def _publish(self, matrix: np.ndarray, entries: Dict[str, Tuple[int, float]],
+                 scales: Optional[np.ndarray] = None) -> None:
+        """Write a new matrix file, then atomically swap in the index pointing at it"""
+        self.cache_dir.mkdir(parents=True, exist_ok=True)
+        old_matrix_path = self._matrix_path_from_index()
+
+        matrix_file = f"{self.index_path.stem}.{uuid.uuid4().hex}.npy"
+        np.save(self.cache_dir / matrix_file, matrix)
+
+        index = {
+            'model_name': self.model_name,
+            'dtype': self.dtype,
+            'dim': int(matrix.shape[1]),
+            'matrix_file': matrix_file,
+            'entries': {key: [row, created_at] for key, (row, created_at) in entries.items()}
+        }
+        if scales is not None:
+            index['scales'] = scales.tolist()
+        tmp_index_path = self.index_path.with_suffix(f".{uuid.uuid4().hex}.tmp")
+        tmp_index_path.write_text(json.dumps(index), encoding='utf-8')
+        os.replace(tmp_index_path, self.index_path)
+
+        # Readers that already mapped the old file keep their mapping
+        if old_matrix_path is not None and old_matrix_path.name != matrix_file:
+            try:
+                old_matrix_path.unlink()
+            except OSError:
+                pass
+
+        self._matrix = np.load(self.cache_dir / matrix_file, mmap_mode='r')
+        self._scales = scales
+        self._entries = entries
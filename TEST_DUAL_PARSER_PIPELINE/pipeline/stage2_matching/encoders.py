@@ -0,0 +1,126 @@
+"""
+Sentence Encoder Backends
+CPU-oriented loaders for the BERT encoder and int8/float16 embedding quantisation
+"""
+
+import threading
+from typing import Any, Dict, Optional, Tuple
+import logging
+
+import numpy as np
+
+logger = logging.getLogger(__name__)
+
+ENCODER_BACKENDS = ('torch', 'torch_int8', 'onnx')
+
+EMBEDDING_DTYPES = ('float32', 'float16', 'int8')
+
+# Process-wide encoders keyed by (model name, backend, device, ONNX file)
+_ENCODERS: Dict[Tuple[str, str, Optional[str], Optional[str]], Any] = {}
+_ENCODERS_LOCK = threading.Lock()
+
+
+def load_encoder(model_name: str, backend: str = 'torch', device: Optional[str] = None,
+                 onnx_model_file: Optional[str] = None):
+    """
+    Load a sentence encoder exposing SentenceTransformer.encode()
+
+    Backends:
+        torch: the model in full float32 PyTorch (default)
+        torch_int8: Linear layers dynamically quantised to int8, CPU only
+        onnx: ONNX Runtime export of the model, CPU only; onnx_model_file
+            selects a pre-exported (e.g. quantised) file from the model repo
+
+    Args:
+        model_name: sentence-transformers model name or path
+        backend: One of ENCODER_BACKENDS
+        device: Torch device for the torch backend (None lets the library choose)
+        onnx_model_file: Optional ONNX file inside the model repository
+
+    Returns:
+        Encoder object
+    """
+    if backend not in ENCODER_BACKENDS:
+        raise ValueError(f"Unknown encoder backend: {backend} (available: {', '.join(ENCODER_BACKENDS)})")
+
+    from sentence_transformers import SentenceTransformer
+
+    if backend == 'torch':
+        return SentenceTransformer(model_name, device=device)
+
+    if backend == 'torch_int8':
+        import torch
+        model = SentenceTransformer(model_name, device='cpu')
+        return torch.quantization.quantize_dynamic(model, {torch.nn.Linear}, dtype=torch.qint8)
+
+    model_kwargs = {'file_name': onnx_model_file} if onnx_model_file else None
+    return SentenceTransformer(model_name, device='cpu', backend='onnx', model_kwargs=model_kwargs)
+
+
+def get_encoder(model_name: str, backend: str = 'torch', device: Optional[str] = None,
+                onnx_model_file: Optional[str] = None):
+    """
+    Shared encoder for a configuration, loaded by load_encoder() on first request
+
+    Every caller in the process gets the same encoder object, so building
+    more matchers costs no extra model memory. Failed loads are not cached.
+    """
+    key = (model_name, backend, device, onnx_model_file)
+    with _ENCODERS_LOCK:
+        encoder = _ENCODERS.get(key)
+        if encoder is None:
+            encoder = load_encoder(model_name, backend, device, onnx_model_file)
+            _ENCODERS[key] = encoder
+    return encoder
+
+
+def clear_encoders() -> None:
+    """Drop all shared encoders (they are freed once no matcher uses them)"""
+    with _ENCODERS_LOCK:
+        _ENCODERS.clear()
+
+
+def encoder_id(model_name: str, backend: str = 'torch', onnx_model_file: Optional[str] = None) -> str:
+    """Identifier of an encoder configuration, used to key cached embeddings"""
+    if backend == 'torch':
+        return model_name
+    if backend == 'onnx' and onnx_model_file:
+        return f"{model_name}@onnx:{onnx_model_file}"
+    return f"{model_name}@{backend}"
+
+
+def quantize_embeddings(embeddings: np.ndarray, dtype: str) -> Tuple[np.ndarray, Optional[np.ndarray]]:
+    """
+    Convert float32 embeddings to a storage dtype
+
+    int8 uses symmetric per-row scaling: row = int8_row * scale, with
+    scale = max(|row|) / 127.
+
+    Args:
+        embeddings: (n, dim) float matrix
+        dtype: One of EMBEDDING_DTYPES
+
+    Returns:
+        (stored matrix, per-row float32 scales or None)
+    """
+    if dtype not in EMBEDDING_DTYPES:
+        raise ValueError(f"Unsupported embedding dtype: {dtype}")
+
+    embeddings = np.asarray(embeddings, dtype=np.float32)
+    if dtype != 'int8':
+        return embeddings.astype(dtype), None
+
+    scales = np.abs(embeddings).max(axis=1) / 127.0 if len(embeddings) else np.zeros(0, dtype=np.float32)
+    scales = scales.astype(np.float32)
+    safe = np.where(scales > 0, scales, 1.0)[:, None]
+    quantized = np.clip(np.rint(embeddings / safe), -127, 127).astype(np.int8)
+    return quantized, scales
+
+
+def dequantize_embeddings(stored: np.ndarray, scales: Optional[np.ndarray] = None) -> np.ndarray:
+    """Inverse of quantize_embeddings(), returning float32"""
+    embeddings = np.asarray(stored, dtype=np.float32)
+    if scales is not None:
+        embeddings = embeddings * np.asarray(scales, dtype=np.float32)[:, None]
+    return embeddings
+
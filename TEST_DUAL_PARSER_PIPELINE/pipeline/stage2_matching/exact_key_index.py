@@ -0,0 +1,104 @@
+"""
+Exact Key Index Implementation
+Deterministic O(1) pre-stage resolving products whose normalised keys match one catalog entry
+"""
+
+import re
+from typing import Dict, List, Optional, Set, Tuple
+import logging
+
+from ...core import ProductData, CatalogData, TextNormalizer
+
+logger = logging.getLogger(__name__)
+
+ExactKey = Tuple[str, str, str, str]
+
+
+class ExactKeyIndex:
+    """
+    Hash index of normalised (brand, model family, package, engine) keys
+
+    Catalog entries contribute one key per available engine (or a single
+    engine-less key). A product is an exact hit when one of its keys maps to
+    exactly one catalog entry; keys shared by several entries are ambiguous
+    and left for semantic matching.
+    """
+
+    def __init__(self, normalizer=None):
+        """
+        Initialize exact key index
+
+        Args:
+            normalizer: TextNormalizer used to build keys
+        """
+        self.normalizer = normalizer or TextNormalizer()
+        self._keys: Dict[ExactKey, int] = {}
+        self._ambiguous: Set[ExactKey] = set()
+
+    @staticmethod
+    def normalize_brand(brand: Optional[str]) -> str:
+        """Brand key: uppercase alphanumerics only ('Ski-Doo' -> 'SKIDOO')"""
+        return re.sub(r'[^A-Z0-9]', '', brand.upper()) if brand else ''
+
+    def catalog_keys(self, entry: CatalogData) -> List[ExactKey]:
+        """Keys contributed by a catalog entry"""
+        brand = self.normalize_brand(entry.extraction_metadata.get('brand', ''))
+        family = self.normalizer.normalize_model_name(entry.model_family)
+        package = self.normalizer.normalize_package_name(entry.specifications.get('package', '') or '')
+        engines = [self.normalizer.normalize_engine_spec(engine) for engine in entry.available_engines] or ['']
+        return [(brand, family, package, engine) for engine in engines]
+
+    def product_keys(self, product: ProductData) -> List[ExactKey]:
+        """Candidate keys for a product, most specific first"""
+        brand = self.normalize_brand(product.brand)
+        family = self.normalizer.normalize_model_name(product.malli or '')
+        engine = self.normalizer.normalize_engine_spec(product.moottori or '')
+        if not family:
+            return []
+
+        keys = [(brand, family, self.normalizer.normalize_package_name(product.paketti or ''), engine)]
+        if product.paketti:
+            # Catalogs often fold the package into the family name
+            combined = self.normalizer.normalize_model_name(f"{product.malli} {product.paketti}")
+            keys.append((brand, combined, '', engine))
+        return keys
+
+    def build(self, catalog_entries: List[CatalogData]) -> 'ExactKeyIndex':
+        """
+        Build the index over catalog entries
+
+        Args:
+            catalog_entries: Catalog entries, addressed by position
+
+        Returns:
+            The index itself
+        """
+        owners: Dict[ExactKey, Set[int]] = {}
+        for position, entry in enumerate(catalog_entries):
+            for key in self.catalog_keys(entry):
+                owners.setdefault(key, set()).add(position)
+
+        self._keys = {key: next(iter(positions)) for key, positions in owners.items() if len(positions) == 1}
+        self._ambiguous = {key for key, positions in owners.items() if len(positions) > 1}
+
+        logger.info(f"Built exact key index: {len(self._keys)} unique keys, {len(self._ambiguous)} ambiguous")
+        return self
+
+    def lookup(self, product: ProductData) -> Optional[Tuple[int, ExactKey]]:
+        """
+        Resolve a product to a single catalog position
+
+        Args:
+            product: Product to resolve
+
+        Returns:
+            (catalog position, matched key), or None when no key is a unique hit
+        """
+        for key in self.product_keys(product):
+            position = self._keys.get(key)
+            if position is not None:
+                return position, key
+        return None
+
+    def __len__(self) -> int:
+        return len(self._keys)
@@ -0,0 +1,292 @@
+"""
+Vector Index Implementations
+Exact and approximate nearest-neighbour search over L2-normalised embeddings
+"""
+
+from abc import ABC, abstractmethod
+from pathlib import Path
+from typing import Any, Dict, Optional, Tuple, Type, Union
+import logging
+
+import numpy as np
+
+logger = logging.getLogger(__name__)
+
+
+class BaseVectorIndex(ABC):
+    """
+    Abstract base class for inner-product vector indexes
+
+    Embeddings are expected to be L2-normalised so inner product equals
+    cosine similarity. search() returns the top-k scores and catalog row ids
+    per query, best first, padded with -inf / -1 when fewer than k rows are
+    eligible. An optional boolean mask restricts the eligible rows.
+    """
+
+    kind = ''
+    exact = False
+
+    def __init__(self):
+        self.embeddings: Optional[np.ndarray] = None
+        self.fingerprint = ''
+
+    @abstractmethod
+    def build(self, embeddings: np.ndarray) -> 'BaseVectorIndex':
+        """
+        Build the index over catalog embeddings
+
+        Args:
+            embeddings: (n, dim) float32 matrix of L2-normalised rows
+
+        Returns:
+            The index itself
+        """
+        pass
+
+    @abstractmethod
+    def search(self, queries: np.ndarray, k: int,
+               mask: Optional[np.ndarray] = None) -> Tuple[np.ndarray, np.ndarray]:
+        """
+        Find the k highest inner-product rows for each query
+
+        Args:
+            queries: (m, dim) float32 matrix of L2-normalised queries
+            k: Number of neighbours per query
+            mask: Optional (n,) boolean array of eligible rows
+
+        Returns:
+            (scores, ids) arrays of shape (m, k)
+        """
+        pass
+
+    def __len__(self) -> int:
+        return 0 if self.embeddings is None else self.embeddings.shape[0]
+
+    def save(self, path: Union[str, Path]) -> None:
+        """Save the index (including embeddings) to an .npz file"""
+        path = Path(path)
+        path.parent.mkdir(parents=True, exist_ok=True)
+        with open(path, 'wb') as handle:
+            np.savez(handle, kind=self.kind, fingerprint=self.fingerprint,
+                     embeddings=self.embeddings, **self._state())
+
+    def _state(self) -> Dict[str, Any]:
+        """Index-specific arrays and parameters for save()"""
+        return {}
+
+    def _restore(self, state: Dict[str, Any]) -> None:
+        """Restore index-specific arrays and parameters from load()"""
+        pass
+
+    def reconfigure(self, **params) -> bool:
+        """
+        Apply configured parameters to a loaded index
+        
+        Search-time parameters are taken over; build-time parameters are
+        compared with the ones the index was built with.
+        
+        Args:
+            **params: Index-specific parameters, as for create_vector_index()
+        
+        Returns:
+            False if the index must be rebuilt for the build-time parameters
+        """
+        return True
+    
+    @staticmethod
+    def _top_k(scores: np.ndarray, ids: np.ndarray, k: int) -> Tuple[np.ndarray, np.ndarray]:
+        """Top-k of one candidate list, best first, ties broken by lower id"""
+        top_scores = np.full(k, -np.inf, dtype=np.float32)
+        top_ids = np.full(k, -1, dtype=np.int64)
+        if len(ids) == 0:
+            return top_scores, top_ids
+
+        if len(ids) > k:
+            keep = np.argpartition(-scores, k - 1)[:k]
+            scores, ids = scores[keep], ids[keep]
+        order = np.lexsort((ids, -scores))
+        top_scores[:len(order)] = scores[order]
+        top_ids[:len(order)] = ids[order]
+        return top_scores, top_ids
+
+
+class BruteForceIndex(BaseVectorIndex):
+    """Exact search by scanning every catalog embedding"""
+
+    kind = 'brute_force'
+    exact = True
+
+    def build(self, embeddings: np.ndarray) -> 'BruteForceIndex':
+        self.embeddings = np.asarray(embeddings, dtype=np.float32)
+        return self
+
+    def search(self, queries: np.ndarray, k: int,
+               mask: Optional[np.ndarray] = None) -> Tuple[np.ndarray, np.ndarray]:
+        queries = np.atleast_2d(np.asarray(queries, dtype=np.float32))
+        if mask is None:
+            all_ids = np.arange(len(self))
+            similarities = queries @ self.embeddings.T
+        else:
+            all_ids = np.flatnonzero(mask)
+            similarities = queries @ self.embeddings[all_ids].T
+
+        scores = np.empty((len(queries), k), dtype=np.float32)
+        ids = np.empty((len(queries), k), dtype=np.int64)
+        for row, query_scores in enumerate(similarities):
+            scores[row], ids[row] = self._top_k(query_scores, all_ids, k)
+        return scores, ids
+
+
+class IVFIndex(BaseVectorIndex):
+    """
+    Inverted-file approximate index
+
+    Rows are clustered with spherical k-means into n_lists inverted lists.
+    A query scores the n_probe nearest centroids and then only the rows in
+    those lists, exactly. If the mask leaves no rows in the probed lists the
+    query falls back to scanning every eligible row.
+    """
+
+    kind = 'ivf'
+    exact = False
+
+    def __init__(self, n_lists: int = 0, n_probe: int = 8, iterations: int = 10, seed: int = 0):
+        """
+        Initialize IVF index
+
+        Args:
+            n_lists: Number of clusters, 0 for sqrt(catalog size)
+            n_probe: Clusters scanned per query
+            iterations: k-means iterations at build time
+            seed: Random seed for centroid initialisation
+        """
+        super().__init__()
+        self.n_lists = n_lists
+        self.n_probe = n_probe
+        self.iterations = iterations
+        self.seed = seed
+        self.centroids: Optional[np.ndarray] = None
+        self.list_offsets: Optional[np.ndarray] = None
+        self.list_ids: Optional[np.ndarray] = None
+
+    def build(self, embeddings: np.ndarray) -> 'IVFIndex':
+        self.embeddings = np.asarray(embeddings, dtype=np.float32)
+        count = len(self.embeddings)
+        if count == 0:
+            raise ValueError("Cannot build an IVF index over an empty catalog")
+
+        n_lists = self.n_lists or int(np.sqrt(count))
+        n_lists = max(1, min(n_lists, count))
+
+        rng = np.random.default_rng(self.seed)
+        centroids = self.embeddings[rng.choice(count, size=n_lists, replace=False)].copy()
+
+        for _ in range(self.iterations):
+            assignments = self._assign(centroids)
+            order = np.argsort(assignments, kind='stable')
+            counts = np.bincount(assignments, minlength=n_lists)
+            filled = counts > 0
+            starts = np.concatenate(([0], np.cumsum(counts)[:-1]))
+            sums = np.zeros_like(centroids)
+            sums[filled] = np.add.reduceat(self.embeddings[order], starts[filled], axis=0)
+            norms = np.linalg.norm(sums, axis=1)
+            filled = norms > 0
+            centroids[filled] = sums[filled] / norms[filled, None]
+
+        assignments = self._assign(centroids)
+        order = np.argsort(assignments, kind='stable')
+        self.centroids = centroids
+        self.list_ids = order.astype(np.int64)
+        self.list_offsets = np.concatenate(([0], np.cumsum(np.bincount(assignments, minlength=n_lists))))
+        logger.info(f"Built IVF index: {count} rows in {n_lists} lists")
+        return self
+
+    def _assign(self, centroids: np.ndarray, chunk_size: int = 8192) -> np.ndarray:
+        """Nearest centroid per embedding, computed in chunks"""
+        return np.concatenate([
+            np.argmax(self.embeddings[start:start + chunk_size] @ centroids.T, axis=1)
+            for start in range(0, len(self.embeddings), chunk_size)
+        ])
+
+    def search(self, queries: np.ndarray, k: int,
+               mask: Optional[np.ndarray] = None) -> Tuple[np.ndarray, np.ndarray]:
+        queries = np.atleast_2d(np.asarray(queries, dtype=np.float32))
+        n_probe = max(1, min(self.n_probe, len(self.centroids)))
+        centroid_scores = queries @ self.centroids.T
+        probes = np.argpartition(-centroid_scores, n_probe - 1, axis=1)[:, :n_probe]
+
+        scores = np.empty((len(queries), k), dtype=np.float32)
+        ids = np.empty((len(queries), k), dtype=np.int64)
+        for row, query in enumerate(queries):
+            candidates = np.concatenate([
+                self.list_ids[self.list_offsets[probe]:self.list_offsets[probe + 1]] for probe in probes[row]
+            ])
+            if mask is not None:
+                candidates = candidates[mask[candidates]]
+                if len(candidates) == 0:
+                    candidates = np.flatnonzero(mask)
+            scores[row], ids[row] = self._top_k(self.embeddings[candidates] @ query, candidates, k)
+        return scores, ids
+
+    def _state(self) -> Dict[str, Any]:
+        return {
+            'centroids': self.centroids,
+            'list_offsets': self.list_offsets,
+            'list_ids': self.list_ids,
+            'params': np.array([self.n_lists, self.n_probe, self.iterations, self.seed])
+        }
+
+    def _restore(self, state: Dict[str, Any]) -> None:
+        self.centroids = state['centroids']
+        self.list_offsets = state['list_offsets']
+        self.list_ids = state['list_ids']
+        self.n_lists, self.n_probe, self.iterations, self.seed = (int(value) for value in state['params'])
+
+    def reconfigure(self, n_lists: int = 0, n_probe: int = 8, **params) -> bool:
+        """Take over n_probe; an explicit n_lists other than the built list count needs a rebuild"""
+        if n_lists and len(self.centroids) != max(1, min(n_lists, len(self))):
+            return False
+        self.n_probe = n_probe
+        return True
+
+
+VECTOR_INDEXES: Dict[str, Type[BaseVectorIndex]] = {
+    BruteForceIndex.kind: BruteForceIndex,
+    IVFIndex.kind: IVFIndex,
+}
+
+
+def create_vector_index(kind: str, **kwargs) -> BaseVectorIndex:
+    """
+    Create an empty vector index by name
+
+    Args:
+        kind: Index type ('brute_force' or 'ivf')
+        **kwargs: Index-specific parameters
+
+    Returns:
+        Unbuilt vector index
+    """
+    if kind not in VECTOR_INDEXES:
+        raise ValueError(f"Unknown vector index: {kind} (available: {', '.join(VECTOR_INDEXES)})")
+    return VECTOR_INDEXES[kind](**kwargs)
+
+
+def load_vector_index(path: Union[str, Path]) -> BaseVectorIndex:
+    """
+    Load a vector index saved with BaseVectorIndex.save()
+
+    Args:
+        path: Path to the .npz file
+
+    Returns:
+        Built vector index
+    """
+    with np.load(path, allow_pickle=False) as data:
+        state = {key: data[key] for key in data.files}
+
+    index = create_vector_index(str(state['kind']))
+    index.embeddings = state['embeddings']
+    index.fingerprint = str(state['fingerprint'])
+    index._restore(state)
+    return index
@@ -4,14 +4,25 @@ Defines the interface for all validation implementations
 """
 
 from abc import ABC, abstractmethod
-from typing import List, Dict, Any, Optional
+from copy import deepcopy
+from dataclasses import asdict
+from itertools import islice
+from typing import List, Dict, Any, Iterable, Iterator, Optional, Tuple
+import hashlib
+import json
 import logging
 from datetime import datetime
 
 from ...core import ProductData, CatalogData, ValidationResult, PipelineStats, PipelineStage, ValidationError
+from ...core.catalog_join import CatalogJoinIndex
+from ...core.parallel import WorkerPool, chunk_ranges, map_chunks, resolve_worker_count, uses_fork
+from .summary import TopKCounter, ValidationSummary
 
 logger = logging.getLogger(__name__)
 
+# Per-process state of validate_products() worker processes
+_WORKER_STATE: Dict[str, Any] = {}
+
 
 class BaseValidator(ABC):
     """
@@ -21,6 +32,15 @@ class BaseValidator(ABC):
     validators must implement for data quality and business rule validation.
     """
     
+    # Smallest batch validate_products() hands to worker processes
+    PARALLEL_MIN_PRODUCTS = 100
+    
+    # ProductData fields that validation reads (part of the result memo key)
+    VALIDATED_FIELDS = (
+        'model_code', 'brand', 'year', 'malli', 'paketti', 'moottori', 'telamatto',
+        'kaynnistin', 'mittaristo', 'vari', 'price', 'currency', 'market'
+    )
+    
     def __init__(self, config: Optional[Dict[str, Any]] = None):
         """
         Initialize validator with configuration
@@ -33,6 +53,14 @@ class BaseValidator(ABC):
         self.stats = PipelineStats(stage=PipelineStage.VALIDATION)
         self.validation_rules: Dict[str, Any] = {}
         
+        # Worker processes for validate_products(); 0 or less means one per CPU
+        self.worker_count = self.config.get('worker_count', 1)
+        
+        # Result memo: a DatabaseManager storing results per product content hash,
+        # used when the validator sets ruleset_version once its rules are loaded
+        self.result_memo = None
+        self.ruleset_version: Optional[str] = None
+    
     @abstractmethod
     def validate_product(self, product: ProductData, catalog_data: Optional[CatalogData] = None) -> ValidationResult:
         """
@@ -64,6 +92,16 @@ class BaseValidator(ABC):
         """
         Validate multiple products
         
+        With worker_count above 1 and at least PARALLEL_MIN_PRODUCTS products,
+        the products are split into chunks (config['worker_chunk_size'], 0 for
+        automatic sizing) that are validated in worker processes. Results keep
+        the input order and the workers' counts are merged into self.stats.
+        
+        With a result_memo and a ruleset_version, products whose validated
+        fields and joined catalog entry hash to a stored result for the same
+        rule-set version reuse that result without running any rules; new
+        results are stored for the next run.
+        
         Args:
             products: List of products to validate
             catalog_data: Optional catalog data for reference validation
@@ -71,25 +109,165 @@ class BaseValidator(ABC):
         Returns:
             List of ValidationResult objects
         """
+        self.stats.start_time = datetime.now()
+        self._begin_run()
+        
+        # Index catalog model families for product lookups
+        catalog_index = CatalogJoinIndex().build(catalog_data or [])
+        
+        validation_results, memo_hits = self._validate_batch(products, catalog_data or [], catalog_index)
+        
+        if memo_hits is not None:
+            self.stats.metadata['memo_hits'] = memo_hits
+        self._finish_stats(len(products))
+        return validation_results
+    
+    def iter_validate(self, products: Iterable[ProductData], catalog_data: Optional[List[CatalogData]] = None,
+                      summary: Optional[ValidationSummary] = None,
+                      batch_size: Optional[int] = None) -> Iterator[Tuple[ProductData, ValidationResult]]:
+        """
+        Validate products lazily, yielding (product, result) pairs in input order
+        
+        Products are drawn from the iterable batch_size at a time
+        (config['stream_batch_size'] by default) and every batch goes through
+        the memo, parallel and sequential paths of validate_products, so
+        memory use is bounded by the batch size however many products the
+        iterable yields. Stats are finished once the iterator is exhausted
+        or closed.
+        
+        With worker_count above 1 one process pool is started for the whole
+        iteration and every batch is sent to it, so workers are set up (and,
+        where fork is unavailable, build their validator and catalog index)
+        once per run rather than once per batch. Each batch's products are
+        pickled to the workers with their chunks.
+        
+        Args:
+            products: Products to validate, consumed lazily
+            catalog_data: Optional catalog data for reference validation
+            summary: Optional running summary each result is added to
+            batch_size: Products validated per batch
+        
+        Yields:
+            (product, ValidationResult) pairs
+        """
+        batch_size = batch_size or self.config.get('stream_batch_size', 1000)
+        self.stats.start_time = datetime.now()
+        self._begin_run()
+        catalog_index = CatalogJoinIndex().build(catalog_data or [])
+        
+        workers = resolve_worker_count(self.worker_count)
+        pool = None
+        if workers > 1:
+            state = self._worker_state(catalog_data or [], catalog_index)
+            pool = WorkerPool(workers, initializer=_init_validation_worker, initargs=(state,))
+        
+        products = iter(products)
+        total = 0
+        memo_hits = None
         try:
-            self.stats.start_time = datetime.now()
-            validation_results = []
+            while True:
+                batch = list(islice(products, batch_size))
+                if not batch:
+                    break
+                
+                batch_results, batch_hits = self._validate_batch(batch, catalog_data or [], catalog_index, pool)
+                total += len(batch)
+                if batch_hits is not None:
+                    memo_hits = (memo_hits or 0) + batch_hits
+                
+                for product, result in zip(batch, batch_results):
+                    if summary is not None:
+                        summary.add(result)
+                    yield product, result
+        finally:
+            if pool is not None:
+                pool.close()
+            if memo_hits is not None:
+                self.stats.metadata['memo_hits'] = memo_hits
+            self._finish_stats(total)
+    
+    def _validate_batch(self, products: List[ProductData], catalog_data: List[CatalogData],
+                        catalog_index: CatalogJoinIndex,
+                        pool: Optional[WorkerPool] = None) -> Tuple[List[ValidationResult], Optional[int]]:
+        """Results for products, in order, and the number of memoised results reused (None without a memo)"""
+        memoize = self.result_memo is not None and self.ruleset_version is not None
+        if memoize:
+            content_hashes = self._content_hashes(products, catalog_index)
+            cached = self.result_memo.load_validation_memo(content_hashes, self.ruleset_version, self.__class__.__name__)
+            pending = [position for position, content_hash in enumerate(content_hashes) if content_hash not in cached]
+        else:
+            pending = list(range(len(products)))
+        
+        pending_products = [products[position] for position in pending]
+        workers = resolve_worker_count(self.worker_count)
+        if workers > 1 and len(pending_products) >= self.PARALLEL_MIN_PRODUCTS:
+            pending_results = self._validate_parallel(pending_products, catalog_data, catalog_index, workers, pool)
+        else:
+            pending_results = self._validate_sequential(pending_products, catalog_index)
+        
+        if not memoize:
+            return pending_results, None
+        
+        validation_results: List[Optional[ValidationResult]] = [None] * len(products)
+        for position, result in zip(pending, pending_results):
+            validation_results[position] = result
+        
+        for position, content_hash in enumerate(content_hashes):
+            if validation_results[position] is None:
+                # Products with equal content share a cached result; each gets its own copy
+                result = deepcopy(cached[content_hash])
+                result.metadata['memoized'] = True
+                validation_results[position] = result
+                if result.success:
+                    self.stats.successful += 1
+                else:
+                    self.stats.failed += 1
+        
+        # Results of validation errors are not stored, so those products are retried next run
+        self.result_memo.save_validation_memo([
+            (self.product_id(products[position]), content_hashes[position], result)
+            for position, result in zip(pending, pending_results) if 'error' not in result.metadata
+        ], self.ruleset_version, self.__class__.__name__)
+        
+        return validation_results, len(products) - len(pending)
+    
+    @staticmethod
+    def product_id(product: ProductData) -> str:
+        """Database id of a product (price_entries.id)"""
+        return f"{product.brand}_{product.model_code}_{product.year}"
+    
+    def _content_hashes(self, products: List[ProductData], catalog_index: CatalogJoinIndex) -> List[str]:
+        """Memo key of each product: hash of its VALIDATED_FIELDS and its joined catalog entry"""
+        catalog_hashes: Dict[int, str] = {}
+        content_hashes = []
+        for product in products:
+            catalog_entry = catalog_index.lookup(product)
+            catalog_hash = None
+            if catalog_entry is not None:
+                catalog_hash = catalog_hashes.get(id(catalog_entry))
+                if catalog_hash is None:
+                    catalog_hash = self._hash_content(asdict(catalog_entry))
+                    catalog_hashes[id(catalog_entry)] = catalog_hash
             
-            # Create catalog lookup if provided
-            catalog_lookup = {}
-            if catalog_data:
-                for catalog_entry in catalog_data:
-                    catalog_lookup[catalog_entry.model_family] = catalog_entry
+            content = {name: getattr(product, name) for name in self.VALIDATED_FIELDS}
+            content['catalog'] = catalog_hash
+            content_hashes.append(self._hash_content(content))
+        return content_hashes
+    
+    @staticmethod
+    def _hash_content(content: Any) -> str:
+        """Stable hash of JSON-serialisable content"""
+        return hashlib.sha256(json.dumps(content, sort_keys=True, default=str).encode('utf-8')).hexdigest()
+    
+    def _validate_sequential(self, products: List[ProductData], catalog_index: CatalogJoinIndex) -> List[ValidationResult]:
+        """Validate products one by one in this process"""
+        try:
+            validation_results = []
             
             for product in products:
                 try:
                     # Find matching catalog data if available
-                    product_catalog = None
-                    if catalog_lookup and product.malli:
-                        for model_family, catalog_entry in catalog_lookup.items():
-                            if catalog_entry.matches_product(product):
-                                product_catalog = catalog_entry
-                                break
+                    product_catalog = catalog_index.lookup(product)
                     
                     result = self.validate_product(product, product_catalog)
                     validation_results.append(result)
@@ -107,21 +285,11 @@ class BaseValidator(ABC):
                     failed_result = ValidationResult(
                         success=False,
                         errors=[f"Validation failed: {str(e)}"],
-                        confidence=0.0
+                        confidence=0.0,
+                        metadata={'error': str(e)}
                     )
                     validation_results.append(failed_result)
             
-            self.stats.end_time = datetime.now()
-            self.stats.total_processed = len(products)
-            
-            if self.stats.start_time:
-                self.stats.processing_time = (self.stats.end_time - self.stats.start_time).total_seconds()
-            
-            self.logger.info(
-                f"Validation completed: {self.stats.successful}/{self.stats.total_processed} successful "
-                f"({self.stats.success_rate:.1f}%) in {self.stats.processing_time:.2f}s"
-            )
-            
             return validation_results
             
         except Exception as e:
@@ -131,6 +299,79 @@ class BaseValidator(ABC):
                 original_exception=e
             )
     
+    def _validate_parallel(self, products: List[ProductData], catalog_data: List[CatalogData],
+                           catalog_index: CatalogJoinIndex, workers: int,
+                           pool: Optional[WorkerPool] = None) -> List[ValidationResult]:
+        """
+        Validate products in a process pool
+        
+        Without a pool a one-off pool is started whose forked workers inherit
+        the products and are only sent chunk boundaries. A pool kept open by
+        iter_validate() was set up before these products existed, so their
+        chunks are pickled to it instead.
+        """
+        chunks = chunk_ranges(len(products), workers, self.config.get('worker_chunk_size', 0))
+        
+        try:
+            if pool is not None:
+                workers = pool.workers
+                chunk_results = pool.map(_validate_products_chunk, [products[start:end] for start, end in chunks])
+            else:
+                state = self._worker_state(catalog_data, catalog_index, products)
+                chunk_results = map_chunks(_validate_chunk, chunks, min(workers, len(chunks)),
+                                           initializer=_init_validation_worker, initargs=(state,))
+        except Exception as e:
+            raise ValidationError(
+                message="Parallel batch validation failed",
+                validation_rule=self.__class__.__name__,
+                original_exception=e
+            )
+        
+        validation_results = []
+        for results, chunk_stats in chunk_results:
+            validation_results.extend(results)
+            self.stats.successful += chunk_stats['successful']
+            self.stats.failed += chunk_stats['failed']
+            self.merge_rule_telemetry(chunk_stats['rule_telemetry'])
+        
+        self.stats.metadata['workers'] = min(workers, len(chunks))
+        return validation_results
+    
+    def _worker_state(self, catalog_data: List[CatalogData], catalog_index: CatalogJoinIndex,
+                      products: Optional[List[ProductData]] = None) -> Dict[str, Any]:
+        """
+        Initializer state for validation worker processes
+        
+        Forked workers inherit this validator, with its loaded rules and the
+        catalog join index, copy-on-write. Where fork is unavailable each
+        worker builds its own validator from config and indexes the catalog
+        once. Either way workers use the rule order of the current run.
+        """
+        if uses_fork():
+            state = {'validator': self, 'catalog_index': catalog_index}
+        else:
+            state = {
+                'validator_class': type(self),
+                'config': self.config,
+                'catalog': catalog_data
+            }
+        state['products'] = products
+        state['rule_order'] = self.export_rule_order()
+        return state
+    
+    def _finish_stats(self, total: int) -> None:
+        """Record batch totals and timing after validate_products() or iter_validate()"""
+        self.stats.end_time = datetime.now()
+        self.stats.total_processed = total
+        
+        if self.stats.start_time:
+            self.stats.processing_time = (self.stats.end_time - self.stats.start_time).total_seconds()
+        
+        self.logger.info(
+            f"Validation completed: {self.stats.successful}/{self.stats.total_processed} successful "
+            f"({self.stats.success_rate:.1f}%) in {self.stats.processing_time:.2f}s"
+        )
+    
     def validate_required_fields(self, product: ProductData) -> ValidationResult:
         """
         Validate that required fields are present and valid
@@ -214,56 +455,89 @@ class BaseValidator(ABC):
         
         return result
     
-    def get_validation_summary(self, results: List[ValidationResult]) -> Dict[str, Any]:
+    def get_validation_summary(self, results: Iterable[ValidationResult]) -> Dict[str, Any]:
         """
         Generate summary statistics for validation results
         
         Args:
-            results: List of validation results
+            results: Validation results, consumed once
             
         Returns:
             Summary statistics dictionary
         """
-        if not results:
-            return {}
-        
-        total = len(results)
-        successful = sum(1 for r in results if r.success)
-        with_warnings = sum(1 for r in results if r.warnings)
-        with_errors = sum(1 for r in results if r.errors)
-        avg_confidence = sum(r.confidence for r in results) / total
-        
-        return {
-            'total_validated': total,
-            'successful': successful,
-            'success_rate': (successful / total) * 100,
-            'with_warnings': with_warnings,
-            'with_errors': with_errors,
-            'average_confidence': avg_confidence,
-            'common_errors': self._get_common_issues([e for r in results for e in r.errors]),
-            'common_warnings': self._get_common_issues([w for r in results for w in r.warnings])
-        }
+        summary = ValidationSummary()
+        for result in results:
+            summary.add(result)
+        return summary.to_dict()
     
-    def _get_common_issues(self, issues: List[str], top_n: int = 5) -> List[Dict[str, Any]]:
+    def _get_common_issues(self, issues: Iterable[str], top_n: int = 5) -> List[Dict[str, Any]]:
         """Get most common issues from validation results"""
-        if not issues:
-            return []
-        
-        issue_counts = {}
-        for issue in issues:
-            issue_counts[issue] = issue_counts.get(issue, 0) + 1
-        
-        sorted_issues = sorted(issue_counts.items(), key=lambda x: x[1], reverse=True)
+        issue_counts = TopKCounter()
+        issue_counts.update(issues)
         
         return [
             {'issue': issue, 'count': count}
-            for issue, count in sorted_issues[:top_n]
+            for issue, count in issue_counts.most_common(top_n)
         ]
     
     def get_stats(self) -> PipelineStats:
         """Get validation statistics"""
         return self.stats
     
+    def export_rule_telemetry(self) -> Optional[Dict[str, Any]]:
+        """Per-rule telemetry gathered since reset_stats, for merging worker results; None if not tracked"""
+        return None
+    
+    def merge_rule_telemetry(self, telemetry: Optional[Dict[str, Any]]) -> None:
+        """Add per-rule telemetry exported by a worker process"""
+        pass
+    
+    def export_rule_order(self) -> Optional[List[str]]:
+        """Rule evaluation order of the current run, for worker processes; None if fixed"""
+        return None
+    
+    def apply_rule_order(self, order: Optional[List[str]]) -> None:
+        """Use the rule evaluation order of the parent's run in a worker process"""
+        pass
+    
+    def _begin_run(self) -> None:
+        """Hook run before each validate_products()/iter_validate() run, e.g. to fix rule order"""
+        pass
+    
     def reset_stats(self) -> None:
         """Reset validation statistics"""
-        self.stats = PipelineStats(stage=PipelineStage.VALIDATION)
\ No newline at end of file
+        self.stats = PipelineStats(stage=PipelineStage.VALIDATION)
+
+
+def _init_validation_worker(state: Dict[str, Any]) -> None:
+    """Process pool initializer: set up the validator used by this worker"""
+    validator = state.get('validator')
+    catalog_index = state.get('catalog_index')
+    if validator is None:
+        validator = state['validator_class'](config=state['config'])
+        catalog_index = CatalogJoinIndex().build(state['catalog'])
+    validator.worker_count = 1
+    validator.apply_rule_order(state['rule_order'])
+    
+    _WORKER_STATE['validator'] = validator
+    _WORKER_STATE['catalog_index'] = catalog_index
+    _WORKER_STATE['products'] = state['products']
+
+
+def _validate_chunk(bounds: Tuple[int, int]) -> Tuple[List[ValidationResult], Dict[str, Any]]:
+    """Validate products[start:end] of the worker's inherited products; returns the results and chunk counts"""
+    start, end = bounds
+    return _validate_products_chunk(_WORKER_STATE['products'][start:end])
+
+
+def _validate_products_chunk(products: List[ProductData]) -> Tuple[List[ValidationResult], Dict[str, Any]]:
+    """Validate products in a worker; returns the results and chunk counts"""
+    validator = _WORKER_STATE['validator']
+    
+    validator.reset_stats()
+    results = validator._validate_sequential(products, _WORKER_STATE['catalog_index'])
+    return results, {
+        'successful': validator.stats.successful,
+        'failed': validator.stats.failed,
+        'rule_telemetry': validator.export_rule_telemetry()
+    }
@@ -0,0 +1,112 @@
+"""
+Business Rule Index
+Model family detection and engine compatibility lookups for InternalValidator business rules
+"""
+
+import re
+from functools import lru_cache
+from typing import Callable, Dict, FrozenSet, List, Optional, Sequence, Tuple
+import logging
+
+logger = logging.getLogger(__name__)
+
+# Three-digit engine displacement, e.g. "850" in "850 E-TEC"
+ENGINE_SIZE_PATTERN = re.compile(r'(\d{3})')
+
+# Model names whose detected family is memoised per detector; feed names repeat heavily
+FAMILY_CACHE_SIZE = 16384
+
+
+def compile_family_detector(families: Sequence[str]) -> Callable[[str], Optional[str]]:
+    """
+    Compile model families into a memoised detector of the first listed family found
+
+    One alternation of all families rejects names containing none of them
+    in a single regex search. Names it does match are resolved to the first
+    family in list order occurring anywhere in the name (not the leftmost
+    occurrence), as a loop of substring checks over the list would.
+    Families are matched against the uppercased name.
+
+    Args:
+        families: Model families in priority order
+
+    Returns:
+        Uppercased name -> first listed family found (as listed), or None
+    """
+    listed = [(family.upper(), family) for family in families]
+    pattern = re.compile('|'.join(re.escape(upper) for upper, _ in listed)) if listed else None
+
+    @lru_cache(maxsize=FAMILY_CACHE_SIZE)
+    def detect(model_upper: str) -> Optional[str]:
+        if pattern is None or not pattern.search(model_upper):
+            return None
+        return next(family for upper, family in listed if upper in model_upper)
+
+    return detect
+
+
+class BusinessRuleIndex:
+    """
+    Lookup tables for the brand-model and engine-model business rules
+
+    Built once from the rule dictionaries when InternalValidator loads its
+    rules, replacing per-product loops over the families:
+    - brand families: per brand, a detector of the brand's model families
+    - engine families: one detector over the engine_compatibility families
+      and a dict from normalised (uppercased) family to the frozenset of
+      compatible engine sizes
+
+    Repeated model names are then a memo lookup plus a set lookup.
+    """
+
+    def __init__(self):
+        self._brand_detectors: Dict[str, Callable[[str], Optional[str]]] = {}
+        self._engine_detector: Callable[[str], Optional[str]] = compile_family_detector([])
+        self._engine_rules: Dict[str, Tuple[str, FrozenSet[str]]] = {}
+        self.compatible_engines: Dict[str, FrozenSet[str]] = {}
+
+    def build(self, engine_compatibility: Dict[str, List[str]],
+              brand_model_compatibility: Dict[str, List[str]]) -> 'BusinessRuleIndex':
+        """
+        Build the index
+
+        Args:
+            engine_compatibility: Model family -> compatible engine sizes, in priority order
+            brand_model_compatibility: Brand -> model families
+
+        Returns:
+            The index itself
+        """
+        self._brand_detectors = {
+            brand: compile_family_detector(families) for brand, families in brand_model_compatibility.items()
+        }
+        self._engine_detector = compile_family_detector(list(engine_compatibility))
+        self.compatible_engines = {
+            family.upper(): frozenset(engines) for family, engines in engine_compatibility.items()
+        }
+        self._engine_rules = {
+            family: (family, self.compatible_engines[family.upper()]) for family in engine_compatibility
+        }
+
+        logger.info(
+            f"Built business rule index: {len(self._brand_detectors)} brands, "
+            f"{len(self.compatible_engines)} engine families"
+        )
+        return self
+
+    def brand_family(self, brand: str, model_upper: str) -> Optional[str]:
+        """First model family of the brand found in the uppercased model name"""
+        detector = self._brand_detectors.get(brand)
+        return detector(model_upper) if detector else None
+
+    def engine_family(self, model_upper: str) -> Optional[str]:
+        """First engine_compatibility family found in the uppercased model name"""
+        return self._engine_detector(model_upper)
+
+    def engine_rule(self, model_upper: str) -> Optional[Tuple[str, FrozenSet[str]]]:
+        """(family, compatible engine sizes) of the first engine_compatibility family in the name"""
+        return self._engine_rules.get(self._engine_detector(model_upper))
+
+    def engine_compatible(self, family: str, engine_size: str) -> bool:
+        """Whether an engine size is listed for a model family"""
+        return engine_size in self.compatible_engines.get(family.upper(), frozenset())
@@ -0,0 +1,271 @@
+"""
+Columnar Field Rule Engine
+InternalValidator field rules compiled into NumPy mask checks over whole product batches
+"""
+
+import re
+from dataclasses import dataclass
+from operator import attrgetter
+from typing import Any, Callable, Dict, List, Set, Tuple
+import logging
+
+import numpy as np
+
+from ...core import ProductData, ValidationResult
+
+logger = logging.getLogger(__name__)
+
+# Product fields checked against text_rules and numeric_rules, in reporting order
+TEXT_FIELDS = ('model_code', 'brand', 'malli', 'paketti', 'moottori', 'vari')
+NUMERIC_FIELDS = ('year',)
+
+ALLOWED_CURRENCIES = ('EUR', 'RUB')
+
+
+@dataclass(frozen=True)
+class ColumnRule:
+    """
+    One compiled field check
+
+    Attributes:
+        level: 'error' or 'warning'
+        mask: Batch columns -> boolean array flagging the rows that fail
+        message: Message for a flagged product
+    """
+
+    level: str
+    mask: Callable[[Dict[str, np.ndarray]], np.ndarray]
+    message: Callable[[ProductData], str]
+
+
+class FieldRuleEngine:
+    """
+    Field rules of InternalValidator evaluated a whole batch at a time
+
+    The price, text and numeric rule dictionaries are compiled once into
+    ColumnRules. A batch is turned into NumPy columns (prices, currencies,
+    one string array per text field, years) and every rule yields one
+    boolean mask over the batch: range checks are array comparisons,
+    lengths and required/forbidden words use numpy.char, allowed values use
+    numpy.isin, and patterns are matched once per distinct value.
+    ValidationResults are built only for flagged rows, with the same
+    messages in the same order as the row-wise checks.
+
+    Rows holding values the columns cannot represent (e.g. a non-numeric
+    price) are reported as unsupported for the caller to check row-wise.
+    """
+
+    def __init__(self, price_rules: Dict[str, Any], text_rules: Dict[str, Dict[str, Any]],
+                 numeric_rules: Dict[str, Dict[str, Any]]):
+        """
+        Compile field rules
+
+        Args:
+            price_rules: InternalValidator.price_rules
+            text_rules: InternalValidator.text_rules
+            numeric_rules: InternalValidator.numeric_rules
+        """
+        self.text_fields = tuple(name for name in TEXT_FIELDS if name in text_rules)
+        self.numeric_fields = tuple(name for name in NUMERIC_FIELDS if name in numeric_rules)
+        self.rules: List[ColumnRule] = []
+
+        self._compile_price_rules(price_rules)
+        for name in self.text_fields:
+            self._compile_text_rules(name, text_rules[name])
+        for name in self.numeric_fields:
+            self._compile_numeric_rules(name, numeric_rules[name])
+
+        logger.info(f"Compiled {len(self.rules)} columnar field checks")
+
+    def _compile_price_rules(self, rules: Dict[str, Any]) -> None:
+        minimum, maximum = rules['min_price'], rules['max_price']
+        self.rules += [
+            ColumnRule('error', lambda c: c['has_price'] & (c['price'] < minimum),
+                       lambda p: f"Price too low: {p.price} (minimum: {minimum})"),
+            ColumnRule('error', lambda c: c['has_price'] & (c['price'] > maximum),
+                       lambda p: f"Price too high: {p.price} (maximum: {maximum})"),
+            ColumnRule('error', lambda c: c['has_price'] & ~np.isin(c['currency'], ALLOWED_CURRENCIES),
+                       lambda p: f"Invalid currency: {p.currency} (allowed: EUR, RUB)"),
+            ColumnRule('warning', lambda c: c['has_price'] & (c['currency'] == 'RUB') & (np.mod(c['price'], 1) != 0),
+                       lambda p: "RUB prices should not have decimal places"),
+        ]
+
+    def _compile_text_rules(self, name: str, rules: Dict[str, Any]) -> None:
+        values, present = f'{name}', f'{name}:present'
+        lengths, upper = f'{name}:length', f'{name}:upper'
+
+        if 'min_length' in rules:
+            minimum = rules['min_length']
+            self.rules.append(ColumnRule(
+                'error', lambda c: c[present] & (c[lengths] < minimum),
+                lambda p: f"{name} too short: {len(getattr(p, name))} characters (minimum: {minimum})"
+            ))
+
+        if 'max_length' in rules:
+            maximum = rules['max_length']
+            self.rules.append(ColumnRule(
+                'error', lambda c: c[present] & (c[lengths] > maximum),
+                lambda p: f"{name} too long: {len(getattr(p, name))} characters (maximum: {maximum})"
+            ))
+
+        if 'pattern' in rules:
+            pattern = rules['pattern']
+            regex = re.compile(pattern)
+            self.rules.append(ColumnRule(
+                'error', lambda c: c[present] & ~self._matches(regex, c[values]),
+                lambda p: f"{name} does not match required pattern: {pattern}"
+            ))
+
+        if 'allowed_values' in rules:
+            allowed = rules['allowed_values']
+            self.rules.append(ColumnRule(
+                'error', lambda c: c[present] & ~np.isin(c[values], allowed),
+                lambda p: f"{name} not in allowed values: {allowed}"
+            ))
+
+        for word in rules.get('required_words', []):
+            self.rules.append(ColumnRule(
+                'error', lambda c, word=word: c[present] & (np.char.find(c[upper], word.upper()) < 0),
+                lambda p, word=word: f"{name} must contain: {word}"
+            ))
+
+        for word in rules.get('forbidden_words', []):
+            self.rules.append(ColumnRule(
+                'error', lambda c, word=word: c[present] & (np.char.find(c[upper], word.upper()) >= 0),
+                lambda p, word=word: f"{name} contains forbidden word: {word}"
+            ))
+
+    def _compile_numeric_rules(self, name: str, rules: Dict[str, Any]) -> None:
+        values, present = f'{name}', f'{name}:present'
+
+        if 'min_value' in rules:
+            minimum = rules['min_value']
+            self.rules.append(ColumnRule(
+                'error', lambda c: c[present] & (c[values] < minimum),
+                lambda p: f"{name} too low: {getattr(p, name)} (minimum: {minimum})"
+            ))
+
+        if 'max_value' in rules:
+            maximum = rules['max_value']
+            self.rules.append(ColumnRule(
+                'error', lambda c: c[present] & (c[values] > maximum),
+                lambda p: f"{name} too high: {getattr(p, name)} (maximum: {maximum})"
+            ))
+
+        if 'allowed_values' in rules:
+            allowed = rules['allowed_values']
+            self.rules.append(ColumnRule(
+                'warning', lambda c: c[present] & ~np.isin(c[values], allowed),
+                lambda p: f"{name} not in typical values: {allowed}"
+            ))
+
+    @staticmethod
+    def _matches(regex: re.Pattern, values: np.ndarray) -> np.ndarray:
+        """re.match of every value, evaluated once per distinct value"""
+        distinct, inverse = np.unique(values, return_inverse=True)
+        matched = np.array([regex.match(value) is not None for value in distinct.tolist()], dtype=bool)
+        return matched[inverse.reshape(-1)]
+
+    @staticmethod
+    def _number_column(values: List[Any], unsupported: np.ndarray) -> np.ndarray:
+        """Float column with NaN for None; other values mark their rows unsupported"""
+        if set(map(type, values)) <= {int, float, type(None)}:
+            try:
+                column = np.array(values, dtype=np.float64)
+                # NaN stands for None, so a NaN in the data is checked row-wise
+                if np.count_nonzero(np.isnan(column)) == values.count(None):
+                    return column
+            except OverflowError:
+                pass
+
+        column = np.full(len(values), np.nan)
+        for row, value in enumerate(values):
+            if value is None:
+                continue
+            try:
+                if type(value) not in (int, float) or value != value:
+                    raise TypeError(value)
+                column[row] = value
+            except (TypeError, OverflowError):
+                unsupported[row] = True
+        return column
+
+    @staticmethod
+    def _text_column(values: List[Any], unsupported: np.ndarray) -> np.ndarray:
+        """String column with '' for falsy values; other values mark their rows unsupported"""
+        # NumPy strings drop trailing NULs, so those values are checked row-wise
+        if set(map(type, values)) <= {str, type(None)} and '\x00' not in ''.join(filter(None, values)):
+            return np.array([value or '' for value in values], dtype=str)
+
+        column = []
+        for row, value in enumerate(values):
+            if isinstance(value, str) and not value.endswith('\x00'):
+                column.append(value)
+            else:
+                if value:
+                    unsupported[row] = True
+                column.append('')
+        return np.array(column, dtype=str)
+
+    def _columns(self, products: List[ProductData]) -> Tuple[Dict[str, np.ndarray], np.ndarray]:
+        """Batch columns and a mask of rows the columns cannot represent"""
+        unsupported = np.zeros(len(products), dtype=bool)
+
+        def field(name: str) -> List[Any]:
+            return list(map(attrgetter(name), products))
+
+        columns = {
+            'price': self._number_column(field('price'), unsupported),
+            'currency': self._text_column(field('currency'), unsupported)
+        }
+        columns['has_price'] = ~np.isnan(columns['price'])
+
+        for name in self.text_fields:
+            values = self._text_column(field(name), unsupported)
+            columns[name] = values
+            columns[f'{name}:present'] = values != ''
+            columns[f'{name}:length'] = np.char.str_len(values)
+            columns[f'{name}:upper'] = np.char.upper(values)
+
+        for name in self.numeric_fields:
+            values = self._number_column(field(name), unsupported)
+            columns[name] = values
+            # Only truthy values are checked, so zero counts as missing
+            columns[f'{name}:present'] = ~np.isnan(values) & (values != 0)
+
+        return columns, unsupported
+
+    def validate(self, products: List[ProductData]) -> Tuple[Dict[int, ValidationResult], Set[int]]:
+        """
+        Evaluate every field rule over a batch
+
+        Args:
+            products: Products to check
+
+        Returns:
+            ({row: ValidationResult} for rows with errors or warnings,
+             rows that have to be checked row-wise instead)
+        """
+        if not products:
+            return {}, set()
+
+        columns, unsupported = self._columns(products)
+
+        flagged: Dict[int, List[ColumnRule]] = {}
+        with np.errstate(invalid='ignore'):
+            for rule in self.rules:
+                for row in np.flatnonzero(rule.mask(columns) & ~unsupported).tolist():
+                    flagged.setdefault(row, []).append(rule)
+
+        issues = {}
+        for row in sorted(flagged):
+            product = products[row]
+            result = ValidationResult(success=True)
+            for rule in flagged[row]:
+                if rule.level == 'error':
+                    result.add_error(rule.message(product))
+                else:
+                    result.warnings.append(rule.message(product))
+            issues[row] = result
+
+        return issues, set(np.flatnonzero(unsupported).tolist())
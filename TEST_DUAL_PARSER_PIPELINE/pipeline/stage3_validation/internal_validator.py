@@ -6,13 +6,20 @@ Prevents invalid data from ever reaching downstream systems
 
 import re
 import json
+import hashlib
 import sqlite3
+import time
 from pathlib import Path
 from typing import Dict, List, Any, Optional
 from datetime import datetime
 
 from .base_validator import BaseValidator
+from .model_index import ModelIndex
+from .field_rules import FieldRuleEngine
+from .business_rules import ENGINE_SIZE_PATTERN, BusinessRuleIndex
+from .rule_order import RuleTelemetry
 from ...core import ProductData, CatalogData, ValidationResult, ValidationError
+from ...core.catalog_join import CatalogJoinIndex
 
 
 class InternalValidator(BaseValidator):
@@ -27,6 +34,16 @@ class InternalValidator(BaseValidator):
     - Business logic validation
     """
     
+    # Bump when validation code changes in ways the rule data does not show,
+    # so results memoised under the old rule-set version are not reused
+    RULESET_REVISION = 3
+    
+    # Validation layers in reporting order
+    VALIDATION_LAYERS = ('required_fields', 'model_catalog', 'field_rules', 'business_rules')
+    
+    # Layers whose failures fail the product outside strict mode too
+    BLOCKING_LAYERS = frozenset({'required_fields', 'field_rules'})
+    
     def __init__(self, config: Optional[Dict[str, Any]] = None):
         """
         Initialize internal validator
@@ -45,11 +62,24 @@ class InternalValidator(BaseValidator):
         # Internal model database
         self.brp_models: List[str] = []
         self.model_patterns: List[str] = []
+        self.model_index = ModelIndex(self.config.get('model_fuzzy_candidates', 20))
+        
+        # Per-layer cost and failure telemetry, ordering the layers in strict mode;
+        # the order is fixed for each validate_products()/iter_validate() run
+        self.rule_telemetry = RuleTelemetry(self.VALIDATION_LAYERS, self.config.get('rule_reorder_interval', 100))
         
         # Field validation rules
         self.price_rules = {}
         self.text_rules = {}
         self.numeric_rules = {}
+        self.field_engine: Optional[FieldRuleEngine] = None
+        
+        # Model family and engine lookups for the business rules
+        self.business_index = BusinessRuleIndex()
+        
+        # Field rule results of the batch being validated, by product id();
+        # None for products without field issues
+        self._field_batch: Dict[int, Optional[ValidationResult]] = {}
         
         # Load validation data
         self.load_validation_rules()
@@ -66,6 +96,18 @@ class InternalValidator(BaseValidator):
             # Load business rules
             self._load_business_rules()
             
+            # Compile field rules for batch evaluation
+            self.field_engine = FieldRuleEngine(self.price_rules, self.text_rules, self.numeric_rules)
+            
+            # Index model families for business rule lookups
+            self.business_index.build(self.engine_compatibility, self.brand_model_compatibility)
+            
+            # Index models for exact, pattern and fuzzy lookups
+            self.model_index.build(self.brp_models, self.model_patterns)
+            
+            # Version of the loaded rules for the validation result memo
+            self.ruleset_version = self._ruleset_hash()
+            
             self.logger.info(
                 f"Validation rules loaded: {len(self.brp_models)} models, "
                 f"{len(self.validation_rules)} total rules"
@@ -78,6 +120,21 @@ class InternalValidator(BaseValidator):
                 original_exception=e
             )
     
+    def _ruleset_hash(self) -> str:
+        """Hash of everything a validation result depends on besides the product"""
+        ruleset = {
+            'validator': self.__class__.__name__,
+            'revision': self.RULESET_REVISION,
+            'settings': [self.strict_mode, self.model_validation_enabled, self.field_validation_enabled,
+                         self.business_rules_enabled, self.model_index.fuzzy_candidates],
+            'field_rules': [self.price_rules, self.text_rules, self.numeric_rules],
+            'business_rules': [self.engine_compatibility, self.brand_model_compatibility, self.market_rules],
+            'brp_models': [self.brp_models, self.model_patterns],
+            # Strict mode reports the errors of the first failing layer only
+            'layer_order': list(self.rule_telemetry.order) if self.strict_mode else None
+        }
+        return hashlib.sha256(json.dumps(ruleset, sort_keys=True).encode('utf-8')).hexdigest()[:16]
+    
     def _load_brp_models(self) -> None:
         """Load comprehensive BRP model database"""
         # Core SKI-DOO models (2018-2025)
@@ -294,37 +351,41 @@ class InternalValidator(BaseValidator):
             ValidationResult with detailed feedback
         """
         try:
-            result = ValidationResult(success=True)
-            
-            # Layer 1: Required fields validation
-            required_result = self.validate_required_fields(product)
-            result.errors.extend(required_result.errors)
-            result.warnings.extend(required_result.warnings)
-            if not required_result.success:
-                result.success = False
+            layer_results: Dict[str, ValidationResult] = {}
+            short_circuited: List[str] = []
+            failed = False
             
-            # Layer 2: Model validation (if enabled)
-            if self.model_validation_enabled:
-                model_result = self._validate_model_against_catalog(product)
-                result.errors.extend(model_result.errors)
-                result.warnings.extend(model_result.warnings)
-                if not model_result.success and self.strict_mode:
-                    result.success = False
-            
-            # Layer 3: Field validation (if enabled)
-            if self.field_validation_enabled:
-                field_result = self._validate_field_rules(product)
-                result.errors.extend(field_result.errors)
-                result.warnings.extend(field_result.warnings)
-                if not field_result.success:
-                    result.success = False
+            # In strict mode any layer error fails the product, so validation
+            # stops at the first failing layer and layers run in the order
+            # learnt from their cost and failure rates, fixed for the current
+            # run; otherwise all run
+            layers = self.rule_telemetry.order if self.strict_mode else self.VALIDATION_LAYERS
+            for layer in layers:
+                if not self._layer_enabled(layer):
+                    continue
+                if failed:
+                    self.rule_telemetry.skip(layer)
+                    short_circuited.append(layer)
+                    continue
+                
+                start = time.perf_counter()
+                layer_result = self._run_layer(layer, product, catalog_data)
+                layer_failed = not layer_result.success and (self.strict_mode or layer in self.BLOCKING_LAYERS)
+                self.rule_telemetry.record(layer, time.perf_counter() - start, layer_failed)
+                
+                layer_results[layer] = layer_result
+                failed = layer_failed and self.strict_mode
+            self.rule_telemetry.finish_product()
             
-            # Layer 4: Business rules (if enabled)
-            if self.business_rules_enabled:
-                business_result = self._validate_business_rules(product, catalog_data)
-                result.errors.extend(business_result.errors)
-                result.warnings.extend(business_result.warnings)
-                if not business_result.success and self.strict_mode:
+            # Errors and warnings are reported in layer order, whatever order the layers ran in
+            result = ValidationResult(success=True)
+            for layer in self.VALIDATION_LAYERS:
+                layer_result = layer_results.get(layer)
+                if layer_result is None:
+                    continue
+                result.errors.extend(layer_result.errors)
+                result.warnings.extend(layer_result.warnings)
+                if not layer_result.success and (self.strict_mode or layer in self.BLOCKING_LAYERS):
                     result.success = False
             
             # Calculate confidence score
@@ -341,6 +402,7 @@ class InternalValidator(BaseValidator):
                     'field_rules' if self.field_validation_enabled else None,
                     'business_rules' if self.business_rules_enabled else None
                 ],
+                'short_circuited': short_circuited,
                 'total_rules_checked': len(self.validation_rules),
                 'brp_models_available': len(self.brp_models)
             }
@@ -355,6 +417,68 @@ class InternalValidator(BaseValidator):
                 original_exception=e
             )
     
+    def _layer_enabled(self, layer: str) -> bool:
+        if layer == 'model_catalog':
+            return self.model_validation_enabled
+        if layer == 'field_rules':
+            return self.field_validation_enabled
+        if layer == 'business_rules':
+            return self.business_rules_enabled
+        return True
+    
+    def _run_layer(self, layer: str, product: ProductData, catalog_data: Optional[CatalogData]) -> ValidationResult:
+        if layer == 'required_fields':
+            return self.validate_required_fields(product)
+        if layer == 'model_catalog':
+            return self._validate_model_against_catalog(product)
+        if layer == 'field_rules':
+            return self._validate_field_rules(product)
+        return self._validate_business_rules(product, catalog_data)
+    
+    def export_rule_telemetry(self) -> Optional[Dict[str, Any]]:
+        return self.rule_telemetry.export()
+    
+    def merge_rule_telemetry(self, telemetry: Optional[Dict[str, Any]]) -> None:
+        self.rule_telemetry.merge(telemetry)
+    
+    def export_rule_order(self) -> Optional[List[str]]:
+        return list(self.rule_telemetry.order)
+    
+    def apply_rule_order(self, order: Optional[List[str]]) -> None:
+        if order is not None:
+            self.rule_telemetry.set_order(order)
+    
+    def _begin_run(self) -> None:
+        """Fix the layer order for the coming run, reordering from the telemetry when due"""
+        if self.rule_telemetry.begin_run() and self.ruleset_version is not None:
+            self.ruleset_version = self._ruleset_hash()
+    
+    def reset_stats(self) -> None:
+        """Reset validation statistics and rule telemetry"""
+        super().reset_stats()
+        self.rule_telemetry.reset()
+    
+    def _validate_sequential(self, products: List[ProductData], catalog_index: CatalogJoinIndex) -> List[ValidationResult]:
+        """Validate products one by one, with field rules evaluated for the whole batch up front"""
+        if not self.field_validation_enabled:
+            return super()._validate_sequential(products, catalog_index)
+        
+        try:
+            issues, unsupported = self.field_engine.validate(products)
+        except Exception as e:
+            self.logger.warning(f"Columnar field validation failed, checking products one by one: {e}")
+            return super()._validate_sequential(products, catalog_index)
+        
+        self._field_batch = {
+            id(product): issues.get(row)
+            for row, product in enumerate(products)
+            if row not in unsupported
+        }
+        try:
+            return super()._validate_sequential(products, catalog_index)
+        finally:
+            self._field_batch = {}
+    
     def _validate_model_against_catalog(self, product: ProductData) -> ValidationResult:
         """Validate product model against BRP catalog"""
         result = ValidationResult(success=True)
@@ -366,17 +490,16 @@ class InternalValidator(BaseValidator):
         model_text = f"BRP {product.brand} {product.malli}".strip()
         
         # Exact match check
-        if model_text in self.brp_models:
+        if model_text in self.model_index:
             result.metadata['model_match_type'] = 'exact'
             return result
         
         # Pattern matching check
-        model_upper = model_text.upper()
-        for pattern in self.model_patterns:
-            if re.match(pattern, model_upper):
-                result.metadata['model_match_type'] = 'pattern'
-                result.warnings.append(f"Model matched by pattern: {pattern}")
-                return result
+        pattern = self.model_index.match_pattern(model_text.upper())
+        if pattern:
+            result.metadata['model_match_type'] = 'pattern'
+            result.warnings.append(f"Model matched by pattern: {pattern}")
+            return result
         
         # Fuzzy matching check
         best_match = self._find_best_model_match(model_text)
@@ -395,24 +518,13 @@ class InternalValidator(BaseValidator):
     
     def _find_best_model_match(self, model_text: str) -> Optional[Dict[str, Any]]:
         """Find best fuzzy match for model name"""
-        from difflib import SequenceMatcher
-        
-        best_match = None
-        best_confidence = 0.0
-        
-        for brp_model in self.brp_models:
-            confidence = SequenceMatcher(None, model_text.upper(), brp_model.upper()).ratio()
-            if confidence > best_confidence:
-                best_confidence = confidence
-                best_match = {
-                    'model': brp_model,
-                    'confidence': confidence
-                }
-        
-        return best_match if best_confidence > 0.6 else None
+        return self.model_index.best_match(model_text, min_confidence=0.6)
     
     def _validate_field_rules(self, product: ProductData) -> ValidationResult:
         """Validate product against field rules"""
+        if id(product) in self._field_batch:
+            return self._field_batch[id(product)] or ValidationResult(success=True)
+        
         result = ValidationResult(success=True)
         
         # Validate price
@@ -526,33 +638,26 @@ class InternalValidator(BaseValidator):
         """Validate business logic rules"""
         result = ValidationResult(success=True)
         
+        malli_upper = product.malli.upper() if product.malli else ''
+        
         # Brand-model compatibility
         if product.brand and product.malli:
-            brand_models = self.brand_model_compatibility.get(product.brand, [])
-            model_family = None
-            
-            for family in brand_models:
-                if family.upper() in product.malli.upper():
-                    model_family = family
-                    break
-            
-            if not model_family:
+            if not self.business_index.brand_family(product.brand, malli_upper):
                 result.warnings.append(f"Unusual brand-model combination: {product.brand} {product.malli}")
         
         # Engine compatibility
         if product.moottori and product.malli:
-            engine_size = re.search(r'(\\d{3})', product.moottori)
+            engine_size = ENGINE_SIZE_PATTERN.search(product.moottori)
             if engine_size:
                 engine_num = engine_size.group(1)
+                engine_rule = self.business_index.engine_rule(malli_upper)
                 
-                for model_family, compatible_engines in self.engine_compatibility.items():
-                    if model_family.upper() in product.malli.upper():
-                        if engine_num not in compatible_engines:
-                            result.warnings.append(
-                                f"Unusual engine-model combination: {engine_num} in {model_family} "
-                                f"(typical: {compatible_engines})"
-                            )
-                        break
+                if engine_rule and engine_num not in engine_rule[1]:
+                    model_family, _ = engine_rule
+                    result.warnings.append(
+                        f"Unusual engine-model combination: {engine_num} in {model_family} "
+                        f"(typical: {self.engine_compatibility[model_family]})"
+                    )
         
         # Market-specific rules
         market = product.market.upper() if product.market else 'UNKNOWN'
@@ -601,6 +706,7 @@ class InternalValidator(BaseValidator):
             'brand_model_compatibility': len(self.brand_model_compatibility),
             'market_rules': len(self.market_rules),
             'strict_mode': self.strict_mode,
+            'rule_telemetry': self.rule_telemetry.summary(),
             'validation_layers': {
                 'model_validation': self.model_validation_enabled,
                 'field_validation': self.field_validation_enabled,
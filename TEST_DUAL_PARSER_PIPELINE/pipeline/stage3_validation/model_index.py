@@ -0,0 +1,124 @@
+"""
+BRP Model Index Implementation
+Three-layer lookup of product model names: exact set, combined pattern regex, trigram-blocked fuzzy match
+"""
+
+import re
+from difflib import SequenceMatcher
+from typing import Any, Dict, List, Optional, Set
+import logging
+
+from ...core.trigram_index import TrigramIndex
+
+logger = logging.getLogger(__name__)
+
+
+class ModelIndex:
+    """
+    Index over the BRP model list used by InternalValidator
+
+    Layers, in the order the validator consults them:
+    - exact: hash set of model names (case-sensitive, as listed)
+    - pattern: every model pattern compiled into one alternation, matched
+      case-sensitively against the uppercased name; the first listed
+      pattern that matches is reported
+    - fuzzy: SequenceMatcher ratio against the fuzzy_candidates models with
+      the highest trigram overlap. Model lists no larger than that, and names
+      sharing no trigram with any model, are scanned in full.
+    """
+
+    def __init__(self, fuzzy_candidates: int = 20):
+        """
+        Initialize model index
+
+        Args:
+            fuzzy_candidates: Models scored exactly per fuzzy lookup
+        """
+        self.fuzzy_candidates = max(1, fuzzy_candidates)
+        self._models: List[str] = []
+        self._upper_models: List[str] = []
+        self._exact: Set[str] = set()
+        self._patterns: List[str] = []
+        self._pattern_regex: Optional[re.Pattern] = None
+        self._trigrams = TrigramIndex()
+
+    def build(self, models: List[str], patterns: List[str]) -> 'ModelIndex':
+        """
+        Build the index
+
+        Args:
+            models: BRP model names, in priority order for fuzzy ties
+            patterns: Model regex patterns, in priority order
+
+        Returns:
+            The index itself
+        """
+        self._models = list(models)
+        self._upper_models = [model.upper() for model in self._models]
+        self._exact = set(self._models)
+
+        # Each pattern in its own named group; the alternation tries them in list order
+        self._patterns = list(patterns)
+        self._pattern_regex = re.compile(
+            '|'.join(f'(?P<p{number}>{pattern})' for number, pattern in enumerate(self._patterns))
+        ) if self._patterns else None
+
+        self._trigrams = TrigramIndex().build(self._upper_models)
+
+        logger.info(f"Built model index: {len(self._exact)} models, {len(self._patterns)} patterns")
+        return self
+
+    def __len__(self) -> int:
+        return len(self._models)
+
+    def __contains__(self, model_text: str) -> bool:
+        return model_text in self._exact
+
+    def match_pattern(self, model_upper: str) -> Optional[str]:
+        """
+        First model pattern matching at the start of the uppercased name
+
+        Args:
+            model_upper: Uppercased model name
+
+        Returns:
+            The matching pattern, or None
+        """
+        if self._pattern_regex is None:
+            return None
+        match = self._pattern_regex.match(model_upper)
+        return self._patterns[int(match.lastgroup[1:])] if match else None
+
+    def best_match(self, model_text: str, min_confidence: float = 0.6) -> Optional[Dict[str, Any]]:
+        """
+        Closest BRP model by SequenceMatcher ratio of the uppercased names
+
+        Args:
+            model_text: Model name to look up
+            min_confidence: Ratio the best model has to exceed
+
+        Returns:
+            {'model', 'confidence'} of the first model with the best ratio,
+            or None when no ratio exceeds min_confidence
+        """
+        query = model_text.upper()
+        positions = range(len(self._models))
+        if len(self._models) > self.fuzzy_candidates:
+            positions = self._trigrams.candidates(query, self.fuzzy_candidates) or positions
+
+        matcher = SequenceMatcher(None, query)
+        best_position = None
+        best_confidence = 0.0
+        for position in positions:
+            matcher.set_seq2(self._upper_models[position])
+            # quick ratios are upper bounds of ratio(), so they only skip losing models
+            if matcher.real_quick_ratio() <= best_confidence or matcher.quick_ratio() <= best_confidence:
+                continue
+            confidence = matcher.ratio()
+            if confidence > best_confidence:
+                best_confidence = confidence
+                best_position = position
+
+        if best_position is None or best_confidence <= min_confidence:
+            return None
+        return {'model': self._models[best_position], 'confidence': best_confidence}
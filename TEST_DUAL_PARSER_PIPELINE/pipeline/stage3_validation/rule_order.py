@@ -0,0 +1,146 @@
+"""
+Adaptive Rule Ordering
+Per-rule cost and failure telemetry, used to run cheap, high-rejection validation rules first
+"""
+
+from dataclasses import dataclass
+from typing import Any, Dict, List, Optional, Sequence
+
+
+@dataclass
+class RuleStats:
+    """Telemetry of one validation rule"""
+    calls: int = 0
+    failures: int = 0
+    skipped: int = 0
+    seconds: float = 0.0
+
+    @property
+    def failure_rate(self) -> float:
+        return self.failures / self.calls if self.calls else 0.0
+
+    @property
+    def mean_seconds(self) -> float:
+        return self.seconds / self.calls if self.calls else 0.0
+
+    def rank(self) -> float:
+        """
+        Expected cost per rejection
+
+        Running rules by ascending cost / failure probability minimises the
+        expected cost of a short-circuiting rule chain. The failure rate is
+        smoothed so rules that have not failed yet are ranked by cost behind
+        rules of similar cost that have, and rules never evaluated (always
+        short-circuited so far) come last.
+        """
+        if not self.calls:
+            return float('inf')
+        return self.mean_seconds * (self.calls + 2) / (self.failures + 1)
+
+
+class RuleTelemetry:
+    """
+    Telemetry and evaluation order for a fixed set of validation rules
+
+    The order only changes in begin_run(), which recomputes it by
+    RuleStats.rank (ties kept in the original order) once at least
+    reorder_interval products have been recorded since the last reordering.
+    Recording never changes the order, so it stays fixed for a whole run
+    however the run is split across processes. A reorder_interval of 0
+    keeps the original order.
+    """
+
+    def __init__(self, rules: Sequence[str], reorder_interval: int = 100):
+        """
+        Args:
+            rules: Rule names in their original order
+            reorder_interval: Products recorded before the next run reorders, 0 to disable
+        """
+        self.rules = tuple(rules)
+        self.reorder_interval = reorder_interval
+        self.order = self.rules
+        self.stats: Dict[str, RuleStats] = {rule: RuleStats() for rule in self.rules}
+        self.products = 0
+        self.products_since_reorder = 0
+
+    def record(self, rule: str, seconds: float, failed: bool) -> None:
+        """Record one evaluation of a rule"""
+        stats = self.stats[rule]
+        stats.calls += 1
+        stats.seconds += seconds
+        if failed:
+            stats.failures += 1
+
+    def skip(self, rule: str) -> None:
+        """Record a rule not evaluated because the product had already failed"""
+        self.stats[rule].skipped += 1
+
+    def finish_product(self) -> None:
+        """Count a validated product"""
+        self.products += 1
+        self.products_since_reorder += 1
+
+    def begin_run(self) -> bool:
+        """Reorder the rules if due, before a run; returns whether the order changed"""
+        if not self.reorder_interval or self.products_since_reorder < self.reorder_interval:
+            return False
+        previous = self.order
+        self.reorder()
+        return self.order != previous
+
+    def reorder(self) -> List[str]:
+        """Recompute the evaluation order from the telemetry so far"""
+        self.order = tuple(sorted(self.rules, key=lambda rule: self.stats[rule].rank()))
+        self.products_since_reorder = 0
+        return list(self.order)
+
+    def set_order(self, order: Sequence[str]) -> None:
+        """Use a given order, e.g. the one of the run a worker process takes part in"""
+        if sorted(order) != sorted(self.rules):
+            raise ValueError(f"Rule order {list(order)} does not list the rules {list(self.rules)}")
+        self.order = tuple(order)
+
+    def reset(self) -> None:
+        """Clear the telemetry, keeping the current order"""
+        self.stats = {rule: RuleStats() for rule in self.rules}
+        self.products = 0
+        self.products_since_reorder = 0
+
+    def export(self) -> Dict[str, Any]:
+        """Raw counters, for merging telemetry gathered in worker processes"""
+        return {
+            'products': self.products,
+            'stats': {rule: [stats.calls, stats.failures, stats.skipped, stats.seconds]
+                      for rule, stats in self.stats.items()}
+        }
+
+    def merge(self, exported: Optional[Dict[str, Any]]) -> None:
+        """Add counters from export(); the order changes at the next begin_run()"""
+        if not exported:
+            return
+        for rule, (calls, failures, skipped, seconds) in exported['stats'].items():
+            stats = self.stats[rule]
+            stats.calls += calls
+            stats.failures += failures
+            stats.skipped += skipped
+            stats.seconds += seconds
+        self.products += exported['products']
+        self.products_since_reorder += exported['products']
+
+    def summary(self) -> Dict[str, Any]:
+        """Current order and per-rule timings and failure rates"""
+        return {
+            'order': list(self.order),
+            'products': self.products,
+            'rules': {
+                rule: {
+                    'calls': stats.calls,
+                    'failures': stats.failures,
+                    'failure_rate': round(stats.failure_rate, 4),
+                    'skipped': stats.skipped,
+                    'total_ms': round(stats.seconds * 1000, 3),
+                    'mean_ms': round(stats.mean_seconds * 1000, 4)
+                }
+                for rule, stats in self.stats.items()
+            }
+        }
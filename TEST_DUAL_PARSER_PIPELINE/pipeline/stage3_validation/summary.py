@@ -0,0 +1,105 @@
+"""
+Running Validation Summary
+Constant-memory accumulation of validation statistics and most common issues
+"""
+
+import heapq
+from typing import Any, Dict, Hashable, Iterable, List, Tuple
+
+from ...core import ValidationResult
+
+
+class TopKCounter:
+    """
+    Occurrence counter holding at most 2 * capacity keys
+
+    When the table is full, it is pruned to the capacity most frequent
+    keys. Counts stay exact until a key is pruned; a pruned key that comes
+    back is counted again from 1, so only keys rarer than the pruned ones
+    are ever under-counted. most_common() is exact while there are at most
+    2 * capacity distinct keys.
+    """
+
+    def __init__(self, capacity: int = 1000):
+        self.capacity = capacity
+        self.counts: Dict[Hashable, int] = {}
+        self.pruned_keys = 0
+
+    def add(self, key: Hashable, count: int = 1) -> None:
+        if key not in self.counts and len(self.counts) >= 2 * self.capacity:
+            self._prune()
+        self.counts[key] = self.counts.get(key, 0) + count
+
+    def update(self, keys: Iterable[Hashable]) -> None:
+        for key in keys:
+            self.add(key)
+
+    def _prune(self) -> None:
+        kept = heapq.nlargest(self.capacity, self.counts.items(), key=lambda item: item[1])
+        self.pruned_keys += len(self.counts) - len(kept)
+        self.counts = dict(kept)
+
+    def most_common(self, n: int) -> List[Tuple[Hashable, int]]:
+        """n most frequent keys, ties in first-counted order"""
+        return heapq.nlargest(n, self.counts.items(), key=lambda item: item[1])
+
+    def __len__(self) -> int:
+        return len(self.counts)
+
+
+class ValidationSummary:
+    """
+    Summary statistics accumulated one ValidationResult at a time
+
+    Keeps totals, a confidence sum and bounded counters of error and
+    warning messages, so summarising a validation run does not need its
+    results kept in memory. to_dict() gives the same fields as
+    BaseValidator.get_validation_summary().
+    """
+
+    def __init__(self, top_n: int = 5, capacity: int = 1000):
+        """
+        Args:
+            top_n: Number of common errors and warnings reported
+            capacity: Distinct messages tracked exactly per counter (see TopKCounter)
+        """
+        self.top_n = top_n
+        self.total = 0
+        self.successful = 0
+        self.with_warnings = 0
+        self.with_errors = 0
+        self.confidence_sum = 0.0
+        self.errors = TopKCounter(capacity)
+        self.warnings = TopKCounter(capacity)
+
+    def add(self, result: ValidationResult) -> None:
+        """Count one validation result"""
+        self.total += 1
+        if result.success:
+            self.successful += 1
+        if result.warnings:
+            self.with_warnings += 1
+            self.warnings.update(result.warnings)
+        if result.errors:
+            self.with_errors += 1
+            self.errors.update(result.errors)
+        self.confidence_sum += result.confidence
+
+    def common_issues(self, counter: TopKCounter) -> List[Dict[str, Any]]:
+        return [{'issue': issue, 'count': count} for issue, count in counter.most_common(self.top_n)]
+
+    def to_dict(self) -> Dict[str, Any]:
+        """Summary statistics of the results added so far; empty before the first one"""
+        if not self.total:
+            return {}
+
+        return {
+            'total_validated': self.total,
+            'successful': self.successful,
+            'success_rate': (self.successful / self.total) * 100,
+            'with_warnings': self.with_warnings,
+            'with_errors': self.with_errors,
+            'average_confidence': self.confidence_sum / self.total,
+            'common_errors': self.common_issues(self.errors),
+            'common_warnings': self.common_issues(self.warnings)
+        }
@@ -10,6 +10,7 @@ import logging
 from datetime import datetime
 
 from ...core import ProductData, CatalogData, AvitoXMLData, ValidationResult, PipelineStats, PipelineStage, GenerationError
+from ...core.catalog_join import CatalogJoinIndex
 
 logger = logging.getLogger(__name__)
 
@@ -92,21 +93,13 @@ class BaseGenerator(ABC):
             self.stats.start_time = datetime.now()
             xml_strings = []
             
-            # Create catalog lookup if provided
-            catalog_lookup = {}
-            if catalog_data:
-                for catalog_entry in catalog_data:
-                    catalog_lookup[catalog_entry.model_family] = catalog_entry
+            # Index catalog model families for product lookups
+            catalog_index = CatalogJoinIndex().build(catalog_data or [])
             
             for product in products:
                 try:
                     # Find matching catalog data if available
-                    product_catalog = None
-                    if catalog_lookup and product.malli:
-                        for model_family, catalog_entry in catalog_lookup.items():
-                            if catalog_entry.matches_product(product):
-                                product_catalog = catalog_entry
-                                break
+                    product_catalog = catalog_index.lookup(product)
                     
                     # Generate XML data structure
                     xml_data = self.generate_xml_data(product, product_catalog)
@@ -15,6 +15,7 @@ from config import get_config
 from pipeline.stage1_extraction import PDFExtractor, LLMExtractor
 from pipeline.stage2_matching import BERTMatcher
 from pipeline.stage3_validation import InternalValidator
+from pipeline.stage3_validation.summary import ValidationSummary
 from pipeline.stage4_generation import AvitoXMLGenerator
 from pipeline.stage5_upload import FTPUploader, ProcessingMonitor
 
@@ -78,8 +79,10 @@ class PipelineOrchestrator:
         
         # Initialize pipeline components
         self.extractor = PDFExtractor(config=self.config.extraction.__dict__)
-        self.matcher = BERTMatcher(config=self.config.matching.__dict__)
-        self.validator = InternalValidator(config=self.config.validation.__dict__)
+        self.matcher = BERTMatcher(config={**self.config.matching.__dict__, 'worker_count': self.config.worker_count})
+        self.validator = InternalValidator(config={**self.config.validation.__dict__, 'worker_count': self.config.worker_count})
+        if self.config.validation.memoize_results:
+            self.validator.result_memo = self.database
         self.generator = AvitoXMLGenerator()
         self.uploader = FTPUploader()
         self.monitor = ProcessingMonitor()
@@ -221,6 +224,11 @@ class PipelineOrchestrator:
                 logger.info(
                     f"Stage 2 completed: {result.matching_stats.successful} successful matches"
                 )
+                path_fractions = result.matching_stats.metadata.get('match_path_fractions', {})
+                if path_fractions:
+                    logger.info("Stage 2 match paths: " + ", ".join(
+                        f"{path} {fraction:.1%}" for path, fraction in path_fractions.items()
+                    ))
             else:
                 result.warnings.append("No catalog data available for matching")
             
@@ -236,17 +244,16 @@ class PipelineOrchestrator:
         try:
             logger.info("Stage 3: Starting validation")
             
-            # Validate all products
-            validation_results = self.validator.validate_products(result.extracted_products)
-            
-            # Filter validated products
+            # Validate products as a stream, keeping only those that pass
+            summary = ValidationSummary()
             result.validated_products = [
-                product for product, validation in zip(result.extracted_products, validation_results)
+                product for product, validation in self.validator.iter_validate(result.extracted_products, summary=summary)
                 if validation.success
             ]
             
             result.products_validated = len(result.validated_products)
             result.validation_stats = self.validator.get_stats()
+            result.validation_stats.metadata['summary'] = summary.to_dict()
             
             if not result.validated_products:
                 result.errors.append("No products passed validation")
@@ -408,6 +415,11 @@ class PipelineOrchestrator:
         for stage_name, stats in stages:
             if stats:
                 print(f"  {stage_name:12}: {stats.successful}/{stats.total_processed} successful ({stats.success_rate:.1f}%)")
+                path_fractions = stats.metadata.get('match_path_fractions', {})
+                if path_fractions:
+                    print(f"  {'':12}  paths: " + ", ".join(
+                        f"{path} {fraction:.1%}" for path, fraction in path_fractions.items()
+                    ))
             else:
                 print(f"  {stage_name:12}: Not executed")
         
@@ -0,0 +1,154 @@
+#!/usr/bin/env python3
+"""
+Avito Feed Validation Benchmark
+===============================
+
+Validates a synthetic feed of Ski-Doo/Lynx snowmobile ads with
+AvitoInternalValidator and compares:
+
+    per_ad - validate_xml_data() for every ad (console output discarded)
+    feed   - one validate_feed() call over the whole feed
+
+A share of the ads carries typical mistakes (price with currency, bad Id,
+unknown model, short description, ...) so the error paths are exercised.
+Reports ads/sec for both paths and the per-field error histogram, and
+checks that both paths find the same number of invalid ads.
+
+Usage:
+    python scripts/benchmark_avito_validation.py
+    python scripts/benchmark_avito_validation.py --ads 50000 --invalid-rate 0.2 --output benchmark-avito.json
+"""
+
+import argparse
+import contextlib
+import io
+import json
+import platform
+import random
+import sys
+import time
+from pathlib import Path
+from typing import Any, Dict, List
+
+PROJECT_ROOT = Path(__file__).parent.parent
+sys.path.insert(0, str(PROJECT_ROOT))
+
+from avito_internal_validator import AvitoInternalValidator, ModelLookup  # noqa: E402
+
+FAMILIES = {
+    'Ski-Doo': ['MXZ X', 'MXZ TNT', 'Summit X', 'Summit SP', 'Renegade Adrenaline', 'Expedition SE', 'Backcountry X-RS'],
+    'Lynx': ['Rave RE', 'Boondocker DS', 'Commander RE', '69 Ranger', 'Xterrain RE']
+}
+ENGINES = ['600R E-TEC', '850 E-TEC', '850 E-TEC Turbo R', '900 ACE', '600 EFI']
+TYPES = ["Утилитарный", "Спортивный или горный", "Туристический"]
+
+
+def synthetic_models() -> List[str]:
+    return [f"{brand} {family} {engine}" for brand, families in FAMILIES.items()
+            for family in families for engine in ENGINES]
+
+
+def synthetic_ad(rng: random.Random, position: int, models: List[str], invalid: bool) -> Dict[str, str]:
+    """One ad, valid unless invalid is set, in which case one or two fields are broken"""
+    model = rng.choice(models)
+    year = str(rng.choice([2023, 2024, 2025]))
+    ad = {
+        'Id': f"{model.split()[0].upper()}-{position:06d}",
+        'Title': f"Снегоход {model} {year}",
+        'Model': model,
+        'Price': str(rng.randrange(900000, 3500000, 10000)),
+        'Year': year,
+        'Power': str(rng.choice([85, 130, 165, 180])),
+        'EngineCapacity': str(rng.choice([599, 849, 899])),
+        'PersonCapacity': str(rng.choice([1, 2])),
+        'TrackWidth': str(rng.choice([381, 406, 508])),
+        'Description': f"Новый снегоход {model} {year} года. Официальная гарантия BRP, доставка по России.",
+        'Images': f"https://example.com/images/{position}.jpg",
+        'Address': 'Санкт-Петербург',
+        'Category': 'Мотоциклы и мототехника',
+        'VehicleType': 'Снегоходы',
+        'Make': 'BRP',
+        'EngineType': 'Бензин',
+        'Condition': 'Новое',
+        'Kilometrage': '0',
+        'Type': rng.choice(TYPES),
+        'Availability': rng.choice(["В наличии", "Под заказ"]),
+        'ContactPhone': '+7 812 000-00-00'
+    }
+
+    if invalid:
+        for field in rng.sample(['Price', 'Id', 'Model', 'Description', 'Year', 'Images', 'Power', 'Type'], rng.randint(1, 2)):
+            ad[field] = {
+                'Price': f"{ad['Price'][:-3]} {ad['Price'][-3:]} руб",
+                'Id': ad['Id'].replace('-', ' '),
+                'Model': f"{model} Limited",
+                'Description': "Снегоход",
+                'Year': "25",
+                'Images': ad['Images'].replace('https://', 'ftp://'),
+                'Power': f"{ad['Power']} hp",
+                'Type': "Гоночный"
+            }[field]
+    return ad
+
+
+def run_benchmark(args) -> Dict[str, Any]:
+    rng = random.Random(args.seed)
+    validator = AvitoInternalValidator()
+    if not validator.brp_models:
+        # Official model list not available: validate against the synthetic one
+        validator.brp_models = synthetic_models()
+        validator.model_lookup = ModelLookup(validator.brp_models)
+
+    models = validator.brp_models
+    ads = [synthetic_ad(rng, position, models, rng.random() < args.invalid_rate) for position in range(args.ads)]
+
+    start = time.perf_counter()
+    with contextlib.redirect_stdout(io.StringIO()):
+        per_ad_invalid = sum(not validator.validate_xml_data(ad).is_valid for ad in ads)
+    per_ad_seconds = time.perf_counter() - start
+
+    start = time.perf_counter()
+    feed_result = validator.validate_feed(ads)
+    feed_seconds = time.perf_counter() - start
+
+    invalid = feed_result.total_items - feed_result.valid_items
+    return {
+        'python': platform.python_version(),
+        'ads': args.ads,
+        'invalid_rate': args.invalid_rate,
+        'seed': args.seed,
+        'per_ad': {'seconds': round(per_ad_seconds, 3), 'ads_per_sec': round(args.ads / per_ad_seconds)},
+        'feed': {'seconds': round(feed_seconds, 3), 'ads_per_sec': round(args.ads / feed_seconds)},
+        'speedup': round(per_ad_seconds / feed_seconds, 1),
+        'invalid_ads': invalid,
+        'results_agree': invalid == per_ad_invalid,
+        'error_histogram': feed_result.error_histogram(),
+        'warning_histogram': feed_result.warning_histogram()
+    }
+
+
+def main():
+    """Run the feed validation benchmark"""
+    parser = argparse.ArgumentParser(description="Benchmark AvitoInternalValidator on a synthetic ad feed")
+    parser.add_argument("--ads", type=int, default=10000, help="Number of ads in the feed")
+    parser.add_argument("--invalid-rate", type=float, default=0.1, help="Share of ads with broken fields")
+    parser.add_argument("--seed", type=int, default=0, help="Feed random seed")
+    parser.add_argument("--output", type=Path, help="Optional JSON file for the results")
+
+    args = parser.parse_args()
+    results = run_benchmark(args)
+
+    print(f"Feed: {results['ads']} ads, {results['invalid_ads']} invalid (seed {results['seed']})")
+    for path in ('per_ad', 'feed'):
+        print(f"  {path:<6}: {results[path]['ads_per_sec']:>9} ads/sec  {results[path]['seconds']}s")
+    print(f"  speedup {results['speedup']}x, results agree: {results['results_agree']}")
+    print("Errors per field:")
+    for field, count in results['error_histogram'].items():
+        print(f"  {field:<15} {count}")
+
+    if args.output:
+        args.output.write_text(json.dumps(results, indent=2, ensure_ascii=False), encoding='utf-8')
+
+
+if __name__ == "__main__":
+    main()
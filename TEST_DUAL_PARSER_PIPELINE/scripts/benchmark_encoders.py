@@ -0,0 +1,142 @@
+#!/usr/bin/env python3
+"""
+Encoder Backend Benchmark
+=========================
+
+Encodes the price list and specbook texts from the pipeline database with
+each encoder backend and compares them against the float32 PyTorch model.
+For every backend it reports encoding throughput, resident memory after
+loading, mean cosine similarity to the baseline embeddings and how often
+the top-1 catalog match agrees with the baseline. It also reports top-1
+agreement when the baseline catalog vectors are stored as float16 or int8.
+
+Requires sentence-transformers (and onnxruntime/optimum for the onnx backend).
+
+Usage:
+    python scripts/benchmark_encoders.py
+    python scripts/benchmark_encoders.py --backends torch torch_int8 onnx --onnx-model-file onnx/model_qint8_avx512.onnx
+"""
+
+import argparse
+import json
+import os
+import sqlite3
+import sys
+import time
+from pathlib import Path
+from typing import Any, Dict, List, Tuple
+
+import numpy as np
+import psutil
+
+PROJECT_ROOT = Path(__file__).parent.parent
+sys.path.insert(0, str(PROJECT_ROOT / "pipeline" / "stage2_matching"))
+
+from encoders import ENCODER_BACKENDS, dequantize_embeddings, load_encoder, quantize_embeddings  # noqa: E402
+
+
+def load_texts(db_path: Path) -> Tuple[List[str], List[str]]:
+    """Product texts from raw_pricelist_data and catalog texts from raw_specbook_data_target_schema"""
+    with sqlite3.connect(db_path) as conn:
+        products = [
+            ' '.join(str(value) for value in row if value)
+            for row in conn.execute("SELECT brand, malli, paketti, moottori, model_year FROM raw_pricelist_data")
+        ]
+        catalog = [
+            ' '.join(str(value) for value in row if value)
+            for row in conn.execute("SELECT brand, model, configuration FROM raw_specbook_data_target_schema")
+        ]
+    return products, catalog
+
+
+def normalized(embeddings) -> np.ndarray:
+    embeddings = np.asarray(embeddings, dtype=np.float32)
+    norms = np.linalg.norm(embeddings, axis=1, keepdims=True)
+    return embeddings / np.where(norms > 0, norms, 1.0)
+
+
+def encode(encoder, texts: List[str], batch_size: int, repeats: int) -> Tuple[np.ndarray, float]:
+    """Embeddings of texts and the best texts/sec over repeats"""
+    best_seconds = float('inf')
+    for _ in range(repeats):
+        start = time.perf_counter()
+        embeddings = encoder.encode(texts, batch_size=batch_size)
+        best_seconds = min(best_seconds, time.perf_counter() - start)
+    return normalized(embeddings), len(texts) / best_seconds
+
+
+def run_benchmark(args) -> Dict[str, Any]:
+    products, catalog = load_texts(args.db)
+    process = psutil.Process(os.getpid())
+
+    results = {'products': len(products), 'catalog': len(catalog), 'backends': [], 'storage': []}
+    baseline = None
+
+    for backend in ['torch'] + [backend for backend in args.backends if backend != 'torch']:
+        rss_before = process.memory_info().rss
+        try:
+            encoder = load_encoder(args.model, backend, device='cpu', onnx_model_file=args.onnx_model_file)
+        except Exception as e:
+            print(f"Skipping {backend}: {e}")
+            continue
+        rss_after = process.memory_info().rss
+
+        product_embeddings, texts_per_sec = encode(encoder, products, args.batch_size, args.repeats)
+        catalog_embeddings, _ = encode(encoder, catalog, args.batch_size, 1)
+        top1 = np.argmax(product_embeddings @ catalog_embeddings.T, axis=1)
+
+        if baseline is None:
+            baseline = (product_embeddings, catalog_embeddings, top1)
+
+        results['backends'].append({
+            'backend': backend,
+            'texts_per_sec': round(texts_per_sec, 1),
+            'load_rss_mb': round((rss_after - rss_before) / 2 ** 20, 1),
+            'mean_cosine_to_baseline': round(float(np.mean(np.sum(product_embeddings * baseline[0], axis=1))), 4),
+            'top1_agreement': round(float(np.mean(top1 == baseline[2])), 4)
+        })
+        del encoder
+
+    if baseline is not None:
+        product_embeddings, catalog_embeddings, top1 = baseline
+        for dtype in ('float16', 'int8'):
+            stored, scales = quantize_embeddings(catalog_embeddings, dtype)
+            quantized_top1 = np.argmax(product_embeddings @ dequantize_embeddings(stored, scales).T, axis=1)
+            results['storage'].append({
+                'dtype': dtype,
+                'bytes_per_vector': stored.nbytes // len(stored) + (4 if scales is not None else 0),
+                'top1_agreement': round(float(np.mean(quantized_top1 == top1)), 4)
+            })
+
+    return results
+
+
+def main():
+    """Run the encoder backend benchmark"""
+    parser = argparse.ArgumentParser(description="Benchmark sentence encoder backends against float32 PyTorch")
+    parser.add_argument("--db", type=Path, default=PROJECT_ROOT / "dual_db.db", help="Pipeline SQLite database")
+    parser.add_argument("--model", default="all-MiniLM-L6-v2", help="sentence-transformers model name")
+    parser.add_argument("--backends", nargs="+", default=list(ENCODER_BACKENDS), choices=ENCODER_BACKENDS,
+                        help="Backends to compare with the torch baseline")
+    parser.add_argument("--onnx-model-file", help="Pre-exported ONNX file inside the model repository")
+    parser.add_argument("--batch-size", type=int, default=32, help="Encoding batch size")
+    parser.add_argument("--repeats", type=int, default=3, help="Timed encoding passes per backend")
+    parser.add_argument("--output", type=Path, help="Optional JSON file for the results")
+
+    args = parser.parse_args()
+    results = run_benchmark(args)
+
+    print(f"Texts: {results['products']} products, {results['catalog']} catalog entries")
+    for run in results['backends']:
+        print(f"  {run['backend']:<11}: {run['texts_per_sec']:>8} texts/sec  +{run['load_rss_mb']} MB RSS  "
+              f"cosine {run['mean_cosine_to_baseline']:.4f}  top-1 agreement {run['top1_agreement']:.1%}")
+    for run in results['storage']:
+        print(f"  {run['dtype']:<7} catalog vectors: {run['bytes_per_vector']} bytes/vector  "
+              f"top-1 agreement {run['top1_agreement']:.1%}")
+
+    if args.output:
+        args.output.write_text(json.dumps(results, indent=2), encoding='utf-8')
+
+
+if __name__ == "__main__":
+    main()
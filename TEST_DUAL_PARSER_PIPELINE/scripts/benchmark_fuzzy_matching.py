@@ -0,0 +1,130 @@
+#!/usr/bin/env python3
+"""
+Fuzzy Matching Benchmark
+========================
+
+Compares the trigram-blocked fuzzy fallback against a full SequenceMatcher
+scan on a synthetic catalog of snowmobile search texts. For each candidate
+count it reports queries/sec, how often the blocked search returns the same
+best score as the full scan, and the largest score difference.
+
+Usage:
+    python scripts/benchmark_fuzzy_matching.py
+    python scripts/benchmark_fuzzy_matching.py --catalog-size 10000 --queries 200 --candidates 20 50 100
+"""
+
+import argparse
+import json
+import random
+import sys
+import time
+from difflib import SequenceMatcher
+from pathlib import Path
+from typing import Any, Dict, List, Tuple
+
+PROJECT_ROOT = Path(__file__).parent.parent
+sys.path.insert(0, str(PROJECT_ROOT / "core"))
+
+from trigram_index import TrigramIndex  # noqa: E402
+
+FAMILIES = ['SUMMIT X', 'EXPEDITION SE', 'RENEGADE', 'MXZ XRS', 'BACKCOUNTRY', 'FREERIDE',
+            'RAVE RE', 'COMMANDER', 'ADVENTURE', 'XTERRAIN']
+PACKAGES = ['EXPERT', 'COMPETITION', 'SPORT', 'ADRENALINE', 'XTREME', 'NEO PLUS', '']
+ENGINES = ['850 ETEC', '850 ETEC TURBO R', '600R ETEC', '900 ACE TURBO', '600 EFI', '']
+BRANDS = ['SKI-DOO', 'LYNX']
+
+
+def synthetic_texts(catalog_size: int, query_count: int, seed: int) -> Tuple[List[str], List[str]]:
+    """Catalog search texts ("FAMILY features ENGINE BRAND") and product texts ("BRAND FAMILY PACKAGE ENGINE YEAR")"""
+    rng = random.Random(seed)
+    catalog = [
+        ' '.join(part for part in (
+            f"{rng.choice(FAMILIES)} {rng.choice(PACKAGES)} {index % 97}".strip(),
+            f"{rng.choice(PACKAGES)} feature LED",
+            rng.choice(ENGINES),
+            rng.choice(BRANDS)
+        ) if part)
+        for index in range(catalog_size)
+    ]
+    queries = [
+        ' '.join(part for part in (
+            rng.choice(BRANDS), rng.choice(FAMILIES), rng.choice(PACKAGES), rng.choice(ENGINES),
+            str(rng.choice([2024, 2025, 2026]))
+        ) if part)
+        for _ in range(query_count)
+    ]
+    return catalog, queries
+
+
+def best_match(query: str, catalog: List[str], positions) -> Tuple[int, float]:
+    """First catalog position with the highest SequenceMatcher ratio"""
+    best_position, best_score = -1, 0.0
+    for position in positions:
+        score = SequenceMatcher(None, query.lower(), catalog[position].lower()).ratio()
+        if score > best_score:
+            best_position, best_score = position, score
+    return best_position, best_score
+
+
+def run_benchmark(args) -> Dict[str, Any]:
+    catalog, queries = synthetic_texts(args.catalog_size, args.queries, args.seed)
+
+    start = time.perf_counter()
+    full = [best_match(query, catalog, range(len(catalog))) for query in queries]
+    full_seconds = time.perf_counter() - start
+
+    start = time.perf_counter()
+    index = TrigramIndex().build(catalog)
+    build_seconds = time.perf_counter() - start
+
+    results = {
+        'catalog_size': args.catalog_size,
+        'queries': args.queries,
+        'full_scan': {'queries_per_sec': round(args.queries / full_seconds, 1)},
+        'index_build_seconds': round(build_seconds, 3),
+        'blocked': []
+    }
+
+    for top_n in args.candidates:
+        start = time.perf_counter()
+        blocked = [best_match(query, catalog, index.candidates(query, top_n)) for query in queries]
+        seconds = time.perf_counter() - start
+
+        deltas = [abs(exact[1] - approx[1]) for exact, approx in zip(full, blocked)]
+        results['blocked'].append({
+            'candidates': top_n,
+            'queries_per_sec': round(args.queries / seconds, 1),
+            'speedup': round(full_seconds / seconds, 1),
+            'same_best_score': round(sum(delta < 1e-12 for delta in deltas) / len(deltas), 4),
+            'max_score_delta': round(max(deltas), 4)
+        })
+
+    return results
+
+
+def main():
+    """Run the fuzzy matching benchmark"""
+    parser = argparse.ArgumentParser(description="Benchmark trigram-blocked fuzzy matching against a full scan")
+    parser.add_argument("--catalog-size", type=int, default=10000, help="Number of catalog texts")
+    parser.add_argument("--queries", type=int, default=50, help="Number of product texts")
+    parser.add_argument("--candidates", type=int, nargs="+", default=[20, 50, 100], help="Candidate counts to test")
+    parser.add_argument("--seed", type=int, default=0, help="Random seed")
+    parser.add_argument("--output", type=Path, help="Optional JSON file for the results")
+
+    args = parser.parse_args()
+    results = run_benchmark(args)
+
+    print(f"Catalog: {results['catalog_size']} texts, {results['queries']} queries "
+          f"(index built in {results['index_build_seconds']}s)")
+    print(f"  full scan        : {results['full_scan']['queries_per_sec']:>8} queries/sec")
+    for run in results['blocked']:
+        print(f"  top {run['candidates']:<4} blocked : {run['queries_per_sec']:>8} queries/sec  "
+              f"x{run['speedup']:<6} same best score {run['same_best_score']:.1%}  "
+              f"max delta {run['max_score_delta']:.4f}")
+
+    if args.output:
+        args.output.write_text(json.dumps(results, indent=2), encoding='utf-8')
+
+
+if __name__ == "__main__":
+    main()
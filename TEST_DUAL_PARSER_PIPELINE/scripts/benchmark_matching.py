@@ -0,0 +1,187 @@
+#!/usr/bin/env python3
+"""
+Stage 2 Matching Benchmark
+==========================
+
+Runs BERTMatcher over a synthetic Ski-Doo/Lynx workload (see
+tests/fixtures/synthetic_catalog.py) and measures each matching path:
+
+    exact  - exact-key pre-stage, on the products it resolves
+    fuzzy  - SequenceMatcher fallback used without BERT libraries
+    bert   - precomputed catalog matrix scoring (needs sentence-transformers)
+
+For every path it reports catalog load time, products/sec for one
+match_products() batch, p50/p95 latency of single-product calls and peak
+RSS. Each path runs in a fresh process so peak RSS is not shared between
+paths. Results are written as JSON for diffing between commits.
+
+Usage:
+    python scripts/benchmark_matching.py --output benchmark-matching.json
+    python scripts/benchmark_matching.py --catalog-size 5000 --products 2000 --paths exact fuzzy
+    python scripts/benchmark_matching.py --baseline benchmark-matching.json
+"""
+
+import argparse
+import json
+import multiprocessing
+import platform
+import statistics
+import subprocess
+import sys
+import time
+from pathlib import Path
+from typing import Any, Dict, List, Optional
+
+import psutil
+
+PROJECT_ROOT = Path(__file__).parent.parent
+sys.path.insert(0, str(PROJECT_ROOT))
+
+PATHS = ('exact', 'fuzzy', 'bert')
+
+
+def peak_rss_mb() -> float:
+    """Peak resident set size of this process in MB"""
+    try:
+        import resource
+        peak = resource.getrusage(resource.RUSAGE_SELF).ru_maxrss
+        return round(peak / (2 ** 20 if sys.platform == 'darwin' else 2 ** 10), 1)
+    except ImportError:
+        info = psutil.Process().memory_info()
+        return round(getattr(info, 'peak_wset', info.rss) / 2 ** 20, 1)
+
+
+def percentile(values: List[float], percent: int) -> float:
+    """Percentile of values (1-99)"""
+    if len(values) < 2:
+        return values[0] if values else 0.0
+    return statistics.quantiles(values, n=100, method='inclusive')[percent - 1]
+
+
+def git_commit() -> Optional[str]:
+    """Current commit hash, if the project is a git checkout"""
+    try:
+        return subprocess.run(['git', 'rev-parse', 'HEAD'], cwd=PROJECT_ROOT, capture_output=True,
+                              text=True, check=True).stdout.strip()
+    except (OSError, subprocess.CalledProcessError):
+        return None
+
+
+def run_path(path: str, options: Dict[str, Any]) -> Dict[str, Any]:
+    """Benchmark one matching path; runs in its own process"""
+    from pipeline.stage2_matching.bert_matcher import BERTMatcher, BERT_AVAILABLE
+    from tests.fixtures.synthetic_catalog import generate_workload
+
+    if path == 'bert' and not BERT_AVAILABLE:
+        return {'skipped': 'sentence-transformers not installed'}
+
+    catalog, products = generate_workload(options['catalog_size'], options['products'], options['seed'])
+
+    matcher = BERTMatcher(config={
+        'enable_exact_matching': path == 'exact',
+        'batch_size': options['batch_size'],
+        'cache_embeddings': False
+    })
+    if path != 'bert':
+        matcher.model = None
+        matcher.bert_available = False
+
+    start = time.perf_counter()
+    matcher.load_catalog_data(catalog)
+    load_seconds = time.perf_counter() - start
+
+    if path == 'exact':
+        products = [product for product in products if matcher.exact_index.lookup(product) is not None]
+        if not products:
+            return {'skipped': 'no exact-key products in workload'}
+
+    start = time.perf_counter()
+    results = matcher.match_products(products)
+    batch_seconds = time.perf_counter() - start
+
+    latencies = []
+    for product in products[:options['latency_samples']]:
+        start = time.perf_counter()
+        matcher.match_products([product])
+        latencies.append((time.perf_counter() - start) * 1000)
+
+    return {
+        'products': len(products),
+        'load_seconds': round(load_seconds, 3),
+        'products_per_sec': round(len(products) / batch_seconds, 1),
+        'p50_ms': round(percentile(latencies, 50), 3),
+        'p95_ms': round(percentile(latencies, 95), 3),
+        'peak_rss_mb': peak_rss_mb(),
+        'matched': round(sum(result.matched for result in results) / len(results), 4)
+    }
+
+
+def run_benchmark(args) -> Dict[str, Any]:
+    options = {
+        'catalog_size': args.catalog_size,
+        'products': args.products,
+        'seed': args.seed,
+        'batch_size': args.batch_size,
+        'latency_samples': args.latency_samples
+    }
+    results = {
+        'commit': git_commit(),
+        'python': platform.python_version(),
+        **options,
+        'paths': {}
+    }
+
+    context = multiprocessing.get_context('spawn')
+    for path in args.paths:
+        with context.Pool(1) as pool:
+            results['paths'][path] = pool.apply(run_path, (path, options))
+    return results
+
+
+def print_comparison(results: Dict[str, Any], baseline: Dict[str, Any]) -> None:
+    """Relative change of throughput and latency against a baseline result file"""
+    print(f"Against baseline {baseline.get('commit') or 'unknown commit'}:")
+    for path, run in results['paths'].items():
+        before = baseline.get('paths', {}).get(path)
+        if 'skipped' in run or not before or 'skipped' in before:
+            continue
+        changes = [
+            f"{metric} {(run[metric] - before[metric]) / before[metric]:+.1%}"
+            for metric in ('products_per_sec', 'p50_ms', 'p95_ms', 'peak_rss_mb') if before.get(metric)
+        ]
+        print(f"  {path:<6}: " + '  '.join(changes))
+
+
+def main():
+    """Run the matching benchmark"""
+    parser = argparse.ArgumentParser(description="Benchmark Stage 2 matching paths on synthetic data")
+    parser.add_argument("--catalog-size", type=int, default=2000, help="Number of catalog entries")
+    parser.add_argument("--products", type=int, default=500, help="Number of products")
+    parser.add_argument("--paths", nargs="+", default=list(PATHS), choices=PATHS, help="Matching paths to measure")
+    parser.add_argument("--batch-size", type=int, default=50, help="BERT encoding batch size")
+    parser.add_argument("--latency-samples", type=int, default=100, help="Products timed individually")
+    parser.add_argument("--seed", type=int, default=0, help="Workload random seed")
+    parser.add_argument("--output", type=Path, help="Optional JSON file for the results")
+    parser.add_argument("--baseline", type=Path, help="Earlier JSON results to compare against")
+
+    args = parser.parse_args()
+    results = run_benchmark(args)
+
+    print(f"Workload: {results['catalog_size']} catalog entries, {results['products']} products (seed {results['seed']})")
+    for path, run in results['paths'].items():
+        if 'skipped' in run:
+            print(f"  {path:<6}: skipped ({run['skipped']})")
+            continue
+        print(f"  {path:<6}: {run['products_per_sec']:>9} products/sec  p50 {run['p50_ms']:.3f} ms  "
+              f"p95 {run['p95_ms']:.3f} ms  peak RSS {run['peak_rss_mb']} MB  "
+              f"load {run['load_seconds']}s  matched {run['matched']:.1%} of {run['products']}")
+
+    if args.baseline:
+        print_comparison(results, json.loads(args.baseline.read_text(encoding='utf-8')))
+
+    if args.output:
+        args.output.write_text(json.dumps(results, indent=2), encoding='utf-8')
+
+
+if __name__ == "__main__":
+    main()
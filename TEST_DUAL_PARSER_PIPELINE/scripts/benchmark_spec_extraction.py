@@ -0,0 +1,107 @@
+#!/usr/bin/env python3
+"""
+Spec Book Extraction Benchmark
+==============================
+
+Measures JsonSpecExtractor throughput in pages/sec over a product spec book:
+grammar-only parsing of pre-extracted page text, and end-to-end extract_pdf()
+runs for each requested worker count.
+
+Usage:
+    python scripts/benchmark_spec_extraction.py "docs/Spec_books/Spec_books_short/SKIDOO_2026 PRODUCT SPEC BOOK_short.pdf"
+    python scripts/benchmark_spec_extraction.py book.pdf --brand LYNX --workers 1 2 4 --repeat 20
+"""
+
+import argparse
+import json
+import logging
+import sys
+import time
+from pathlib import Path
+from typing import Any, Dict, List
+
+PROJECT_ROOT = Path(__file__).parent.parent
+sys.path.insert(0, str(PROJECT_ROOT / "pipeline" / "stage1_extraction"))
+
+import pdfplumber  # noqa: E402
+from json_spec_extractor import JsonSpecExtractor  # noqa: E402
+
+
+def benchmark_grammar(page_texts: List[str], brand: str, source_doc: str, repeat: int) -> Dict[str, Any]:
+    """Time extract_page_data() over already extracted page text"""
+    extractor = JsonSpecExtractor()
+    products = 0
+
+    start = time.perf_counter()
+    for _ in range(repeat):
+        for page_num, page_text in enumerate(page_texts, start=1):
+            if extractor.extract_page_data(page_text, page_num, source_doc, brand):
+                products += 1
+    duration = time.perf_counter() - start
+
+    pages = len(page_texts) * repeat
+    return {
+        'pages': pages,
+        'products': products // repeat,
+        'seconds': round(duration, 4),
+        'pages_per_sec': round(pages / duration, 1) if duration else None
+    }
+
+
+def benchmark_extract_pdf(pdf_path: Path, brand: str, workers: int) -> Dict[str, Any]:
+    """Time a full extract_pdf() run, including PDF text extraction"""
+    extractor = JsonSpecExtractor(workers=workers)
+
+    with pdfplumber.open(pdf_path) as pdf:
+        spec_pages = len(range(8, min(32, len(pdf.pages) + 1)))
+
+    start = time.perf_counter()
+    products = extractor.extract_pdf(pdf_path, brand)
+    duration = time.perf_counter() - start
+
+    return {
+        'workers': workers,
+        'pages': spec_pages,
+        'products': len(products),
+        'seconds': round(duration, 4),
+        'pages_per_sec': round(spec_pages / duration, 2) if duration else None
+    }
+
+
+def main():
+    """Run the spec book extraction benchmark"""
+    parser = argparse.ArgumentParser(description="Benchmark JsonSpecExtractor pages/sec on a spec book")
+    parser.add_argument("pdf_path", type=Path, help="Spec book PDF to benchmark")
+    parser.add_argument("--brand", default="SKIDOO", help="Brand passed to the extractor")
+    parser.add_argument("--workers", type=int, nargs="+", default=[1, 2, 4], help="Worker counts for extract_pdf")
+    parser.add_argument("--repeat", type=int, default=10, help="Passes over the page text for the grammar benchmark")
+    parser.add_argument("--output", type=Path, help="Optional JSON file for the results")
+
+    args = parser.parse_args()
+    logging.disable(logging.INFO)
+
+    if not args.pdf_path.exists():
+        print(f"Error: PDF file not found: {args.pdf_path}")
+        sys.exit(1)
+
+    with pdfplumber.open(args.pdf_path) as pdf:
+        page_texts = [page.extract_text() or "" for page in pdf.pages]
+
+    results = {
+        'pdf': args.pdf_path.name,
+        'grammar': benchmark_grammar(page_texts, args.brand, args.pdf_path.name, args.repeat),
+        'extract_pdf': [benchmark_extract_pdf(args.pdf_path, args.brand, workers) for workers in args.workers]
+    }
+
+    grammar = results['grammar']
+    print(f"Spec book: {results['pdf']}")
+    print(f"  Grammar only : {grammar['pages_per_sec']:>10} pages/sec ({grammar['pages']} pages)")
+    for run in results['extract_pdf']:
+        print(f"  extract_pdf  : {run['pages_per_sec']:>10} pages/sec ({run['workers']} workers, {run['products']} products)")
+
+    if args.output:
+        args.output.write_text(json.dumps(results, indent=2), encoding='utf-8')
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,114 @@
+#!/usr/bin/env python3
+"""
+Vector Index Benchmark
+======================
+
+Compares the approximate IVF vector index against exact brute-force search
+on a synthetic clustered catalog of L2-normalised embeddings. Reports build
+time, queries/sec and recall@k relative to brute force for each n_probe.
+
+Usage:
+    python scripts/benchmark_vector_index.py
+    python scripts/benchmark_vector_index.py --catalog-size 50000 --dim 384 --probes 1 4 8 16 --k 10
+"""
+
+import argparse
+import json
+import sys
+import time
+from pathlib import Path
+from typing import Any, Dict
+
+import numpy as np
+
+PROJECT_ROOT = Path(__file__).parent.parent
+sys.path.insert(0, str(PROJECT_ROOT / "pipeline" / "stage2_matching"))
+
+from vector_index import BruteForceIndex, IVFIndex  # noqa: E402
+
+
+def synthetic_embeddings(catalog_size: int, query_count: int, dim: int, clusters: int, seed: int):
+    """Clustered unit vectors for the catalog, noisy copies of catalog rows as queries"""
+    rng = np.random.default_rng(seed)
+    centers = rng.standard_normal((clusters, dim)).astype(np.float32)
+    catalog = centers[rng.integers(0, clusters, catalog_size)] + 0.5 * rng.standard_normal((catalog_size, dim)).astype(np.float32)
+    catalog /= np.linalg.norm(catalog, axis=1, keepdims=True)
+
+    queries = catalog[rng.integers(0, catalog_size, query_count)] + 0.1 * rng.standard_normal((query_count, dim)).astype(np.float32)
+    queries /= np.linalg.norm(queries, axis=1, keepdims=True)
+    return catalog, queries
+
+
+def recall_at_k(exact_ids: np.ndarray, approx_ids: np.ndarray) -> float:
+    """Fraction of exact top-k neighbours found by the approximate search"""
+    hits = sum(len(set(exact) & set(approx)) for exact, approx in zip(exact_ids, approx_ids))
+    return hits / exact_ids.size
+
+
+def timed_search(index, queries: np.ndarray, k: int):
+    start = time.perf_counter()
+    scores, ids = index.search(queries, k)
+    return ids, time.perf_counter() - start
+
+
+def run_benchmark(args) -> Dict[str, Any]:
+    catalog, queries = synthetic_embeddings(args.catalog_size, args.queries, args.dim, args.clusters, args.seed)
+
+    brute_force = BruteForceIndex().build(catalog)
+    exact_ids, exact_seconds = timed_search(brute_force, queries, args.k)
+
+    results = {
+        'catalog_size': args.catalog_size,
+        'dim': args.dim,
+        'queries': args.queries,
+        'k': args.k,
+        'brute_force': {'queries_per_sec': round(args.queries / exact_seconds, 1)},
+        'ivf': []
+    }
+
+    start = time.perf_counter()
+    ivf = IVFIndex(n_lists=args.lists, seed=args.seed).build(catalog)
+    build_seconds = time.perf_counter() - start
+
+    for n_probe in args.probes:
+        ivf.n_probe = n_probe
+        approx_ids, seconds = timed_search(ivf, queries, args.k)
+        results['ivf'].append({
+            'n_lists': len(ivf.centroids),
+            'n_probe': n_probe,
+            'build_seconds': round(build_seconds, 3),
+            'queries_per_sec': round(args.queries / seconds, 1),
+            f'recall@{args.k}': round(recall_at_k(exact_ids, approx_ids), 4)
+        })
+
+    return results
+
+
+def main():
+    """Run the vector index benchmark"""
+    parser = argparse.ArgumentParser(description="Benchmark IVF recall and throughput against brute force")
+    parser.add_argument("--catalog-size", type=int, default=20000, help="Number of catalog embeddings")
+    parser.add_argument("--queries", type=int, default=500, help="Number of query embeddings")
+    parser.add_argument("--dim", type=int, default=384, help="Embedding dimension")
+    parser.add_argument("--clusters", type=int, default=200, help="Synthetic cluster count")
+    parser.add_argument("--lists", type=int, default=0, help="IVF lists (0 = sqrt(catalog size))")
+    parser.add_argument("--probes", type=int, nargs="+", default=[1, 4, 8, 16, 32], help="n_probe values to test")
+    parser.add_argument("--k", type=int, default=10, help="Neighbours per query for recall@k")
+    parser.add_argument("--seed", type=int, default=0, help="Random seed")
+    parser.add_argument("--output", type=Path, help="Optional JSON file for the results")
+
+    args = parser.parse_args()
+    results = run_benchmark(args)
+
+    print(f"Catalog: {results['catalog_size']} x {results['dim']}, {results['queries']} queries, k={results['k']}")
+    print(f"  brute force      : {results['brute_force']['queries_per_sec']:>10} queries/sec  recall@{args.k} 1.0000")
+    for run in results['ivf']:
+        print(f"  ivf n_probe={run['n_probe']:<4} : {run['queries_per_sec']:>10} queries/sec  "
+              f"recall@{args.k} {run[f'recall@{args.k}']:.4f}  ({run['n_lists']} lists, built in {run['build_seconds']}s)")
+
+    if args.output:
+        args.output.write_text(json.dumps(results, indent=2), encoding='utf-8')
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,176 @@
+"""
+Synthetic Stage 2 data generator
+Seeded Ski-Doo and Lynx catalog entries and price list products at any scale
+"""
+
+import random
+import re
+from typing import List, Optional, Sequence
+
+from core import ProductData, CatalogData
+from pipeline.stage2_matching.bert_matcher import BERTMatcher
+
+# Lynx families are not part of the matcher's (Ski-Doo) boosting vocabulary
+LYNX_FAMILIES = ('rave', 'commander', 'xterrain', 'adventure', 'boondocker', 'shredder')
+OTHER_BRANDS = {'POLARIS': ('rmk', 'indy', 'switchback'), 'ARCTIC CAT': ('catalyst', 'riot', 'zr')}
+
+TRIMS = ('X', 'SP', 'RE', 'LE', 'SE', 'X-RS', 'NEO+')
+ENGINES = ('600 EFI', '600R E-TEC', '850 E-TEC', '850 E-TEC Turbo R', '900 ACE', '900 ACE Turbo R')
+TRACKS = ('129"', '137"', '146"', '154"', '165"')
+COLORS = ('Black', 'Octane Blue', 'Viper Red', 'White', 'Timeless Black')
+
+
+class SyntheticCatalogGenerator:
+    """
+    Factory for reproducible Stage 2 matching workloads
+
+    Vocabulary comes from BERTMatcher: Ski-Doo families and packages from
+    the domain boosting lists, and alternative spellings from DOMAIN_MAPPINGS
+    (e.g. 'E-TEC' vs 'ETEC', 'X-RS' vs 'XRS'). Products are drawn from the
+    generated catalog in three kinds: exact copies of a catalog key, noisy
+    rewrites that need semantic or fuzzy matching, and unmatched products
+    of other brands.
+    """
+
+    def __init__(self, seed: int = 0, years: Sequence[int] = (2024, 2025, 2026)):
+        """
+        Initialize generator
+
+        Args:
+            seed: Random seed; the same seed and sizes give the same data
+            years: Model years to spread entries over
+        """
+        self.rng = random.Random(seed)
+        self.years = tuple(years)
+        self.families = {
+            'SKI-DOO': tuple(family.upper() if len(family) <= 3 else family.title() for family in BERTMatcher.DOMAIN_FAMILIES),
+            'LYNX': tuple(family.title() for family in LYNX_FAMILIES)
+        }
+        self.packages = tuple(package.title() for package in BERTMatcher.DOMAIN_PACKAGES)
+
+        # Alternative spellings of catalog terms (e.g. 'E-TEC' -> 'ETEC', 'SE' -> 'SPECIAL EDITION')
+        self.spellings = [
+            (re.compile(rf'(?<!\w){re.escape(term)}(?!\w)', re.IGNORECASE), replacement)
+            for term, replacement in BERTMatcher.DOMAIN_MAPPINGS.items()
+        ]
+
+    def catalog(self, size: int) -> List[CatalogData]:
+        """
+        Generate catalog entries
+
+        Args:
+            size: Number of entries
+
+        Returns:
+            CatalogData entries with brand and model_year metadata
+        """
+        rng = self.rng
+        entries = []
+        for _ in range(size):
+            brand = rng.choice(tuple(self.families))
+            package = rng.choice(self.packages + ('',))
+            engines = rng.sample(ENGINES, rng.randint(1, 3))
+            track = rng.choice(TRACKS)
+
+            entries.append(CatalogData(
+                model_family=f"{rng.choice(self.families[brand])} {rng.choice(TRIMS)} {track}",
+                specifications={'package': package, 'track_length': track} if package else {'track_length': track},
+                features=[f"{package} package"] if package else [],
+                available_engines=engines,
+                available_tracks=[track],
+                extraction_metadata={'brand': brand, 'model_year': rng.choice(self.years)}
+            ))
+        return entries
+
+    def products(self, catalog: List[CatalogData], count: int, exact_fraction: float = 0.3,
+                 unmatched_fraction: float = 0.1) -> List[ProductData]:
+        """
+        Generate price list products against a catalog
+
+        Args:
+            catalog: Catalog the products are derived from
+            count: Number of products
+            exact_fraction: Share of products copying a catalog key exactly
+            unmatched_fraction: Share of products from brands not in the catalog
+
+        Returns:
+            ProductData list with unique 4-character model codes
+        """
+        rng = self.rng
+        products = []
+        for index in range(count):
+            draw = rng.random()
+            if draw < unmatched_fraction:
+                product = self._unmatched_product(index)
+            else:
+                product = self._catalog_product(index, rng.choice(catalog), exact=draw < unmatched_fraction + exact_fraction)
+            products.append(product)
+        return products
+
+    def _catalog_product(self, index: int, entry: CatalogData, exact: bool) -> ProductData:
+        """Product derived from a catalog entry, verbatim or with price list noise"""
+        rng = self.rng
+        malli = entry.model_family
+        paketti = entry.specifications.get('package') or None
+        moottori = rng.choice(entry.available_engines)
+
+        if not exact:
+            malli = self._respell(malli)
+            moottori = self._respell(moottori)
+            if paketti and rng.random() < 0.5:
+                paketti = f"{paketti} PKG"
+            if rng.random() < 0.3:
+                malli = malli.upper()
+
+        return ProductData(
+            model_code=self._model_code(index),
+            brand=entry.extraction_metadata['brand'],
+            year=entry.extraction_metadata['model_year'],
+            malli=malli,
+            paketti=paketti,
+            moottori=moottori,
+            telamatto=entry.specifications.get('track_length'),
+            vari=rng.choice(COLORS),
+            price=float(rng.randrange(12000, 30000, 50))
+        )
+
+    def _unmatched_product(self, index: int) -> ProductData:
+        """Product of a brand the catalog does not cover"""
+        rng = self.rng
+        brand = rng.choice(tuple(OTHER_BRANDS))
+        return ProductData(
+            model_code=self._model_code(index),
+            brand=brand,
+            year=rng.choice(self.years),
+            malli=f"{rng.choice(OTHER_BRANDS[brand]).title()} {rng.choice(TRACKS)}",
+            moottori=rng.choice(('650 Patriot', '850 Patriot Boost', '998 Turbo')),
+            vari=rng.choice(COLORS),
+            price=float(rng.randrange(12000, 30000, 50))
+        )
+
+    def _respell(self, text: str) -> str:
+        """Rewrite one domain term found in the text to its alternative spelling"""
+        candidates = [(pattern, replacement) for pattern, replacement in self.spellings if pattern.search(text)]
+        if not candidates:
+            return text
+        pattern, replacement = self.rng.choice(candidates)
+        return pattern.sub(replacement, text, count=1)
+
+    @staticmethod
+    def _model_code(index: int) -> str:
+        """Unique 4-character base-36 model code"""
+        alphabet = '0123456789ABCDEFGHIJKLMNOPQRSTUVWXYZ'
+        code = ''
+        for _ in range(4):
+            index, digit = divmod(index, 36)
+            code = alphabet[digit] + code
+        return code
+
+
+def generate_workload(catalog_size: int, product_count: int, seed: int = 0,
+                      exact_fraction: float = 0.3, unmatched_fraction: float = 0.1,
+                      years: Optional[Sequence[int]] = None):
+    """Catalog entries and products for one benchmark run"""
+    generator = SyntheticCatalogGenerator(seed, years or (2024, 2025, 2026))
+    catalog = generator.catalog(catalog_size)
+    return catalog, generator.products(catalog, product_count, exact_fraction, unmatched_fraction)
@@ -0,0 +1,66 @@
+"""
+Unit tests for the catalog join index
+Tests CatalogJoinIndex lookups against a full CatalogData.matches_product scan
+"""
+
+import pytest
+
+from core import ProductData, CatalogData
+from core.catalog_join import CatalogJoinIndex
+
+
+FAMILIES = ["Summit X", "Summit X Expert", "MXZ", "Rave RE", "Expedition SE", "GT", "", "Rave RE"]
+
+
+@pytest.fixture
+def catalog():
+    return [
+        CatalogData(model_family=family, extraction_metadata={'position': position})
+        for position, family in enumerate(FAMILIES)
+    ]
+
+
+def scan(catalog, product):
+    """Reference join: first match in a dict keyed by model family"""
+    lookup = {entry.model_family: entry for entry in catalog}
+    for entry in lookup.values():
+        if product.malli and entry.matches_product(product):
+            return entry
+    return None
+
+
+def product(malli):
+    return ProductData(model_code="TEST", brand="SKI-DOO", year=2025, malli=malli)
+
+
+class TestCatalogJoinIndex:
+    """Test trigram-narrowed product to catalog joins"""
+
+    @pytest.mark.parametrize("malli", [
+        "Summit X", "summit x expert 165", "SUMMIT", "mxz x-rs", "MX", "Rave", "rave re 600",
+        "Expedition SE 900 ACE", "Grand Touring", "GT", "X", "Polaris RMK",
+    ])
+    def test_matches_full_scan(self, catalog, malli):
+        """Test lookups return the same entry as scanning every model family"""
+        index = CatalogJoinIndex().build(catalog)
+
+        assert index.lookup(product(malli)) is scan(catalog, product(malli))
+
+    def test_duplicate_family_keeps_last_entry(self, catalog):
+        """Test entries sharing a model family resolve to the last one"""
+        index = CatalogJoinIndex().build(catalog[:-2] + catalog[-1:])
+
+        assert len(index) == 6
+        assert index.lookup(product("Rave RE 600R")).extraction_metadata['position'] == 7
+
+    def test_candidates_skip_unrelated_families(self, catalog):
+        """Test only families sharing the product's trigrams are checked"""
+        index = CatalogJoinIndex().build(catalog[:5])
+
+        assert index.candidates("Summit X Expert 165") == [0, 1]
+        assert index.candidates("Polaris RMK") == []
+
+    def test_missing_malli_or_catalog(self, catalog):
+        """Test products without malli and empty catalogs join to nothing"""
+        assert CatalogJoinIndex().build(catalog).lookup(product(None)) is None
+        assert CatalogJoinIndex().build([]).lookup(product("Summit X")) is None
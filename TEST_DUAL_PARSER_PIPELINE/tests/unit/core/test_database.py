@@ -10,7 +10,7 @@ from pathlib import Path
 from unittest.mock import patch, MagicMock
 from datetime import datetime
 
-from core import DatabaseManager, ProductData, CatalogData
+from core import DatabaseManager, ProductData, CatalogData, ValidationResult
 from core.exceptions import DatabaseError
 from tests.utils import db_helpers, DatabaseTestHelpers
 from tests.fixtures.sample_data import SampleDataFactory
@@ -317,6 +317,59 @@ class TestValidationResultOperations:
         assert len(results) == 0
 
 
+class TestValidationMemo:
+    """Test validation results stored per product content hash"""
+    
+    def test_memo_round_trip(self, temp_database):
+        """Test stored results come back for the same content hash and rule-set version"""
+        db = temp_database
+        result = ValidationResult(success=False, errors=["Price too low"], warnings=["w"], confidence=0.0,
+                                  metadata={'validator': 'InternalValidator'})
+        
+        assert db.save_validation_memo([("SKI-DOO_TEST_2025", "a" * 64, result)], "v1", "InternalValidator") == 1
+        memo = db.load_validation_memo(["a" * 64, "b" * 64], "v1", "InternalValidator")
+        
+        assert list(memo) == ["a" * 64]
+        assert memo["a" * 64] == result
+    
+    def test_memo_skips_non_json_metadata(self, temp_database):
+        """Test results whose metadata would not load back unchanged are not stored"""
+        db = temp_database
+        entries = [
+            ("SKI-DOO_TEST_2025", "a" * 64, ValidationResult(success=True, metadata={'checked': datetime(2025, 1, 1)})),
+            ("SKI-DOO_TEST_2025", "b" * 64, ValidationResult(success=True, metadata={'layers': ('a', 'b')})),
+            ("SKI-DOO_TEST_2025", "c" * 64, ValidationResult(success=True, metadata={'layers': ['a', 'b']})),
+        ]
+        
+        assert db.save_validation_memo(entries, "v1", "InternalValidator") == 1
+        assert list(db.load_validation_memo(["a" * 64, "b" * 64, "c" * 64], "v1", "InternalValidator")) == ["c" * 64]
+    
+    def test_memo_is_scoped_to_ruleset_version(self, temp_database):
+        """Test results of another rule-set version or stage are not reused"""
+        db = temp_database
+        db.save_validation_memo([("SKI-DOO_TEST_2025", "a" * 64, ValidationResult(success=True))], "v1", "InternalValidator")
+        
+        assert db.load_validation_memo(["a" * 64], "v2", "InternalValidator") == {}
+        assert db.load_validation_memo(["a" * 64], "v1", "OtherValidator") == {}
+    
+    def test_memo_columns_added_to_existing_database(self, tmp_path):
+        """Test databases created before the memo columns are migrated"""
+        db_path = tmp_path / "old.db"
+        with sqlite3.connect(db_path) as conn:
+            conn.execute("""
+                CREATE TABLE validation_results (
+                    id TEXT PRIMARY KEY, product_id TEXT NOT NULL, validation_stage TEXT NOT NULL,
+                    success BOOLEAN NOT NULL, errors TEXT, warnings TEXT, suggestions TEXT,
+                    confidence_score REAL, validation_metadata TEXT, created_at TEXT DEFAULT CURRENT_TIMESTAMP
+                )
+            """)
+        
+        db = DatabaseManager(str(db_path))
+        db.save_validation_memo([("SKI-DOO_TEST_2025", "a" * 64, ValidationResult(success=True))], "v1", "InternalValidator")
+        
+        assert "a" * 64 in db.load_validation_memo(["a" * 64], "v1", "InternalValidator")
+
+
 class TestMatchResultOperations:
     """Test match result storage and retrieval"""
     
@@ -0,0 +1,82 @@
+"""
+Unit tests for the process pool utilities
+Tests worker count resolution, chunking, order-preserving chunk mapping and reusable pools
+"""
+
+import os
+
+from core.parallel import WorkerPool, chunk_ranges, map_chunks, resolve_worker_count
+
+_OFFSET = []
+
+
+def _set_offset(offset):
+    _OFFSET.append(offset)
+
+
+def _square_chunk(bounds):
+    start, end = bounds
+    return [value * value + sum(_OFFSET) for value in range(start, end)], os.getpid()
+
+
+class TestWorkerCount:
+    """Test worker count resolution"""
+    
+    def test_explicit_count(self):
+        assert resolve_worker_count(3) == 3
+    
+    def test_zero_means_one_per_cpu(self):
+        assert resolve_worker_count(0) == (os.cpu_count() or 1)
+    
+    def test_none_means_single_process(self):
+        assert resolve_worker_count(None) == 1
+
+
+class TestChunkRanges:
+    """Test chunk boundaries"""
+    
+    def test_chunks_cover_range_in_order(self):
+        chunks = chunk_ranges(103, workers=2)
+        
+        assert chunks[0][0] == 0 and chunks[-1][1] == 103
+        assert all(end == next_start for (_, end), (next_start, _) in zip(chunks, chunks[1:]))
+        assert len(chunks) == 8
+    
+    def test_explicit_chunk_size(self):
+        assert chunk_ranges(5, workers=4, chunk_size=2) == [(0, 2), (2, 4), (4, 5)]
+    
+    def test_empty(self):
+        assert chunk_ranges(0, workers=2) == []
+
+
+class TestMapChunks:
+    """Test order-preserving process pool mapping"""
+    
+    def test_results_in_chunk_order(self):
+        chunks = chunk_ranges(40, workers=2, chunk_size=3)
+        
+        results = map_chunks(_square_chunk, chunks, workers=2, initializer=_set_offset, initargs=(1,))
+        
+        assert [value for values, _ in results for value in values] == [v * v + 1 for v in range(40)]
+        assert all(pid != os.getpid() for _, pid in results)
+
+
+class TestWorkerPool:
+    """Test a process pool reused across map calls"""
+    
+    def test_workers_reused_across_maps(self):
+        with WorkerPool(2, initializer=_set_offset, initargs=(1,)) as pool:
+            first = pool.map(_square_chunk, chunk_ranges(30, workers=2, chunk_size=3))
+            second = pool.map(_square_chunk, chunk_ranges(12, workers=2, chunk_size=2))
+        
+        # The initializer ran once per worker, so the offset is not applied twice
+        assert [value for values, _ in second for value in values] == [v * v + 1 for v in range(12)]
+        assert len({pid for _, pid in first + second}) <= 2
+    
+    def test_close_is_idempotent(self):
+        pool = WorkerPool(2)
+        pool.close()
+        
+        assert pool.map(_square_chunk, [(0, 3)])[0][0] == [0, 1, 4]
+        pool.close()
+        pool.close()
@@ -0,0 +1,64 @@
+"""
+Unit tests for the substring index
+Tests SubstringIndex lookups against a scan over the indexed texts
+"""
+
+import random
+
+import pytest
+
+from core.substring_index import SubstringIndex
+
+
+WORDS = ["Ski-Doo", "Lynx", "MXZ", "Summit", "Rave", "X", "RE", "600R", "850", "E-TEC", "GT", "Neo"]
+
+
+def scan(texts, query, fold):
+    """Reference lookup: every text containing the query or contained in it"""
+    query = fold(query)
+    return [position for position, text in enumerate(texts)
+            if query in fold(text or '') or fold(text or '') in query]
+
+
+@pytest.fixture
+def texts():
+    rng = random.Random(3)
+    return [" ".join(rng.sample(WORDS, rng.randint(1, 4))) for _ in range(300)] + ["", "GT", None]
+
+
+@pytest.fixture
+def queries(texts):
+    rng = random.Random(5)
+    queries = [" ".join(rng.sample(WORDS, rng.randint(1, 5))) for _ in range(500)]
+    queries += [text[start:start + length] for text in texts[:50] for start, length in ((0, 2), (2, 6))]
+    return queries + ["", "x", "ZZZ", "mxz x 600r e-tec 2025"]
+
+
+class TestSubstringIndex:
+    """Test bidirectional substring lookups"""
+
+    @pytest.mark.parametrize("fold", [str.lower, str.upper])
+    def test_matches_scan(self, texts, queries, fold):
+        """Test matches() and first_match() equal a scan over every text"""
+        index = SubstringIndex(fold).build(texts)
+
+        for query in queries:
+            expected = scan(texts, query, fold)
+            assert index.matches(query) == expected, query
+            assert index.first_match(query) == (expected[0] if expected else None), query
+
+    def test_reused_postings(self, texts, queries):
+        """Test an index built from stored postings answers like a fresh one"""
+        fresh = SubstringIndex().build(texts)
+        reused = SubstringIndex().build(texts, postings=fresh.postings)
+
+        assert [reused.matches(query) for query in queries] == [fresh.matches(query) for query in queries]
+
+    def test_duplicates_and_empty_index(self):
+        """Test repeated texts are all returned and an empty index matches nothing"""
+        index = SubstringIndex().build(["Rave RE", "MXZ", "rave re"])
+
+        assert index.matches("RAVE RE 600") == [0, 2]
+        assert index.first_match("rave") == 0
+        assert len(index) == 3
+        assert SubstringIndex().build([]).first_match("Rave") is None
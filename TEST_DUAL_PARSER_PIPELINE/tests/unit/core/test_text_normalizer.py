@@ -0,0 +1,83 @@
+"""
+Unit tests for shared text normalization
+Tests TextNormalizer memoisation, batch API and ReplacementTable
+"""
+
+import pytest
+
+from core.text_normalizer import TextNormalizer, ReplacementTable
+
+
+@pytest.fixture(autouse=True)
+def clear_memo():
+    TextNormalizer.cache_clear()
+    yield
+    TextNormalizer.cache_clear()
+
+
+class TestReplacementTable:
+    """Test single-pass replacement tables"""
+
+    def test_longest_key_wins(self):
+        """Test overlapping keys resolve to the longest match"""
+        table = ReplacementTable({'PKG': 'PACKAGE', 'EXPERT PKG': 'EXPERT-PACKAGE'})
+
+        assert table.apply('EXPERT PKG and PKG') == 'EXPERT-PACKAGE and PACKAGE'
+
+    def test_ignore_case_lookup(self):
+        """Test case-insensitive tables replace with the mapped value"""
+        table = ReplacementTable({'X-RS': 'XRS'}, ignore_case=True)
+
+        assert table.apply('mxz x-rs') == 'mxz XRS'
+
+    def test_boundary(self):
+        """Test boundary patterns keep keys from matching inside words"""
+        table = ReplacementTable({'SE': 'SPECIAL EDITION'}, boundary=r'\b')
+
+        assert table.apply('EXPEDITION SE') == 'EXPEDITION SPECIAL EDITION'
+
+    def test_empty_mapping(self):
+        """Test an empty table returns text unchanged"""
+        assert ReplacementTable({}).apply('Summit X') == 'Summit X'
+
+
+class TestTextNormalizer:
+    """Test memoised normalisers"""
+
+    @pytest.mark.parametrize("text,expected", [
+        ("Summit® X-RS  850 E-TEC", "SUMMIT XRS 850 ETEC"),
+        ("MXZ X RS", "MXZ XRS"),
+        ("Renegade NEO+", "RENEGADE NEO PLUS"),
+        ("", ""),
+        (None, ""),
+    ])
+    def test_normalize_model_name(self, text, expected):
+        """Test trademark removal, spacing and variant replacement"""
+        assert TextNormalizer.normalize_model_name(text) == expected
+
+    def test_normalize_field(self):
+        """Test storage normalisation lowercases and blanks punctuation"""
+        assert TextNormalizer.normalize_field('Summit X, 154"') == 'summit x  154 '
+        assert TextNormalizer.normalize_field(600) == '600'
+        assert TextNormalizer.normalize_field(None) == ''
+
+    def test_repeated_values_hit_memo(self):
+        """Test normalising the same string twice is served from the memo"""
+        TextNormalizer.normalize_model_name('Summit X')
+        TextNormalizer.normalize_model_name('Summit X')
+
+        info = TextNormalizer.cache_info()['model_name']
+        assert info.hits == 1
+        assert info.misses == 1
+
+    def test_normalize_batch_preserves_order(self):
+        """Test the batch API returns one value per input in order"""
+        texts = ['MXZ X-RS', 'Summit X', 'MXZ X-RS']
+
+        assert TextNormalizer.normalize_batch(texts) == ['MXZ XRS', 'SUMMIT X', 'MXZ XRS']
+        assert TextNormalizer.cache_info()['model_name'].misses == 2
+
+    def test_normalize_batch_unknown_kind(self):
+        """Test unknown normalisation kinds are rejected"""
+        with pytest.raises(ValueError):
+            TextNormalizer.normalize_batch(['Summit X'], kind='color')
@@ -0,0 +1,54 @@
+"""
+Unit tests for the character trigram index
+Tests TrigramIndex construction, scoring and candidate selection
+"""
+
+import pytest
+
+from core.trigram_index import TrigramIndex
+
+
+@pytest.fixture
+def index():
+    return TrigramIndex().build([
+        "SUMMIT X EXPERT 850 ETEC SKI-DOO",
+        "MXZ XRS COMPETITION 600R ETEC SKI-DOO",
+        "RAVE RE 600R ETEC LYNX",
+        "EXPEDITION SE 900 ACE TURBO SKI-DOO",
+        "",
+    ])
+
+
+class TestTrigramIndex:
+    """Test trigram blocking"""
+
+    def test_trigrams_are_padded_and_lowercased(self):
+        """Test short texts still produce trigrams"""
+        assert TrigramIndex.trigrams("SE") == {'  s', ' se', 'se '}
+        assert TrigramIndex.trigrams("") == set()
+
+    def test_identical_text_scores_one(self, index):
+        """Test an indexed text scores 1.0 against itself"""
+        scores = index.scores("RAVE RE 600R ETEC LYNX")
+
+        assert scores[2] == pytest.approx(1.0)
+        assert max(scores, key=scores.get) == 2
+
+    def test_candidates_ranked_by_overlap(self, index):
+        """Test the closest texts are kept and returned in position order"""
+        candidates = index.candidates("SKI-DOO SUMMIT X 850 ETEC", top_n=2)
+
+        assert len(candidates) == 2
+        assert 0 in candidates
+        assert candidates == sorted(candidates)
+
+    def test_positions_restrict_candidates(self, index):
+        """Test only eligible positions are scored"""
+        candidates = index.candidates("SUMMIT X 850 ETEC", top_n=5, positions={2, 3})
+
+        assert set(candidates) <= {2, 3}
+
+    def test_no_shared_trigram(self, index):
+        """Test texts with nothing in common produce no candidates"""
+        assert index.candidates("qqq", top_n=5) == []
+        assert len(index) == 5
@@ -0,0 +1,121 @@
+"""
+Unit tests for JSON spec book extraction
+Tests JsonSpecExtractor's compiled extraction grammar
+"""
+
+import re
+import pytest
+
+from pipeline.stage1_extraction.json_spec_extractor import JsonSpecExtractor
+
+
+SAMPLE_SPEC_PAGE = """S U M M I T X WITH EXPERT PACKAGE
+850 E-TEC® Turbo R
+850 E-TEC®
+Rotax® liquid-cooled two-stroke engine
+Displacement 2 - 849 cc
+Bore x stroke 82 x 80.4 mm
+Fuel system E-TEC direct injection
+Premium unleaded
+Fuel tank capacity 36 L
+Overall length 3188 mm
+Overall width 971 mm
+Ski stance 813 mm
+Dry weight 207 kg
+WHAT'S NEW
+• REV Gen5 Lightweight platform
+• REV Gen5 Lightweight platform
+PACKAGE HIGHLIGHTS
+• Premium LED headlights
+PowderMax X-Light 154 x 16 x 3.0
+"""
+
+
+class TestExtractionGrammar:
+    """Test the class-level compiled grammar"""
+
+    def test_grammar_compiled_at_class_load(self):
+        """Test that patterns are compiled once on the class, not per call"""
+        assert isinstance(JsonSpecExtractor._ENGINE_NAME_GRAMMAR, re.Pattern)
+        assert isinstance(JsonSpecExtractor._ENGINE_LINE_DISPATCH, re.Pattern)
+        assert isinstance(JsonSpecExtractor._DIMENSION_LINE_DISPATCH, re.Pattern)
+        assert all(isinstance(pattern, re.Pattern) for pattern in JsonSpecExtractor._ENGINE_HEADER_PATTERNS)
+        assert all(isinstance(entry[0], re.Pattern) for entry in JsonSpecExtractor._MODEL_PATTERNS)
+
+    def test_line_dispatch_reports_every_keyword(self):
+        """Test that the named-group dispatch finds all rules on one line"""
+        line = "Displacement 849 cc / fuel tank 36 L"
+        hits = {match.lastgroup for match in JsonSpecExtractor._ENGINE_LINE_DISPATCH.finditer(line)}
+
+        assert hits == {'displacement', 'fuel_tank'}
+
+    @pytest.mark.parametrize("engine_name,expected", [
+        ("850 E-TEC® Turbo R", "850ETEC TURBOR"),
+        ("850 E TEC", "850ETEC"),
+        ("900 ACE Turbocharged", "900ACE TURBO"),
+        ("600 EFI – 85", "600EFI85"),
+        ("600 fuel injection with turbo", "600EFI TURBO"),
+        ("", ""),
+    ])
+    def test_normalize_engine_name(self, engine_name, expected):
+        """Test single-pass engine name normalisation"""
+        assert JsonSpecExtractor().normalize_engine_name(engine_name) == expected
+
+
+class TestPageExtraction:
+    """Test field extraction from spec book page text"""
+
+    def test_extract_engine_specifications(self):
+        """Test engine variants and per-line specifications"""
+        engine_data = JsonSpecExtractor().extract_engine_specifications(SAMPLE_SPEC_PAGE)
+        variants = engine_data['variants']
+
+        assert [variant['name'] for variant in variants] == ['850 E-TEC Turbo R', '850 E-TEC']
+        assert variants[0]['turbo'] is True
+        assert variants[1]['turbo'] is False
+        assert variants[0]['type'] == '2-stroke'
+        assert variants[0]['displacement'] == 849
+        assert variants[0]['bore_stroke'] == '82 x 80.4 mm'
+        assert variants[0]['fuel_system'] == 'E-TEC direct injection'
+        assert variants[0]['fuel_type'] == 'Premium unleaded - 95'
+        assert variants[0]['fuel_tank_l'] == 36
+
+    def test_extract_dimensions_weight(self):
+        """Test dimension rules dispatched per line"""
+        dimensions = JsonSpecExtractor().extract_dimensions_weight(SAMPLE_SPEC_PAGE)
+
+        assert dimensions == {
+            'overall_length_mm': 3188,
+            'overall_width_mm': 971,
+            'ski_stance_mm': 813,
+            'dry_weight_kg': 207
+        }
+
+    def test_extract_features_lists(self):
+        """Test section headers and bullet deduplication"""
+        features = JsonSpecExtractor().extract_features_lists(SAMPLE_SPEC_PAGE)
+
+        assert features['whats_new'] == ['REV Gen5 Lightweight platform']
+        assert features['package_highlights'] == ['Premium LED headlights']
+        assert features['features'] == []
+
+    def test_extract_track_options(self):
+        """Test track dimensions found through the segment pre-filter"""
+        tracks = JsonSpecExtractor().extract_track_options(SAMPLE_SPEC_PAGE)
+
+        assert len(tracks) == 1
+        assert tracks[0]['width_inch'] == 16
+        assert tracks[0]['profile_inch'] == 3.0
+
+    def test_extract_track_options_without_dimensions(self):
+        """Test that pages without dimension triples yield no tracks"""
+        assert JsonSpecExtractor().extract_track_options("No track data on this page") == []
+
+    def test_extract_page_data(self):
+        """Test complete page extraction"""
+        product = JsonSpecExtractor().extract_page_data(SAMPLE_SPEC_PAGE, 12, 'spec.pdf', 'SKIDOO')
+
+        assert product['model'] == 'Summit X'
+        assert product['configuration'] == 'Expert Package'
+        assert product['sku'] == 'SKIDOO-SUMMIT-X-EXPERT-PACKAGE-2026'
+        assert product['specifications']['features']['source_page'] == 12
@@ -0,0 +1,118 @@
+"""
+Unit tests for spec book data insertion
+Tests single-document and bulk loading into llm_specbook_data_target_schema
+"""
+
+import copy
+import json
+import sqlite3
+import pytest
+
+from pipeline.stage1_extraction.specbook_data_inserter import (
+    SPECBOOK_COLUMNS, bulk_insert_specbook_data, insert_specbook_data, json_data
+)
+
+
+TABLE = 'llm_specbook_data_target_schema'
+INDEX = 'idx_specbook_brand_model'
+
+
+@pytest.fixture
+def specbook_db(tmp_path):
+    """Create a database with the spec book target table and one index"""
+    db_path = tmp_path / "specbook.db"
+    conn = sqlite3.connect(db_path)
+    conn.execute(
+        f"CREATE TABLE {TABLE} (id INTEGER PRIMARY KEY AUTOINCREMENT, "
+        + ", ".join(SPECBOOK_COLUMNS)
+        + ", created_at TEXT DEFAULT CURRENT_TIMESTAMP, updated_at TEXT DEFAULT CURRENT_TIMESTAMP)"
+    )
+    conn.execute(f"CREATE INDEX {INDEX} ON {TABLE} (basic_info_brand, basic_info_model)")
+    conn.commit()
+    conn.close()
+    return str(db_path)
+
+
+def make_documents(count):
+    """Copies of the reference document with distinct model names"""
+    documents = []
+    for i in range(count):
+        document = copy.deepcopy(json_data)
+        document["basicInfo"]["model"] = f"Summit X {i}"
+        documents.append(document)
+    return documents
+
+
+def fetch_rows(db_path, columns="*"):
+    conn = sqlite3.connect(db_path)
+    rows = conn.execute(f"SELECT {columns} FROM {TABLE} ORDER BY id").fetchall()
+    conn.close()
+    return rows
+
+
+class TestBulkInsertSpecbookData:
+    """Test bulk_insert_specbook_data()"""
+
+    def test_bulk_insert_matches_single_insert(self, specbook_db, tmp_path):
+        """Test bulk rows are identical to rows written one document at a time"""
+        documents = make_documents(7)
+
+        inserted = bulk_insert_specbook_data(documents, specbook_db, batch_size=3)
+
+        assert inserted == {TABLE: 7}
+        bulk_rows = fetch_rows(specbook_db, ", ".join(SPECBOOK_COLUMNS))
+
+        conn = sqlite3.connect(specbook_db)
+        conn.execute(f"DELETE FROM {TABLE}")
+        conn.commit()
+        conn.close()
+        for document in documents:
+            insert_specbook_data(document, specbook_db)
+
+        assert fetch_rows(specbook_db, ", ".join(SPECBOOK_COLUMNS)) == bulk_rows
+        assert json.loads(bulk_rows[6][-1])["basicInfo"]["model"] == "Summit X 6"
+
+    def test_bulk_insert_accepts_generator(self, specbook_db):
+        """Test documents may be streamed from any iterable"""
+        inserted = bulk_insert_specbook_data((doc for doc in make_documents(4)), specbook_db, batch_size=2)
+
+        assert inserted == {TABLE: 4}
+        assert [row[0] for row in fetch_rows(specbook_db, "basic_info_model")] == [
+            "Summit X 0", "Summit X 1", "Summit X 2", "Summit X 3"
+        ]
+
+    def test_indexes_recreated_after_load(self, specbook_db):
+        """Test deferred indexes exist again once the load commits"""
+        bulk_insert_specbook_data(make_documents(2), specbook_db)
+
+        conn = sqlite3.connect(specbook_db)
+        indexes = conn.execute(
+            "SELECT name FROM sqlite_master WHERE type = 'index' AND tbl_name = ?", (TABLE,)
+        ).fetchall()
+        conn.close()
+
+        assert (INDEX,) in indexes
+
+    def test_failure_rolls_back_entire_load(self, specbook_db):
+        """Test a malformed document leaves the table and its indexes untouched"""
+        documents = make_documents(5)
+        del documents[4]["engines"]
+
+        with pytest.raises(KeyError):
+            bulk_insert_specbook_data(documents, specbook_db, batch_size=2)
+
+        assert fetch_rows(specbook_db) == []
+        conn = sqlite3.connect(specbook_db)
+        index_names = [row[0] for row in conn.execute("SELECT name FROM sqlite_master WHERE type = 'index'")]
+        conn.close()
+        assert INDEX in index_names
+
+    def test_missing_database(self, tmp_path):
+        """Test missing database file raises FileNotFoundError"""
+        with pytest.raises(FileNotFoundError):
+            bulk_insert_specbook_data(make_documents(1), str(tmp_path / "missing.db"))
+
+    def test_invalid_batch_size(self, specbook_db):
+        """Test non-positive batch sizes are rejected"""
+        with pytest.raises(ValueError):
+            bulk_insert_specbook_data(make_documents(1), specbook_db, batch_size=0)
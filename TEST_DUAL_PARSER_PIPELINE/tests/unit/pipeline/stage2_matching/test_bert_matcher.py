@@ -3,12 +3,16 @@ Unit tests for BERT semantic matching functionality
 Tests BERTMatcher class and semantic similarity operations
 """
 
+import json
 import pytest
 import numpy as np
 from unittest.mock import Mock, MagicMock, patch
 from pathlib import Path
 
 from pipeline.stage2_matching import BERTMatcher
+from pipeline.stage2_matching import bert_matcher
+from pipeline.stage2_matching.bert_matcher import BERT_AVAILABLE
+from pipeline.stage2_matching.vector_index import IVFIndex
 from core import ProductData, CatalogData, MatchResult, PipelineStats
 from core.exceptions import MatchingError
 from tests.utils import performance_timer
@@ -737,4 +741,510 @@ class TestBERTMatcherIntegration:
                 match_result = matcher.match_single_product(finnish_product)
                 
                 assert match_result.success is True
-                assert match_result.matched_model == "Summit X"
\ No newline at end of file
+                assert match_result.matched_model == "Summit X"
+
+class _TrigramEncoder:
+    """Deterministic stand-in for SentenceTransformer (hashed character trigrams)"""
+    
+    def __init__(self, dim=32):
+        self.dim = dim
+        self.batch_sizes = []
+    
+    def encode(self, texts):
+        self.batch_sizes.append(len(texts))
+        embeddings = np.zeros((len(texts), self.dim), dtype=np.float32)
+        for row, text in enumerate(texts):
+            for i in range(len(text) - 2):
+                embeddings[row, sum(map(ord, text[i:i + 3])) % self.dim] += 1.0
+        return embeddings
+
+
+@pytest.mark.skipif(not BERT_AVAILABLE, reason="BERT libraries not installed")
+class TestPrecomputedCatalogMatrix:
+    """Test catalog embedding precomputation and matrix scoring"""
+    
+    @pytest.fixture
+    def matcher(self):
+        # Exact-key hits would bypass the matrix scoring under test
+        matcher = BERTMatcher(config={'batch_size': 2, 'similarity_threshold': 0.5, 'enable_exact_matching': False})
+        matcher.model = _TrigramEncoder()
+        matcher.bert_available = True
+        return matcher
+    
+    @pytest.fixture
+    def catalog(self):
+        return [
+            CatalogData(model_family="Summit X", features=["Expert package"], available_engines=["850 E-TEC Turbo R"],
+                        extraction_metadata={'brand': 'SKI-DOO'}),
+            CatalogData(model_family="MXZ X-RS", features=["Competition package"], available_engines=["600R E-TEC"],
+                        extraction_metadata={'brand': 'SKI-DOO'}),
+            CatalogData(model_family="Rave RE", features=["Adrenaline"], available_engines=["600R E-TEC"],
+                        extraction_metadata={'brand': 'LYNX'}),
+            CatalogData(model_family="Expedition SE", available_engines=["900 ACE Turbo"],
+                        extraction_metadata={'brand': 'SKI-DOO'}),
+            CatalogData(model_family="®", extraction_metadata={'brand': '™'}),  # Empty once cleaned
+        ]
+    
+    @pytest.fixture
+    def products(self):
+        return [
+            ProductData(model_code="SUMX", brand="SKI-DOO", year=2026, malli="Summit X", paketti="Expert",
+                        moottori="850 E-TEC Turbo R"),
+            ProductData(model_code="MXZR", brand="SKI-DOO", year=2025, malli="MXZ X-RS", moottori="600R E-TEC"),
+            ProductData(model_code="RAVE", brand="LYNX", year=2026, malli="Rave RE", paketti="Adrenaline"),
+            ProductData(model_code="EXPD", brand="POLARIS", year=2024, malli="Expedition SE", moottori="900 ACE Turbo"),
+        ]
+    
+    def test_catalog_encoded_once_in_batches(self, matcher, catalog):
+        """Test load_catalog_data() encodes the catalog in batch_size chunks"""
+        matcher.load_catalog_data(catalog)
+        
+        assert matcher.model.batch_sizes == [2, 2, 1]
+        assert matcher._catalog_embeddings.shape == (5, 32)
+        norms = np.linalg.norm(matcher._catalog_embeddings, axis=1)
+        assert np.allclose(norms[:4], 1.0)
+        assert list(matcher._catalog_valid) == [True, True, True, True, False]
+    
+    def test_products_scored_in_batches(self, matcher, catalog, products):
+        """Test match_products() encodes products in batches, never per pair"""
+        matcher.load_catalog_data(catalog)
+        matcher.model.batch_sizes = []
+        
+        results = matcher.match_products(products)
+        
+        assert len(results) == 4
+        assert matcher.model.batch_sizes == [2, 2]
+        assert matcher._batch_best == {}
+    
+    def test_matrix_scores_match_pairwise_scores(self, matcher, catalog, products):
+        """Test matrix scoring reproduces per-pair BERT similarity and boosting"""
+        matcher.load_catalog_data(catalog)
+        
+        matrix_results = matcher.match_products(products)
+        # A catalog list other than the loaded one takes the per-pair path
+        pairwise_results = [matcher.match_product(product, list(catalog)) for product in products]
+        
+        for matrix_result, pairwise_result in zip(matrix_results, pairwise_results):
+            assert matrix_result.catalog_data is pairwise_result.catalog_data
+            assert matrix_result.matched == pairwise_result.matched
+            assert matrix_result.confidence_score == pytest.approx(pairwise_result.confidence_score, abs=1e-5)
+            assert matrix_result.match_details.keys() == pairwise_result.match_details.keys()
+    
+    def test_top_k_candidates_match_pairwise(self, matcher, catalog, products):
+        """Test match_top_k() records the same ranked candidates as per-pair scoring"""
+        matcher.load_catalog_data(catalog)
+        
+        results = matcher.match_top_k(products, k=2)
+        matcher.top_k = 2
+        pairwise_results = [matcher.match_product(product, list(catalog)) for product in products]
+        
+        for result, pairwise_result in zip(results, pairwise_results):
+            top = result.match_details['top_k']
+            expected = pairwise_result.match_details['top_k']
+            assert 0 < len(top) <= 2
+            assert [key for key, _ in top] == [key for key, _ in expected]
+            assert [score for _, score in top] == pytest.approx([score for _, score in expected], abs=1e-5)
+            assert top[0][1] == pytest.approx(result.confidence_score)
+            if result.matched:
+                assert result.catalog_data.model_family == top[0][0]
+    
+    def test_top_k_keys_survive_storage(self, matcher, catalog, products):
+        """Test stored candidates name catalog entries rather than in-memory positions"""
+        matcher.load_catalog_data(catalog)
+        families = {entry.model_family: entry for entry in catalog}
+        
+        for result in matcher.match_top_k(products, k=3):
+            stored = json.loads(json.dumps(result.match_details))['top_k']
+            
+            assert all(key in families for key, _ in stored)
+            if result.matched:
+                assert families[stored[0][0]] is result.catalog_data
+    
+    def test_top_k_is_opt_in(self, matcher, catalog, products):
+        """Test plain match_products() stores no candidates and match_top_k() restores top_k"""
+        matcher.load_catalog_data(catalog)
+        
+        matcher.match_top_k(products, k=3)
+        results = matcher.match_products(products)
+        
+        assert matcher.top_k == 1
+        assert all('top_k' not in result.match_details for result in results)
+        with pytest.raises(ValueError):
+            matcher.match_top_k(products, k=0)
+    
+    def test_brand_filter_applied_to_matrix(self, matcher, catalog, products):
+        """Test only same-brand entries are considered, with fallback to all entries"""
+        matcher.load_catalog_data(catalog)
+        
+        rave = matcher.match_product(products[2], matcher.catalog_data)
+        polaris = matcher.match_product(products[3], matcher.catalog_data)
+        
+        assert rave.catalog_data is catalog[2]
+        assert polaris.catalog_data is catalog[3]
+    
+    def test_warm_embedding_cache_skips_catalog_encoding(self, catalog, tmp_path):
+        """Test a second matcher reuses cached catalog embeddings without encoding"""
+        config = {'batch_size': 2, 'cache_embeddings': True, 'embedding_cache_dir': str(tmp_path)}
+        cold = BERTMatcher(config=config)
+        cold.model = _TrigramEncoder()
+        cold.load_catalog_data(catalog)
+        
+        warm = BERTMatcher(config=config)
+        warm.model = _TrigramEncoder()
+        warm.load_catalog_data(catalog)
+        
+        assert cold.model.batch_sizes == [2, 2, 1]
+        assert warm.model.batch_sizes == []
+        assert np.array_equal(warm._catalog_embeddings, cold._catalog_embeddings)
+    
+    def test_ivf_vector_index_matches_exact_scoring(self, matcher, catalog, products, tmp_path):
+        """Test the ANN path with every list probed agrees with matrix scoring"""
+        matcher.load_catalog_data(catalog)
+        exact_results = matcher.match_products(products)
+        
+        ann = BERTMatcher(config={
+            'batch_size': 2, 'similarity_threshold': 0.5, 'vector_index': 'ivf', 'ivf_lists': 2,
+            'ivf_probe': 2, 'vector_index_path': str(tmp_path / 'catalog_index.npz'), 'enable_exact_matching': False
+        })
+        ann.model = _TrigramEncoder()
+        ann.load_catalog_data(catalog)
+        ann_results = ann.match_products(products)
+        
+        assert ann.vector_index.kind == 'ivf'
+        assert (tmp_path / 'catalog_index.npz').exists()
+        for exact_result, ann_result in zip(exact_results, ann_results):
+            assert ann_result.catalog_data is exact_result.catalog_data
+            assert ann_result.confidence_score == pytest.approx(exact_result.confidence_score, abs=1e-5)
+    
+    def test_saved_ivf_index_follows_config(self, catalog, tmp_path):
+        """Test a shared saved index takes each matcher's ivf_probe and is rebuilt for other ivf_lists"""
+        def ann_matcher(**params):
+            matcher = BERTMatcher(config={
+                'batch_size': 2, 'vector_index': 'ivf', 'vector_index_path': str(tmp_path / 'catalog_index.npz'),
+                **params
+            })
+            matcher.model = _TrigramEncoder()
+            matcher.load_catalog_data(catalog)
+            return matcher.vector_index
+        
+        first = ann_matcher(ivf_lists=2, ivf_probe=1)
+        with patch.object(IVFIndex, 'build', autospec=True, side_effect=IVFIndex.build) as build:
+            second = ann_matcher(ivf_lists=2, ivf_probe=2)
+            assert build.call_count == 0
+            rebuilt = ann_matcher(ivf_lists=3, ivf_probe=2)
+            assert build.call_count == 1
+        
+        assert first.n_probe == 1
+        assert second.n_probe == 2
+        assert len(second.centroids) == 2
+        assert len(rebuilt.centroids) == 3
+    
+    def test_fuzzy_fallback_skips_precomputation(self, catalog, products):
+        """Test no embedding matrix is built when BERT is unavailable"""
+        matcher = BERTMatcher()
+        matcher.model = None
+        matcher.bert_available = False
+        
+        matcher.load_catalog_data(catalog)
+        results = matcher.match_products(products)
+        
+        assert matcher._catalog_embeddings is None
+        assert len(results) == 4
+
+
+
+@pytest.mark.skipif(not BERT_AVAILABLE, reason="BERT libraries not installed")
+class TestEncoderBackends:
+    """Test encoder backend selection in BERTMatcher"""
+    
+    @staticmethod
+    def _load_encoder(model_name, backend='torch', device=None, onnx_model_file=None):
+        if backend == 'onnx':
+            raise ImportError("onnxruntime is not installed")
+        return _TrigramEncoder()
+    
+    def test_failed_backend_falls_back_to_torch(self):
+        """Test an unavailable backend falls back to the float32 model"""
+        matcher = BERTMatcher(config={'encoder_backend': 'onnx'})
+        with patch.object(bert_matcher, 'get_encoder', side_effect=self._load_encoder):
+            assert isinstance(matcher.model, _TrigramEncoder)
+        
+        assert matcher.bert_available
+        assert matcher.encoder_backend == 'torch'
+        assert matcher.encoder_name == matcher.model_name
+    
+    def test_backend_keys_embedding_cache(self, tmp_path):
+        """Test quantised encoders never reuse float32 cached embeddings"""
+        config = {'encoder_backend': 'torch_int8', 'cache_embeddings': True,
+                  'embedding_cache_dir': str(tmp_path), 'embedding_cache_dtype': 'int8'}
+        matcher = BERTMatcher(config=config)
+        with patch.object(bert_matcher, 'get_encoder', side_effect=self._load_encoder):
+            matcher.model
+        
+        assert matcher.embedding_cache.model_name == f"{matcher.model_name}@torch_int8"
+        assert matcher.embedding_cache.dtype == 'int8'
+    
+    def test_model_loads_on_first_use(self):
+        """Test construction defers the model load to the first access"""
+        with patch.object(bert_matcher, 'get_encoder', side_effect=self._load_encoder) as get_encoder:
+            matcher = BERTMatcher()
+            assert get_encoder.call_count == 0
+            
+            model = matcher.model
+            assert matcher.model is model
+        
+        get_encoder.assert_called_once_with(matcher.model_name, 'torch', matcher.device, None)
+    
+    def test_failed_load_is_not_retried(self):
+        """Test a matcher whose model fails to load falls back to fuzzy matching once"""
+        matcher = BERTMatcher()
+        with patch.object(bert_matcher, 'get_encoder', side_effect=OSError("model not found")) as get_encoder:
+            assert matcher.model is None
+            assert matcher.model is None
+        
+        assert get_encoder.call_count == 1
+        assert not matcher.bert_available
+        assert matcher.embedding_cache is None
+
+
+
+class TestDomainBoostMasks:
+    """Test domain boosting from precomputed domain term bitmasks"""
+    
+    TEXTS = [
+        "summit x expert 850 etec turbo",
+        "Summit X Expert 850 E-TEC",
+        "mxz xrs competition 600 etec",
+        "renegade adrenaline 900 ace turbo",
+        "expedition sport 600 ace",
+        "",
+    ]
+    
+    @pytest.fixture
+    def matcher(self):
+        return BERTMatcher()
+    
+    @pytest.mark.parametrize("text1,text2,expected", [
+        ("summit expert 850", "SUMMIT EXPERT 850", 0.2),
+        ("mxz 600 etec", "mxz 600", 0.15),
+        ("renegade sport", "expedition sport", 0.05),
+        ("summit", "", 0.0),
+    ])
+    def test_boost_values(self, matcher, text1, text2, expected):
+        """Test families add 0.1, engines/packages 0.05, capped at 0.2"""
+        assert matcher._calculate_domain_boost(text1, text2) == pytest.approx(expected)
+    
+    def test_mask_bits_follow_term_order(self, matcher):
+        """Test each domain term owns one bit, families first"""
+        assert matcher._domain_mask("SUMMIT") == 1
+        assert matcher._domain_mask("etec xtreme") == (1 << 9) | (1 << 16)
+    
+    @pytest.mark.skipif(not BERT_AVAILABLE, reason="BERT libraries not installed")
+    def test_matrix_boost_matches_pairwise(self, matcher):
+        """Test the vectorised boost equals the per-pair boost for every pair"""
+        matcher._domain_boost = np.array(matcher._domain_boost_values)
+        matcher._popcounts = matcher._popcount_table()
+        masks = matcher._domain_masks(self.TEXTS)
+        
+        boosts = matcher._matrix_domain_boost(masks, masks)
+        
+        for i, text1 in enumerate(self.TEXTS):
+            for j, text2 in enumerate(self.TEXTS):
+                assert boosts[i, j] == matcher._calculate_domain_boost(text1, text2)
+
+class TestCatalogBuckets:
+    """Test the brand/year bucketed catalog index built by load_catalog_data()"""
+    
+    @pytest.fixture
+    def matcher(self):
+        matcher = BERTMatcher()
+        matcher.model = None
+        matcher.bert_available = False
+        matcher.load_catalog_data([
+            CatalogData(model_family="Summit X", extraction_metadata={'brand': 'Ski-Doo', 'model_year': 2026}),
+            CatalogData(model_family="Rave RE", extraction_metadata={'brand': 'Lynx', 'model_year': 2025}),
+            CatalogData(model_family="MXZ X-RS", extraction_metadata={'brand': 'Ski-Doo', 'model_year': 2025}),
+            CatalogData(model_family="Generic accessory"),
+            CatalogData(model_family="Expedition SE", extraction_metadata={'brand': 'Ski-Doo'}),
+        ])
+        return matcher
+    
+    def test_bucket_lookup_is_memoised(self, matcher):
+        """Test repeated lookups return the same precomputed bucket"""
+        first = matcher.catalog_bucket('ski-doo ')
+        second = matcher.catalog_bucket('SKI-DOO')
+        
+        assert first is second
+        assert first.indices == (0, 2, 4)
+    
+    def test_filters_match_linear_substring_rules(self, matcher):
+        """Test bucket filters reproduce the original per-entry substring checks"""
+        product = ProductData(model_code="SKDO", brand="SKI-DOO", year=2026, malli="Summit X")
+        
+        assert matcher.filter_catalog_by_brand('SKI') == [matcher.catalog_data[i] for i in (0, 2, 4)]
+        assert matcher.filter_catalog_by_brand('') is matcher.catalog_data
+        # Bidirectional rule also admits entries with no brand
+        assert matcher._filter_by_brand(product, matcher.catalog_data) == [matcher.catalog_data[i] for i in (0, 2, 3, 4)]
+        assert matcher._filter_by_brand(product, list(matcher.catalog_data)) == [matcher.catalog_data[i] for i in (0, 2, 3, 4)]
+    
+    def test_year_bucket_keeps_unknown_years(self, matcher):
+        """Test year buckets include entries without a known model year"""
+        assert matcher.catalog_bucket('SKI-DOO', 2025).indices == (2, 4)
+        assert matcher.catalog_bucket(None, 2026).indices == (0, 3, 4)
+    
+    def test_index_rebuilt_for_new_catalog(self, matcher):
+        """Test loading a new catalog discards previous buckets"""
+        matcher.catalog_bucket('LYNX')
+        matcher.load_catalog_data([CatalogData(model_family="Rave RE", extraction_metadata={'brand': 'Lynx'})])
+        
+        assert matcher.catalog_bucket('LYNX').indices == (0,)
+
+
+class TestFuzzyTrigramBlocking:
+    """Test the trigram-blocked fuzzy fallback used when BERT is unavailable"""
+    
+    @pytest.fixture
+    def catalog(self):
+        families = ["Summit X", "MXZ X-RS", "Renegade", "Expedition SE", "Backcountry", "Freeride"]
+        engines = ["850 E-TEC", "600R E-TEC", "900 ACE Turbo"]
+        return [
+            CatalogData(model_family=f"{families[i % 6]} {i}", available_engines=[engines[i % 3]],
+                        extraction_metadata={'brand': 'SKI-DOO' if i % 2 else 'LYNX'})
+            for i in range(120)
+        ]
+    
+    def _matcher(self, catalog, fuzzy_candidates):
+        matcher = BERTMatcher(config={'fuzzy_candidates': fuzzy_candidates, 'enable_exact_matching': False})
+        matcher.model = None
+        matcher.bert_available = False
+        matcher.load_catalog_data(catalog)
+        return matcher
+    
+    def test_trigram_index_built_for_fuzzy_fallback(self, catalog):
+        """Test load_catalog_data() indexes catalog search texts when BERT is unavailable"""
+        matcher = self._matcher(catalog, 10)
+        
+        assert len(matcher.trigram_index) == len(catalog)
+    
+    def test_blocked_results_match_full_scan(self, catalog):
+        """Test pruning to top-N candidates keeps the full-scan best match"""
+        products = [
+            ProductData(model_code="SUMX", brand="SKI-DOO", year=2026, malli="Summit X 7", moottori="850 E-TEC"),
+            ProductData(model_code="RENE", brand="LYNX", year=2026, malli="Renegade 2", moottori="900 ACE Turbo"),
+            ProductData(model_code="POLR", brand="POLARIS", year=2025, malli="Backcountry 4"),
+        ]
+        blocked = self._matcher(catalog, 10)
+        full = self._matcher(catalog, len(catalog))
+        
+        for product in products:
+            blocked_result = blocked.match_product(product, blocked.catalog_data)
+            full_result = full.match_product(product, full.catalog_data)
+            
+            assert blocked_result.match_details['catalog_search_text'] == full_result.match_details['catalog_search_text']
+            assert blocked_result.confidence_score == pytest.approx(full_result.confidence_score)
+    
+    def test_fuzzy_top_k_ranked(self, catalog):
+        """Test the fuzzy fallback records ranked candidates with catalog keys"""
+        matcher = self._matcher(catalog, 10)
+        product = ProductData(model_code="SUMX", brand="SKI-DOO", year=2026, malli="Summit X 7", moottori="850 E-TEC")
+        
+        result = matcher.match_top_k([product], k=3)[0]
+        top = result.match_details['top_k']
+        
+        assert len(top) == 3
+        assert [score for _, score in top] == sorted((score for _, score in top), reverse=True)
+        assert top[0][1] == result.confidence_score
+        best = next(entry for entry in catalog if entry.model_family == top[0][0])
+        assert matcher._create_catalog_search_text(best) == result.match_details['catalog_search_text']
+    
+    def test_small_pool_is_scanned_fully(self, catalog):
+        """Test no pruning happens when the brand pool fits in fuzzy_candidates"""
+        matcher = self._matcher(catalog[:8], 10)
+        product = ProductData(model_code="SUMX", brand="SKI-DOO", year=2026, malli="Summit X")
+        
+        assert matcher._fuzzy_candidates(product, matcher._create_product_search_text(product)) is None
+
+
+class TestParallelMatching:
+    """Test match_products() across worker processes"""
+    
+    @pytest.fixture
+    def catalog(self):
+        families = ["Summit X", "MXZ X-RS", "Renegade", "Expedition SE", "Backcountry", "Freeride"]
+        return [
+            CatalogData(model_family=f"{families[i % 6]} {i}", available_engines=["850 E-TEC"],
+                        extraction_metadata={'brand': 'SKI-DOO' if i % 2 else 'LYNX'})
+            for i in range(60)
+        ]
+    
+    @pytest.fixture
+    def products(self):
+        families = ["Summit X", "Renegade", "Backcountry", "Unknown"]
+        return [
+            ProductData(model_code=f"P{i:03d}", brand="SKI-DOO" if i % 3 else "LYNX", year=2026,
+                        malli=f"{families[i % 4]} {i % 60}", moottori="850 E-TEC")
+            for i in range(BERTMatcher.PARALLEL_MIN_PRODUCTS + 7)
+        ]
+    
+    def _matcher(self, catalog, worker_count):
+        matcher = BERTMatcher(config={'worker_count': worker_count, 'worker_chunk_size': 10})
+        matcher.model = None
+        matcher.bert_available = False
+        matcher.load_catalog_data(catalog)
+        return matcher
+    
+    def test_parallel_results_match_sequential(self, catalog, products):
+        """Test worker results keep input order and resolve to the parent's objects"""
+        sequential = self._matcher(catalog, 1).match_products(products)
+        matcher = self._matcher(catalog, 2)
+        parallel = matcher.match_products(products)
+        
+        assert len(parallel) == len(products)
+        for product, expected, result in zip(products, sequential, parallel):
+            assert result.product_data is product
+            assert result.matched == expected.matched
+            assert result.confidence_score == pytest.approx(expected.confidence_score)
+            if result.matched:
+                assert result.catalog_data is matcher.catalog_data[catalog.index(expected.catalog_data)]
+    
+    def test_worker_stats_are_merged(self, catalog, products):
+        """Test per-worker counts add up in the matcher's stats"""
+        sequential = self._matcher(catalog, 1)
+        sequential.match_products(products)
+        matcher = self._matcher(catalog, 2)
+        matcher.match_products(products)
+        
+        stats = matcher.get_stats()
+        assert stats.total_processed == len(products)
+        assert stats.successful == sequential.get_stats().successful
+        assert stats.successful + stats.failed == len(products)
+        assert stats.metadata['match_paths'] == sequential.get_stats().metadata['match_paths']
+        assert stats.metadata['workers'] == 2
+    
+    def test_small_batches_stay_in_process(self, catalog, products):
+        """Test batches below PARALLEL_MIN_PRODUCTS skip the process pool"""
+        matcher = self._matcher(catalog, 2)
+        
+        with patch.object(matcher, '_match_parallel') as parallel:
+            matcher.match_products(products[:5])
+        
+        parallel.assert_not_called()
+
+    
+    @pytest.mark.parametrize("backend, bert_available, threads", [
+        ('torch', True, [1]), ('torch_int8', True, [1]), ('onnx', True, []), ('torch', False, []),
+    ])
+    def test_workers_limit_torch_threads(self, catalog, backend, bert_available, threads):
+        """Test worker processes run torch encoders single-threaded"""
+        from pipeline.stage2_matching.base_matcher import _init_match_worker
+        
+        matcher = self._matcher(catalog, 2)
+        matcher.encoder_backend = backend
+        matcher.bert_available = bert_available
+        torch = Mock()
+        
+        with patch.dict('sys.modules', {'torch': torch}):
+            _init_match_worker({'matcher': matcher, 'products': []})
+        
+        assert [call.args[0] for call in torch.set_num_threads.call_args_list] == threads
+        assert matcher.worker_count == 1
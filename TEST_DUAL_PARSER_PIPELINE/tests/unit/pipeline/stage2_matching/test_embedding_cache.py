@@ -0,0 +1,157 @@
+"""
+Unit tests for the persistent embedding cache
+Tests EmbeddingCache storage, expiry and memory-mapped warm starts
+"""
+
+import json
+import time
+import pytest
+import numpy as np
+
+from pipeline.stage2_matching.embedding_cache import EmbeddingCache
+
+
+MODEL = 'all-MiniLM-L6-v2'
+
+
+def make_embeddings(count, dim=8, seed=0):
+    rng = np.random.default_rng(seed)
+    return rng.standard_normal((count, dim)).astype(np.float32)
+
+
+class TestEmbeddingCacheStorage:
+    """Test storing and looking up embeddings"""
+
+    def test_cold_cache_reports_all_missing(self, tmp_path):
+        """Test an empty cache returns no matrix and every index as missing"""
+        cache = EmbeddingCache(tmp_path, MODEL)
+
+        embeddings, missing = cache.lookup(['summit x', 'mxz'])
+
+        assert embeddings is None
+        assert missing == [0, 1]
+
+    def test_warm_start_is_memory_mapped(self, tmp_path):
+        """Test a new cache instance serves a full hit as a read-only memmap"""
+        texts = ['summit x 850 etec', 'mxz xrs 600r etec', 'rave re']
+        stored = make_embeddings(3)
+        EmbeddingCache(tmp_path, MODEL).store(texts, stored)
+
+        embeddings, missing = EmbeddingCache(tmp_path, MODEL).lookup(texts)
+
+        assert missing == []
+        assert isinstance(embeddings, np.memmap)
+        assert not embeddings.flags.writeable
+        assert np.array_equal(embeddings, stored)
+
+    def test_partial_hit_and_whitespace_normalisation(self, tmp_path):
+        """Test hits are filled in and keys ignore whitespace differences"""
+        stored = make_embeddings(2)
+        cache = EmbeddingCache(tmp_path, MODEL)
+        cache.store(['summit x', 'rave re'], stored)
+
+        embeddings, missing = cache.lookup(['rave  re', 'expedition', ' summit x '])
+
+        assert missing == [1]
+        assert np.array_equal(embeddings[0], stored[1])
+        assert np.array_equal(embeddings[2], stored[0])
+
+    def test_store_appends_to_existing_entries(self, tmp_path):
+        """Test later stores keep earlier entries and leave one matrix file"""
+        cache = EmbeddingCache(tmp_path, MODEL)
+        first, second = make_embeddings(2, seed=1), make_embeddings(1, seed=2)
+        cache.store(['a', 'b'], first)
+        cache.store(['c'], second)
+
+        embeddings, missing = EmbeddingCache(tmp_path, MODEL).lookup(['a', 'b', 'c'])
+
+        assert missing == []
+        assert np.array_equal(embeddings, np.vstack([first, second]))
+        assert len(list(tmp_path.glob('*.npy'))) == 1
+
+    def test_model_name_isolates_entries(self, tmp_path):
+        """Test embeddings from another model are never returned"""
+        EmbeddingCache(tmp_path, MODEL).store(['summit x'], make_embeddings(1))
+
+        embeddings, missing = EmbeddingCache(tmp_path, 'all-mpnet-base-v2').lookup(['summit x'])
+
+        assert embeddings is None
+        assert missing == [0]
+
+    def test_float16_storage(self, tmp_path):
+        """Test float16 storage round-trips to float32 within half precision"""
+        stored = make_embeddings(4)
+        EmbeddingCache(tmp_path, MODEL, dtype='float16').store(list('abcd'), stored)
+
+        embeddings, missing = EmbeddingCache(tmp_path, MODEL, dtype='float16').lookup(list('abcd'))
+
+        assert missing == []
+        assert embeddings.dtype == np.float32
+        assert np.allclose(embeddings, stored, atol=1e-2)
+
+    def test_int8_storage(self, tmp_path):
+        """Test int8 storage keeps per-row scales and round-trips within quantisation error"""
+        stored = make_embeddings(4)
+        EmbeddingCache(tmp_path, MODEL, dtype='int8').store(list('abcd'), stored)
+
+        cache = EmbeddingCache(tmp_path, MODEL, dtype='int8')
+        embeddings, missing = cache.lookup(list('dcba'))
+
+        assert missing == []
+        assert cache._matrix.dtype == np.int8
+        assert np.allclose(embeddings, stored[::-1], atol=np.abs(stored).max() / 127)
+
+    def test_int8_store_keeps_existing_rows(self, tmp_path):
+        """Test appending to an int8 cache does not degrade earlier rows"""
+        cache = EmbeddingCache(tmp_path, MODEL, dtype='int8')
+        cache.store(['a'], make_embeddings(1, seed=1))
+        before, _ = cache.lookup(['a'])
+        cache.store(['b'], make_embeddings(1, seed=2))
+
+        after, _ = EmbeddingCache(tmp_path, MODEL, dtype='int8').lookup(['a'])
+
+        assert np.array_equal(before, after)
+
+    def test_invalid_dtype(self, tmp_path):
+        """Test unsupported storage dtypes are rejected"""
+        with pytest.raises(ValueError):
+            EmbeddingCache(tmp_path, MODEL, dtype='bfloat16')
+
+
+class TestEmbeddingCacheExpiry:
+    """Test cache_duration_hours expiry and recovery"""
+
+    def test_expired_entries_are_misses(self, tmp_path, monkeypatch):
+        """Test entries older than duration_hours are re-encoded and compacted"""
+        cache = EmbeddingCache(tmp_path, MODEL, duration_hours=1)
+        cache.store(['old'], make_embeddings(1))
+
+        later = time.time() + 2 * 3600
+        monkeypatch.setattr(time, 'time', lambda: later)
+
+        assert cache.lookup(['old']) == (None, [0])
+        cache.store(['new'], make_embeddings(1))
+        assert len(cache) == 1
+
+    def test_unreadable_index_is_ignored(self, tmp_path):
+        """Test a corrupt index degrades to a cold cache"""
+        cache = EmbeddingCache(tmp_path, MODEL)
+        cache.store(['summit x'], make_embeddings(1))
+        cache.index_path.write_text('{not json', encoding='utf-8')
+
+        embeddings, missing = EmbeddingCache(tmp_path, MODEL).lookup(['summit x'])
+
+        assert embeddings is None
+        assert missing == [0]
+
+    def test_index_records_model_and_dtype(self, tmp_path):
+        """Test the side index describes the matrix it points to"""
+        cache = EmbeddingCache(tmp_path, MODEL)
+        cache.store(['summit x'], make_embeddings(1, dim=5))
+
+        index = json.loads(cache.index_path.read_text(encoding='utf-8'))
+
+        assert index['model_name'] == MODEL
+        assert index['dtype'] == 'float32'
+        assert index['dim'] == 5
+        assert (tmp_path / index['matrix_file']).exists()
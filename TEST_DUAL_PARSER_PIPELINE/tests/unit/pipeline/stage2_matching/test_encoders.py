@@ -0,0 +1,118 @@
+"""
+Unit tests for stage 2 encoder backends
+Tests encoder loading per backend and embedding quantisation
+"""
+
+import sys
+import pytest
+import numpy as np
+from unittest.mock import MagicMock, patch
+
+from pipeline.stage2_matching.encoders import (
+    load_encoder, get_encoder, clear_encoders, encoder_id, quantize_embeddings, dequantize_embeddings
+)
+
+
+@pytest.fixture
+def embeddings():
+    rng = np.random.default_rng(3)
+    matrix = rng.standard_normal((50, 32)).astype(np.float32)
+    return matrix / np.linalg.norm(matrix, axis=1, keepdims=True)
+
+
+@pytest.fixture
+def sentence_transformers():
+    module = MagicMock()
+    clear_encoders()
+    with patch.dict(sys.modules, {'sentence_transformers': module}):
+        yield module
+    clear_encoders()
+
+
+class TestLoadEncoder:
+    """Test backend selection"""
+
+    def test_torch_backend(self, sentence_transformers):
+        """Test the default backend loads the float32 model"""
+        encoder = load_encoder('all-MiniLM-L6-v2')
+
+        sentence_transformers.SentenceTransformer.assert_called_once_with('all-MiniLM-L6-v2', device=None)
+        assert encoder is sentence_transformers.SentenceTransformer.return_value
+
+    def test_onnx_backend(self, sentence_transformers):
+        """Test the ONNX backend runs on CPU with an optional pre-exported file"""
+        load_encoder('all-MiniLM-L6-v2', 'onnx', onnx_model_file='onnx/model_qint8_avx512.onnx')
+
+        sentence_transformers.SentenceTransformer.assert_called_once_with(
+            'all-MiniLM-L6-v2', device='cpu', backend='onnx',
+            model_kwargs={'file_name': 'onnx/model_qint8_avx512.onnx'}
+        )
+
+    def test_shared_encoder(self, sentence_transformers):
+        """Test each model configuration is loaded once per process"""
+        first = get_encoder('all-MiniLM-L6-v2')
+        second = get_encoder('all-MiniLM-L6-v2')
+        get_encoder('all-MiniLM-L6-v2', 'onnx')
+
+        assert first is second
+        assert sentence_transformers.SentenceTransformer.call_count == 2
+
+    def test_failed_load_is_not_shared(self, sentence_transformers):
+        """Test a failed load is retried by the next caller"""
+        sentence_transformers.SentenceTransformer.side_effect = [OSError("offline"), MagicMock()]
+
+        with pytest.raises(OSError):
+            get_encoder('all-MiniLM-L6-v2')
+
+        assert get_encoder('all-MiniLM-L6-v2') is not None
+
+    def test_unknown_backend(self):
+        """Test unknown backends are rejected before loading anything"""
+        with pytest.raises(ValueError):
+            load_encoder('all-MiniLM-L6-v2', 'tensorrt')
+
+    def test_encoder_id_distinguishes_backends(self):
+        """Test cached embeddings from different backends never share keys"""
+        ids = {
+            encoder_id('all-MiniLM-L6-v2'),
+            encoder_id('all-MiniLM-L6-v2', 'torch_int8'),
+            encoder_id('all-MiniLM-L6-v2', 'onnx'),
+            encoder_id('all-MiniLM-L6-v2', 'onnx', 'onnx/model_qint8_avx512.onnx'),
+        }
+
+        assert len(ids) == 4
+        assert encoder_id('all-MiniLM-L6-v2') == 'all-MiniLM-L6-v2'
+
+
+class TestQuantization:
+    """Test float16/int8 embedding storage"""
+
+    @pytest.mark.parametrize("dtype,atol", [('float32', 0.0), ('float16', 1e-3), ('int8', 1e-2)])
+    def test_round_trip(self, embeddings, dtype, atol):
+        """Test dequantised embeddings stay within the dtype's error"""
+        stored, scales = quantize_embeddings(embeddings, dtype)
+
+        assert stored.dtype == np.dtype(dtype)
+        assert (scales is not None) == (dtype == 'int8')
+        assert np.allclose(dequantize_embeddings(stored, scales), embeddings, atol=atol)
+
+    def test_int8_preserves_ranking(self, embeddings):
+        """Test nearest neighbours are unchanged by int8 storage"""
+        stored, scales = quantize_embeddings(embeddings, 'int8')
+        queries = embeddings[:10]
+
+        exact = np.argmax(queries @ embeddings.T, axis=1)
+        quantized = np.argmax(queries @ dequantize_embeddings(stored, scales).T, axis=1)
+
+        assert np.array_equal(exact, quantized)
+
+    def test_zero_rows(self):
+        """Test all-zero rows quantise without division errors"""
+        stored, scales = quantize_embeddings(np.zeros((2, 4), dtype=np.float32), 'int8')
+
+        assert np.array_equal(dequantize_embeddings(stored, scales), np.zeros((2, 4)))
+
+    def test_unsupported_dtype(self, embeddings):
+        """Test unknown storage dtypes are rejected"""
+        with pytest.raises(ValueError):
+            quantize_embeddings(embeddings, 'int4')
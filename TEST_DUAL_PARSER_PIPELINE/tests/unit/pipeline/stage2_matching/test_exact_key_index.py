@@ -0,0 +1,122 @@
+"""
+Unit tests for the stage 2 exact-key pre-stage
+Tests ExactKeyIndex and the exact fast path in BERTMatcher
+"""
+
+import pytest
+
+from pipeline.stage2_matching import BERTMatcher
+from pipeline.stage2_matching.exact_key_index import ExactKeyIndex
+from core import ProductData, CatalogData, MatchType
+
+
+@pytest.fixture
+def catalog():
+    return [
+        CatalogData(model_family="Summit X", available_engines=["850 E-TEC", "850 E-TEC Turbo R"],
+                    extraction_metadata={'brand': 'Ski-Doo'}),
+        CatalogData(model_family="Rave RE", specifications={'package': 'Expert'},
+                    extraction_metadata={'brand': 'Lynx'}),
+        CatalogData(model_family="MXZ X-RS Competition", available_engines=["600R E-TEC"],
+                    extraction_metadata={'brand': 'Ski-Doo'}),
+        # Two entries share the same key
+        CatalogData(model_family="Expedition SE", extraction_metadata={'brand': 'Ski-Doo'}),
+        CatalogData(model_family="Expedition SE", extraction_metadata={'brand': 'Ski-Doo'}),
+    ]
+
+
+class TestExactKeyIndex:
+    """Test key construction and lookups"""
+
+    def test_unique_key_resolves(self, catalog):
+        """Test a product matching one entry's key is resolved to its position"""
+        index = ExactKeyIndex().build(catalog)
+        product = ProductData(model_code="SKDO", brand="SKI-DOO", year=2026,
+                              malli="summit x", moottori="850 E-TEC Turbo R")
+
+        position, key = index.lookup(product)
+
+        assert position == 0
+        assert key[0] == 'SKIDOO'
+
+    def test_ambiguous_key_is_not_resolved(self, catalog):
+        """Test keys owned by several entries are left for semantic matching"""
+        index = ExactKeyIndex().build(catalog)
+        product = ProductData(model_code="EXSE", brand="Ski-Doo", year=2026, malli="Expedition SE")
+
+        assert index.lookup(product) is None
+        assert len(index._ambiguous) == 1
+
+    def test_package_key(self, catalog):
+        """Test products resolve through the catalog package field"""
+        index = ExactKeyIndex().build(catalog)
+        product = ProductData(model_code="RAVE", brand="LYNX", year=2026, malli="Rave RE", paketti="Expert")
+
+        assert index.lookup(product)[0] == 1
+
+    def test_package_folded_into_family(self, catalog):
+        """Test the combined malli + paketti key matches catalog families that include the package"""
+        index = ExactKeyIndex().build(catalog)
+        product = ProductData(model_code="MXZC", brand="Ski-Doo", year=2026, malli="MXZ X-RS",
+                              paketti="Competition", moottori="600R E-TEC")
+
+        assert index.lookup(product)[0] == 2
+
+    def test_engine_and_brand_must_agree(self, catalog):
+        """Test a different engine or brand is not an exact hit"""
+        index = ExactKeyIndex().build(catalog)
+
+        assert index.lookup(ProductData(model_code="SKDO", brand="SKI-DOO", year=2026,
+                                        malli="Summit X", moottori="600R E-TEC")) is None
+        assert index.lookup(ProductData(model_code="SKDO", brand="LYNX", year=2026,
+                                        malli="Summit X", moottori="850 E-TEC")) is None
+
+    def test_product_without_family_has_no_keys(self):
+        """Test products without a model name never produce a key"""
+        assert ExactKeyIndex().product_keys(ProductData(model_code="NONE", brand="Ski-Doo", year=2026)) == []
+
+
+class TestExactFastPath:
+    """Test the exact pre-stage wired into BERTMatcher"""
+
+    def _matcher(self, catalog, **config):
+        matcher = BERTMatcher(config)
+        matcher.model = None
+        matcher.bert_available = False
+        matcher.load_catalog_data(catalog)
+        return matcher
+
+    def test_exact_hit_skips_semantic_matching(self, catalog):
+        """Test exact hits return EXACT results with full confidence"""
+        matcher = self._matcher(catalog)
+        product = ProductData(model_code="RAVE", brand="LYNX", year=2026, malli="Rave RE", paketti="Expert")
+
+        result = matcher.match_products([product])[0]
+
+        assert result.match_type == MatchType.EXACT
+        assert result.confidence_score == 1.0
+        assert result.catalog_data is catalog[1]
+        assert result.match_details['match_path'] == 'exact'
+
+    def test_path_fractions_recorded(self, catalog):
+        """Test stats metadata counts products per match path"""
+        matcher = self._matcher(catalog)
+        products = [
+            ProductData(model_code="RAVE", brand="LYNX", year=2026, malli="Rave RE", paketti="Expert"),
+            ProductData(model_code="EXSE", brand="Ski-Doo", year=2026, malli="Expedition SE"),
+        ]
+
+        matcher.match_products(products)
+
+        assert matcher.stats.metadata['match_paths']['exact'] == 1
+        assert matcher.stats.metadata['match_path_fractions']['exact'] == 0.5
+
+    def test_disabled_by_config(self, catalog):
+        """Test enable_exact_matching=False skips the pre-stage"""
+        matcher = self._matcher(catalog, enable_exact_matching=False)
+        product = ProductData(model_code="RAVE", brand="LYNX", year=2026, malli="Rave RE", paketti="Expert")
+
+        result = matcher.match_products([product])[0]
+
+        assert matcher.exact_index is None
+        assert result.match_type != MatchType.EXACT
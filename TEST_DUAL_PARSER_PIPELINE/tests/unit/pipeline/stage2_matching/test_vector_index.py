@@ -0,0 +1,140 @@
+"""
+Unit tests for stage 2 vector indexes
+Tests BruteForceIndex, IVFIndex and index persistence
+"""
+
+import pytest
+import numpy as np
+
+from pipeline.stage2_matching.vector_index import (
+    BruteForceIndex, IVFIndex, create_vector_index, load_vector_index
+)
+
+
+@pytest.fixture
+def embeddings():
+    rng = np.random.default_rng(7)
+    matrix = rng.standard_normal((400, 16)).astype(np.float32)
+    return matrix / np.linalg.norm(matrix, axis=1, keepdims=True)
+
+
+@pytest.fixture
+def queries(embeddings):
+    rng = np.random.default_rng(8)
+    matrix = embeddings[:20] + 0.05 * rng.standard_normal((20, 16)).astype(np.float32)
+    return matrix / np.linalg.norm(matrix, axis=1, keepdims=True)
+
+
+class TestBruteForceIndex:
+    """Test exact brute-force search"""
+
+    def test_search_matches_full_scan(self, embeddings, queries):
+        """Test top-k equals sorting every inner product"""
+        scores, ids = BruteForceIndex().build(embeddings).search(queries, k=5)
+
+        expected = np.argsort(-(queries @ embeddings.T), axis=1)[:, :5]
+        assert np.array_equal(ids, expected)
+        assert np.all(np.diff(scores, axis=1) <= 0)
+
+    def test_mask_restricts_candidates(self, embeddings, queries):
+        """Test masked rows are never returned and short results are padded"""
+        mask = np.zeros(len(embeddings), dtype=bool)
+        mask[[3, 10, 50]] = True
+
+        scores, ids = BruteForceIndex().build(embeddings).search(queries[:1], k=5, mask=mask)
+
+        assert set(ids[0][:3]) == {3, 10, 50}
+        assert list(ids[0][3:]) == [-1, -1]
+        assert np.all(np.isneginf(scores[0][3:]))
+
+    def test_ties_prefer_lower_ids(self):
+        """Test equal scores are ordered by catalog position"""
+        duplicated = np.tile(np.array([[1.0, 0.0]], dtype=np.float32), (4, 1))
+
+        _, ids = BruteForceIndex().build(duplicated).search(np.array([[1.0, 0.0]]), k=3)
+
+        assert list(ids[0]) == [0, 1, 2]
+
+
+class TestIVFIndex:
+    """Test the approximate inverted-file index"""
+
+    def test_full_probe_is_exact(self, embeddings, queries):
+        """Test probing every list reproduces brute-force results"""
+        exact_scores, exact_ids = BruteForceIndex().build(embeddings).search(queries, k=5)
+        ivf = IVFIndex(n_lists=10, n_probe=10).build(embeddings)
+
+        scores, ids = ivf.search(queries, k=5)
+
+        assert np.array_equal(ids, exact_ids)
+        assert np.allclose(scores, exact_scores, atol=1e-6)
+
+    def test_lists_partition_catalog(self, embeddings):
+        """Test every row lands in exactly one inverted list"""
+        ivf = IVFIndex(n_lists=20).build(embeddings)
+
+        assert ivf.list_offsets[-1] == len(embeddings)
+        assert sorted(ivf.list_ids) == list(range(len(embeddings)))
+
+    def test_default_list_count(self, embeddings):
+        """Test n_lists=0 uses sqrt(catalog size)"""
+        assert len(IVFIndex().build(embeddings).centroids) == 20
+
+    def test_partial_probe_recall(self, embeddings, queries):
+        """Test near-duplicate queries find their source row with few probes"""
+        _, ids = IVFIndex(n_lists=20, n_probe=3).build(embeddings).search(queries, k=1)
+
+        assert np.mean(ids[:, 0] == np.arange(20)) >= 0.9
+
+    def test_mask_outside_probed_lists_falls_back(self, embeddings, queries):
+        """Test a mask with no rows in the probed lists scans eligible rows"""
+        ivf = IVFIndex(n_lists=20, n_probe=1).build(embeddings)
+        probed = ivf.list_ids[ivf.list_offsets[0]:ivf.list_offsets[1]]
+        mask = np.ones(len(embeddings), dtype=bool)
+        mask[probed] = False
+
+        _, ids = ivf.search(embeddings[probed[:1]], k=3, mask=mask)
+
+        assert np.all(ids[0] >= 0)
+        assert not set(ids[0]) & set(probed)
+
+    def test_empty_catalog_rejected(self):
+        """Test building over no rows raises ValueError"""
+        with pytest.raises(ValueError):
+            IVFIndex().build(np.zeros((0, 4), dtype=np.float32))
+
+
+class TestVectorIndexPersistence:
+    """Test create/save/load helpers"""
+
+    @pytest.mark.parametrize("kind", ['brute_force', 'ivf'])
+    def test_save_load_round_trip(self, kind, embeddings, queries, tmp_path):
+        """Test a loaded index returns the same results as the saved one"""
+        index = create_vector_index(kind).build(embeddings)
+        index.fingerprint = 'catalog-v1'
+        index.save(tmp_path / 'index.npz')
+
+        loaded = load_vector_index(tmp_path / 'index.npz')
+
+        assert type(loaded) is type(index)
+        assert loaded.fingerprint == 'catalog-v1'
+        assert len(loaded) == len(embeddings)
+        assert np.array_equal(loaded.search(queries, k=4)[1], index.search(queries, k=4)[1])
+
+    def test_reconfigure_loaded_ivf(self, embeddings, tmp_path):
+        """Test a loaded IVF index takes the configured probe count and rejects another list count"""
+        index = IVFIndex(n_lists=10, n_probe=2).build(embeddings)
+        index.save(tmp_path / 'index.npz')
+        
+        loaded = load_vector_index(tmp_path / 'index.npz')
+        
+        assert loaded.reconfigure(n_lists=10, n_probe=5)
+        assert loaded.n_probe == 5
+        assert loaded.reconfigure(n_lists=0, n_probe=3)
+        assert not loaded.reconfigure(n_lists=12, n_probe=3)
+        assert BruteForceIndex().build(embeddings).reconfigure()
+    
+    def test_unknown_kind(self):
+        """Test unknown index names are rejected"""
+        with pytest.raises(ValueError):
+            create_vector_index('hnsw')
@@ -0,0 +1,77 @@
+"""
+Unit tests for the stage 3 business rule index
+Tests family detection priority, engine lookups and InternalValidator business rule warnings
+"""
+
+import pytest
+
+from pipeline.stage3_validation import InternalValidator
+from pipeline.stage3_validation.business_rules import BusinessRuleIndex, compile_family_detector
+from core import ProductData
+
+
+ENGINES = {'SUMMIT': ['600', '850'], 'LYNX RAVE': ['600', '850'], 'RAVE': ['900']}
+BRANDS = {'SKI-DOO': ['SUMMIT', 'MXZ'], 'LYNX': ['Rave', 'Ranger']}
+
+
+@pytest.fixture
+def index():
+    return BusinessRuleIndex().build(ENGINES, BRANDS)
+
+
+class TestBusinessRuleIndex:
+    """Test precomputed family and engine lookups"""
+
+    def test_first_listed_family_wins(self, index):
+        """Test families are reported in list order, not by position in the name"""
+        assert index.engine_family("RAVE LYNX RAVE RE") == 'LYNX RAVE'
+        assert index.engine_family("RAVE RE 600R") == 'RAVE'
+        assert index.engine_family("EXPEDITION SE") is None
+
+    def test_brand_families(self, index):
+        """Test brand families are matched case-insensitively and per brand"""
+        assert index.brand_family('LYNX', "RANGER 900 ACE") == 'Ranger'
+        assert index.brand_family('SKI-DOO', "RAVE RE") is None
+        assert index.brand_family('POLARIS', "SUMMIT X") is None
+
+    def test_engine_lookup(self, index):
+        """Test engine sizes are looked up by normalised family"""
+        assert index.engine_compatible('SUMMIT', '850')
+        assert index.engine_compatible('Lynx Rave', '600')
+        assert not index.engine_compatible('RAVE', '600')
+        assert not index.engine_compatible('EXPEDITION', '900')
+        assert index.engine_rule("LYNX RAVE RE") == ('LYNX RAVE', frozenset({'600', '850'}))
+        assert index.engine_rule("EXPEDITION SE") is None
+
+    def test_no_families(self):
+        """Test an empty family list detects nothing"""
+        assert compile_family_detector([])("SUMMIT X") is None
+        assert BusinessRuleIndex().build({}, {}).engine_family("SUMMIT X") is None
+
+
+class TestBusinessRuleValidation:
+    """Test InternalValidator business rules through the index"""
+
+    def test_incompatible_engine_warns(self):
+        """Test an engine size not listed for the family is reported"""
+        product = ProductData(model_code="EXPD", brand="SKI-DOO", year=2025, malli="Expedition SE",
+                              moottori="850 E-TEC", currency="RUB", market="RUSSIA")
+
+        result = InternalValidator()._validate_business_rules(product, None)
+
+        assert result.warnings == ["Unusual engine-model combination: 850 in EXPEDITION (typical: ['900'])"]
+
+    def test_compatible_engine_and_brand(self):
+        """Test a listed engine and brand family give no warnings"""
+        product = ProductData(model_code="SUMX", brand="SKI-DOO", year=2025, malli="Summit X",
+                              moottori="850 E-TEC", currency="RUB", market="RUSSIA")
+
+        assert InternalValidator()._validate_business_rules(product, None).warnings == []
+
+    def test_unusual_brand_model(self):
+        """Test a model outside the brand's families is reported"""
+        product = ProductData(model_code="LSUM", brand="LYNX", year=2025, malli="Summit X", currency="RUB", market="RUSSIA")
+
+        result = InternalValidator()._validate_business_rules(product, None)
+
+        assert result.warnings == ["Unusual brand-model combination: LYNX Summit X"]
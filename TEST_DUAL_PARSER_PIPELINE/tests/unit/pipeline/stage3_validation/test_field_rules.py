@@ -0,0 +1,102 @@
+"""
+Unit tests for the stage 3 columnar field rule engine
+Tests FieldRuleEngine against the row-wise InternalValidator field checks
+"""
+
+import pytest
+
+from pipeline.stage3_validation import InternalValidator, BaseValidator
+from pipeline.stage3_validation.field_rules import FieldRuleEngine
+from core import ProductData
+from core.catalog_join import CatalogJoinIndex
+
+
+@pytest.fixture
+def validator():
+    validator = InternalValidator()
+    validator.text_rules['malli'] = {
+        'min_length': 3,
+        'max_length': 24,
+        'required_words': ['x'],
+        'forbidden_words': ['polaris']
+    }
+    validator.numeric_rules['year']['allowed_values'] = [2024, 2025]
+    validator.field_engine = FieldRuleEngine(validator.price_rules, validator.text_rules, validator.numeric_rules)
+    return validator
+
+
+@pytest.fixture
+def products():
+    return [
+        ProductData(model_code="SKSX", brand="SKI-DOO", year=2025, malli="Summit X", price=150000.0, currency="EUR"),
+        ProductData(model_code="LTRA", brand="LYNX", year=2025, malli="Rave RE", price=50.0, currency="RUB"),
+        ProductData(model_code="MXZX", brand="POLARIS", year=2016, malli="Polaris X 850 with a long name", price=1500.5, currency="RUB"),
+        ProductData(model_code="EXPE", brand="SKI-DOO", year=2024, malli="mx", price=None, currency="USD"),
+        ProductData(model_code="GTSE", brand="BRP", year=2030, malli=None, price=20000000, currency="USD"),
+    ]
+
+
+class TestFieldRuleEngine:
+    """Test batch evaluation of field rules"""
+
+    def test_matches_row_wise_checks(self, validator, products):
+        """Test flagged rows carry the row-wise errors and warnings, in order"""
+        issues, unsupported = validator.field_engine.validate(products)
+
+        assert unsupported == set()
+        for row, product in enumerate(products):
+            expected = validator._validate_field_rules(product)
+            if not expected.errors and not expected.warnings:
+                assert row not in issues
+                continue
+            assert issues[row].success == expected.success
+            assert issues[row].errors == expected.errors
+            assert issues[row].warnings == expected.warnings
+
+    def test_only_rows_with_issues_materialised(self, validator, products):
+        """Test clean rows produce no ValidationResult"""
+        issues, _ = validator.field_engine.validate(products)
+
+        assert 0 not in issues
+        assert sorted(issues) == [1, 2, 3, 4]
+
+    def test_unrepresentable_rows_left_to_row_wise_checks(self, validator, products):
+        """Test values the columns cannot hold are reported, not guessed"""
+        products[0].price = "150000"
+        products[1].year = float('nan')
+        products[2].malli = 42
+
+        issues, unsupported = validator.field_engine.validate(products)
+
+        assert unsupported == {0, 1, 2}
+        assert sorted(issues) == [3, 4]
+
+    def test_empty_batch(self, validator):
+        """Test an empty batch has no issues"""
+        assert validator.field_engine.validate([]) == ({}, set())
+
+
+class TestBatchFieldValidation:
+    """Test InternalValidator batches use the columnar field checks"""
+
+    def test_batch_results_match_single_validation(self, validator, products):
+        """Test batch validation gives the same results as validating one by one"""
+        validator.model_validation_enabled = False
+        products[0].price = "not a price"
+
+        batch = validator._validate_sequential(products, CatalogJoinIndex())
+        single = BaseValidator._validate_sequential(validator, products, CatalogJoinIndex())
+
+        assert [(r.success, r.errors, r.warnings) for r in batch] == \
+            [(r.success, r.errors, r.warnings) for r in single]
+        assert validator._field_batch == {}
+
+    def test_field_validation_disabled(self, validator, products):
+        """Test disabled field validation skips the engine"""
+        validator.field_validation_enabled = False
+        validator.field_engine = None
+
+        results = validator._validate_sequential(products, CatalogJoinIndex())
+
+        assert len(results) == len(products)
+        assert not any("Price too low" in error for result in results for error in result.errors)
@@ -8,7 +8,7 @@ from unittest.mock import Mock, MagicMock, patch
 from datetime import datetime
 
 from pipeline.stage3_validation import InternalValidator
-from core import ProductData, ValidationResult, PipelineStats
+from core import DatabaseManager, ProductData, CatalogData, ValidationResult, PipelineStats
 from core.exceptions import ValidationError
 from tests.utils import performance_timer, data_validator
 from tests.fixtures.sample_data import SampleDataFactory
@@ -932,4 +932,228 @@ class TestValidationIntegration:
             assert result.matching_considered is True
         
         # High matching confidence should boost validation confidence
-        assert result.confidence_score >= 0.8
\ No newline at end of file
+        assert result.confidence_score >= 0.8
+
+
+class TestParallelValidation:
+    """Test validate_products() across worker processes"""
+    
+    @pytest.fixture
+    def catalog(self):
+        return [
+            CatalogData(model_family=family, available_engines=["850 E-TEC"])
+            for family in ["Summit X", "MXZ X-RS", "Rave RE", "Expedition SE"]
+        ]
+    
+    @pytest.fixture
+    def products(self):
+        models = ["Summit X", "Rave RE", "Expedtion SE", "Unknown Sled"]
+        return [
+            ProductData(model_code=f"P{i:03d}", brand="LYNX" if i % 2 else "SKI-DOO", year=2024 + i % 3,
+                        malli=models[i % 4], moottori="850 E-TEC", price=float(50000 + 1000 * i),
+                        currency="RUB" if i % 5 else "EUR")
+            for i in range(InternalValidator.PARALLEL_MIN_PRODUCTS + 7)
+        ]
+    
+    def test_parallel_results_match_sequential(self, catalog, products):
+        """Test worker results keep input order"""
+        sequential = InternalValidator(config={'worker_count': 1}).validate_products(products, catalog)
+        parallel = InternalValidator(config={'worker_count': 2, 'worker_chunk_size': 10}).validate_products(products, catalog)
+        
+        assert len(parallel) == len(products)
+        for expected, result in zip(sequential, parallel):
+            assert result.success == expected.success
+            assert result.errors == expected.errors
+            assert result.warnings == expected.warnings
+            assert result.confidence == pytest.approx(expected.confidence)
+    
+    def test_learnt_layer_order_used_by_workers(self, catalog, products):
+        """Test a run reordered from earlier telemetry gives the same results in workers"""
+        parallel = InternalValidator(config={'rule_reorder_interval': 10, 'worker_count': 2, 'worker_chunk_size': 10})
+        parallel.validate_products(products, catalog)
+        results = parallel.validate_products(products, catalog)
+        
+        sequential = InternalValidator(config={'worker_count': 1})
+        sequential.apply_rule_order(parallel.export_rule_order())
+        expected = sequential.validate_products(products, catalog)
+        
+        assert parallel.rule_telemetry.order != InternalValidator.VALIDATION_LAYERS
+        assert [result.errors for result in results] == [result.errors for result in expected]
+    
+    def test_worker_stats_are_merged(self, catalog, products):
+        """Test per-worker counts add up in the validator's stats"""
+        sequential = InternalValidator(config={'worker_count': 1})
+        sequential.validate_products(products, catalog)
+        validator = InternalValidator(config={'worker_count': 2, 'worker_chunk_size': 10})
+        validator.validate_products(products, catalog)
+        
+        stats = validator.get_stats()
+        assert stats.total_processed == len(products)
+        assert stats.successful == sequential.get_stats().successful
+        assert stats.successful + stats.failed == len(products)
+        assert stats.metadata['workers'] == 2
+    
+    def test_small_batches_stay_in_process(self, products):
+        """Test batches below PARALLEL_MIN_PRODUCTS skip the process pool"""
+        validator = InternalValidator(config={'worker_count': 2})
+        
+        with patch.object(validator, '_validate_parallel') as parallel:
+            results = validator.validate_products(products[:10])
+        
+        parallel.assert_not_called()
+        assert len(results) == 10
+
+
+class TestValidationMemo:
+    """Test reuse of stored results for unchanged products"""
+    
+    @pytest.fixture
+    def memo(self, tmp_path):
+        return DatabaseManager(str(tmp_path / "memo.db"))
+    
+    @pytest.fixture
+    def products(self):
+        return [
+            ProductData(model_code="LTRA", brand="LYNX", year=2025, malli="Rave RE 600R E-TEC", price=1500000.0, currency="RUB"),
+            ProductData(model_code="SKSX", brand="SKI-DOO", year=2025, malli="Summit X", price=50.0),
+        ]
+    
+    def _validator(self, memo, **config):
+        validator = InternalValidator(config=config)
+        validator.result_memo = memo
+        return validator
+    
+    def test_unchanged_products_skip_rules(self, memo, products):
+        """Test a second run reuses the stored results without validating"""
+        first = self._validator(memo).validate_products(products)
+        validator = self._validator(memo)
+        
+        with patch.object(validator, 'validate_product') as validate_product:
+            second = validator.validate_products(products)
+        
+        validate_product.assert_not_called()
+        assert [result.success for result in second] == [result.success for result in first]
+        assert [result.errors for result in second] == [result.errors for result in first]
+        assert all(result.metadata['memoized'] for result in second)
+        assert validator.get_stats().metadata['memo_hits'] == 2
+        assert validator.get_stats().successful == sum(result.success for result in first)
+    
+    def test_changed_product_is_revalidated(self, memo, products):
+        """Test only products whose validated fields changed run the rules"""
+        self._validator(memo).validate_products(products)
+        products[1].price = 500000.0
+        validator = self._validator(memo)
+        
+        with patch.object(validator, 'validate_product', wraps=validator.validate_product) as validate_product:
+            validator.validate_products(products)
+        
+        assert [call.args[0] for call in validate_product.call_args_list] == [products[1]]
+    
+    def test_rule_change_invalidates_memo(self, memo, products):
+        """Test a different rule set validates again"""
+        validator = self._validator(memo)
+        validator.validate_products(products)
+        changed = self._validator(memo, strict_mode=False)
+        
+        with patch.object(changed, 'validate_product', wraps=changed.validate_product) as validate_product:
+            changed.validate_products(products)
+        
+        assert changed.ruleset_version != validator.ruleset_version
+        assert validate_product.call_count == 2
+    
+    def test_equal_products_get_separate_results(self, memo, products):
+        """Test memo hits for products with equal content are distinct objects"""
+        self._validator(memo).validate_products(products)
+        duplicate = ProductData(model_code="LTRA", brand="LYNX", year=2025, malli="Rave RE 600R E-TEC",
+                                price=1500000.0, currency="RUB")
+        
+        first, second = self._validator(memo).validate_products([products[0], duplicate])
+        first.metadata['note'] = 'changed'
+        
+        assert first is not second
+        assert 'note' not in second.metadata
+        assert second.metadata['memoized'] is True
+    
+    @pytest.mark.parametrize("change", [
+        lambda validator: validator.brp_models.append("BRP LYNX Shredder DS 850 E-TEC"),
+        lambda validator: validator.price_rules.update(min_price=1000),
+        lambda validator: validator.engine_compatibility['SUMMIT'].append('900'),
+    ])
+    def test_ruleset_version_tracks_rules(self, change):
+        """Test models, field rules and business rules all feed the rule-set version"""
+        validator = InternalValidator()
+        version = validator.ruleset_version
+        assert InternalValidator().ruleset_version == version
+        
+        change(validator)
+        
+        assert validator._ruleset_hash() != version
+
+
+class TestStreamingValidation:
+    """Test iter_validate() over lazily produced products"""
+    
+    @staticmethod
+    def product_stream(count):
+        models = ["Summit X", "Rave RE", "Polaris RMK"]
+        for i in range(count):
+            yield ProductData(model_code=f"S{i:03d}", brand="LYNX" if i % 2 else "SKI-DOO", year=2025,
+                              malli=models[i % 3], price=float(50000 + 100000 * (i % 3)), currency="RUB")
+    
+    def test_matches_validate_products(self):
+        """Test streamed pairs equal the batch results, in input order"""
+        products = list(self.product_stream(25))
+        expected = InternalValidator().validate_products(products)
+        
+        validator = InternalValidator()
+        pairs = list(validator.iter_validate(iter(products), batch_size=7))
+        
+        assert [product for product, _ in pairs] == products
+        assert [(r.success, r.errors, r.warnings) for _, r in pairs] == \
+            [(r.success, r.errors, r.warnings) for r in expected]
+        assert validator.get_stats().total_processed == 25
+    
+    def test_consumes_input_lazily(self):
+        """Test products are drawn one batch at a time"""
+        drawn = []
+        
+        def products():
+            for product in self.product_stream(100):
+                drawn.append(product)
+                yield product
+        
+        stream = InternalValidator().iter_validate(products(), batch_size=10)
+        next(stream)
+        
+        assert len(drawn) == 10
+        stream.close()
+    
+    def test_running_summary(self):
+        """Test the summary accumulates while streaming"""
+        from pipeline.stage3_validation.summary import ValidationSummary
+        
+        validator = InternalValidator()
+        summary = ValidationSummary()
+        results = [result for _, result in validator.iter_validate(self.product_stream(30), summary=summary, batch_size=8)]
+        
+        assert summary.to_dict() == validator.get_validation_summary(results)
+        assert summary.total == 30
+    
+    def test_parallel_batches_share_one_pool(self):
+        """Test every parallel batch of a stream goes to the same worker pool"""
+        from core.parallel import WorkerPool
+        
+        products = list(self.product_stream(330))
+        expected = InternalValidator(config={'worker_count': 1}).validate_products(products)
+        
+        validator = InternalValidator(config={'worker_count': 2})
+        with patch('pipeline.stage3_validation.base_validator.WorkerPool', wraps=WorkerPool) as pool_class, \
+                patch.object(WorkerPool, 'map', autospec=True, side_effect=WorkerPool.map) as pool_map:
+            pairs = list(validator.iter_validate(iter(products), batch_size=110))
+        
+        assert pool_class.call_count == 1
+        assert pool_map.call_count == 3
+        assert len({id(call.args[0]) for call in pool_map.call_args_list}) == 1
+        assert [(r.success, r.errors, r.warnings) for _, r in pairs] == \
+            [(r.success, r.errors, r.warnings) for r in expected]
+        assert validator.get_stats().metadata['workers'] == 2
@@ -0,0 +1,94 @@
+"""
+Unit tests for the stage 3 BRP model index
+Tests ModelIndex layers and their use in InternalValidator
+"""
+
+import pytest
+from difflib import SequenceMatcher
+
+from pipeline.stage3_validation import InternalValidator
+from pipeline.stage3_validation.model_index import ModelIndex
+from core import ProductData
+
+
+MODELS = [
+    "BRP Ski-Doo Summit X 850 E-TEC",
+    "BRP Ski-Doo MXZ TNT 600R E-TEC",
+    "BRP Ski-Doo Expedition SE 900 ACE",
+    "BRP LYNX Rave RE 600R E-TEC",
+    "BRP LYNX 69 Ranger 900 ACE",
+]
+PATTERNS = [r'.*SUMMIT.*', r'.*MXZ.*', r'.*LYNX.*RAVE.*', r'.*RAVE.*']
+
+
+def full_scan(models, model_text):
+    """Reference fuzzy lookup scoring every model"""
+    best = max(models, key=lambda model: SequenceMatcher(None, model_text.upper(), model.upper()).ratio())
+    return best, SequenceMatcher(None, model_text.upper(), best.upper()).ratio()
+
+
+class TestModelIndex:
+    """Test the exact, pattern and fuzzy layers"""
+
+    def test_exact_lookup_is_case_sensitive(self):
+        """Test exact hits require the listed spelling"""
+        index = ModelIndex().build(MODELS, PATTERNS)
+
+        assert "BRP LYNX Rave RE 600R E-TEC" in index
+        assert "BRP LYNX RAVE RE 600R E-TEC" not in index
+
+    def test_first_listed_pattern_wins(self):
+        """Test the combined regex reports the first matching pattern"""
+        index = ModelIndex().build(MODELS, PATTERNS)
+
+        assert index.match_pattern("BRP LYNX RAVE 850") == r'.*LYNX.*RAVE.*'
+        assert index.match_pattern("RAVE 850") == r'.*RAVE.*'
+        assert index.match_pattern("BRP POLARIS RMK") is None
+        assert ModelIndex().build(MODELS, []).match_pattern("BRP SUMMIT") is None
+
+    @pytest.mark.parametrize("fuzzy_candidates", [1, 2, 20])
+    def test_fuzzy_matches_full_scan(self, fuzzy_candidates):
+        """Test blocked fuzzy lookups find the same model as scoring every model"""
+        index = ModelIndex(fuzzy_candidates).build(MODELS, PATTERNS)
+
+        for query in ["BRP Ski-Doo Sumit X 850 ETEC", "BRP LYNX Rave RE 600 E-TEC", "BRP Ski-Doo Expedition 900"]:
+            model, confidence = full_scan(MODELS, query)
+            match = index.best_match(query)
+
+            assert match['model'] == model
+            assert match['confidence'] == pytest.approx(confidence)
+
+    def test_fuzzy_threshold(self):
+        """Test no model is returned below the minimum confidence"""
+        index = ModelIndex().build(MODELS, PATTERNS)
+
+        assert index.best_match("BRP Ski-Doo Summit X 850 E-TEC", min_confidence=0.99) is not None
+        assert index.best_match("Polaris Indy", min_confidence=0.6) is None
+        assert index.best_match("xyz") is None
+
+
+class TestInternalValidatorModelLookup:
+    """Test InternalValidator uses the model index built with its rules"""
+
+    @pytest.fixture
+    def validator(self):
+        return InternalValidator()
+
+    def test_index_covers_loaded_models(self, validator):
+        """Test the index is built from the loaded model list"""
+        assert len(validator.model_index) == len(validator.brp_models)
+        assert all(model in validator.model_index for model in validator.brp_models)
+
+    @pytest.mark.parametrize("brand,malli,match_type", [
+        ("LYNX", "Rave RE 600R E-TEC", 'exact'),
+        ("SKI-DOO", "MXZ Blizzard", 'pattern'),
+        ("SKI-DOO", "Expedtion SE 900 ACE", 'fuzzy'),
+    ])
+    def test_model_match_types(self, validator, brand, malli, match_type):
+        """Test each layer resolves the product it is responsible for"""
+        product = ProductData(model_code="SKDO", brand=brand, year=2025, malli=malli)
+
+        result = validator._validate_model_against_catalog(product)
+
+        assert result.success
+        assert result.metadata['model_match_type'] == match_type
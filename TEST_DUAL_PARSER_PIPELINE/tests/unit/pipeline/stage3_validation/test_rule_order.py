@@ -0,0 +1,162 @@
+"""
+Unit tests for stage 3 rule telemetry and adaptive ordering
+Tests RuleTelemetry ranking and the strict-mode short-circuit in InternalValidator
+"""
+
+import pytest
+
+from pipeline.stage3_validation import InternalValidator
+from pipeline.stage3_validation.rule_order import RuleTelemetry
+from core import ProductData
+
+
+RULES = ('cheap_rare', 'costly_common', 'cheap_common', 'never_fails')
+
+
+def record(telemetry, rule, calls, seconds, failures):
+    for i in range(calls):
+        telemetry.record(rule, seconds, i < failures)
+
+
+class TestRuleTelemetry:
+    """Test telemetry counters and ordering"""
+
+    def test_cheap_high_rejection_rules_run_first(self):
+        """Test rules are ordered by cost per rejection"""
+        telemetry = RuleTelemetry(RULES, reorder_interval=0)
+        record(telemetry, 'cheap_rare', 100, 0.001, 5)
+        record(telemetry, 'costly_common', 100, 0.010, 50)
+        record(telemetry, 'cheap_common', 100, 0.001, 50)
+        record(telemetry, 'never_fails', 100, 0.001, 0)
+
+        assert telemetry.reorder() == ['cheap_common', 'cheap_rare', 'costly_common', 'never_fails']
+
+    def test_reorders_only_between_runs(self):
+        """Test the order changes at the first run start after reorder_interval products"""
+        telemetry = RuleTelemetry(RULES, reorder_interval=3)
+        assert not telemetry.begin_run()
+        for product in range(3):
+            telemetry.record('never_fails', 0.001, False)
+            telemetry.record('cheap_common', 0.001, True)
+            telemetry.finish_product()
+            assert telemetry.order == RULES
+
+        assert telemetry.begin_run()
+        # Rules never evaluated keep their relative order at the end
+        assert telemetry.order == ('cheap_common', 'never_fails', 'cheap_rare', 'costly_common')
+        assert not telemetry.begin_run()
+
+    def test_fixed_order_when_disabled(self):
+        """Test a reorder interval of 0 keeps the original order"""
+        telemetry = RuleTelemetry(RULES, reorder_interval=0)
+        for _ in range(10):
+            telemetry.record('cheap_common', 0.001, True)
+            telemetry.finish_product()
+
+        assert not telemetry.begin_run()
+        assert telemetry.order == RULES
+
+    def test_set_order_requires_every_rule(self):
+        """Test a given order must be a permutation of the rules"""
+        telemetry = RuleTelemetry(RULES)
+        telemetry.set_order(RULES[::-1])
+
+        assert telemetry.order == RULES[::-1]
+        with pytest.raises(ValueError):
+            telemetry.set_order(RULES[:2])
+
+    def test_merge_adds_worker_counters(self):
+        """Test exported counters add up when merged"""
+        telemetry = RuleTelemetry(RULES)
+        worker = RuleTelemetry(RULES)
+        record(telemetry, 'cheap_common', 4, 0.001, 2)
+        record(worker, 'cheap_common', 6, 0.001, 1)
+        worker.skip('never_fails')
+        worker.finish_product()
+
+        telemetry.merge(worker.export())
+
+        assert telemetry.order == RULES
+        summary = telemetry.summary()
+        assert summary['products'] == 1
+        assert summary['rules']['cheap_common']['calls'] == 10
+        assert summary['rules']['cheap_common']['failures'] == 3
+        assert summary['rules']['never_fails']['skipped'] == 1
+
+
+class TestStrictModeShortCircuit:
+    """Test InternalValidator layer ordering and short-circuit"""
+
+    @pytest.fixture
+    def low_price(self):
+        return ProductData(model_code="LTRA", brand="LYNX", year=2025, malli="Rave RE 600R E-TEC",
+                           price=50.0, currency="RUB")
+
+    @pytest.fixture
+    def unknown_model(self):
+        return ProductData(model_code="UNKN", brand="SKI-DOO", year=2025, malli="Polaris RMK Khaos",
+                           price=50.0, currency="RUB")
+
+    def test_strict_mode_stops_at_first_failing_layer(self, unknown_model):
+        """Test later layers are skipped once a layer fails"""
+        validator = InternalValidator(config={'strict_mode': True, 'rule_reorder_interval': 0})
+
+        result = validator.validate_product(unknown_model)
+
+        assert result.success is False
+        assert any("not found in BRP catalog" in error for error in result.errors)
+        assert not any("Price too low" in error for error in result.errors)
+        assert result.metadata['short_circuited'] == ['field_rules', 'business_rules']
+
+    def test_lenient_mode_runs_every_layer(self, unknown_model):
+        """Test all layers run without strict mode"""
+        validator = InternalValidator(config={'strict_mode': False})
+
+        result = validator.validate_product(unknown_model)
+
+        assert result.metadata['short_circuited'] == []
+        assert any("not found in BRP catalog" in error for error in result.errors)
+        assert any("Price too low" in error for error in result.errors)
+
+    def test_high_rejection_layer_moves_first(self, low_price):
+        """Test a layer rejecting every product is tried first in the next run"""
+        validator = InternalValidator(config={'strict_mode': True, 'rule_reorder_interval': 50})
+        validator.validate_products([low_price] * 50)
+
+        result, = validator.validate_products([low_price])
+
+        assert validator.rule_telemetry.order[0] == 'field_rules'
+        assert result.errors == ["Price too low: 50.0 (minimum: 100000)"]
+        assert set(result.metadata['short_circuited']) == {'required_fields', 'model_catalog', 'business_rules'}
+
+    def test_order_fixed_within_a_run(self, low_price, unknown_model):
+        """Test earlier products of a run do not change the errors reported for later ones"""
+        alone, = InternalValidator().validate_products([unknown_model])
+
+        results = InternalValidator().validate_products([low_price] * 300 + [unknown_model])
+
+        assert results[-1].errors == alone.errors
+
+    def test_ruleset_version_tracks_order(self, low_price):
+        """Test memoised results are keyed by the layer order of the run"""
+        validator = InternalValidator(config={'strict_mode': True, 'rule_reorder_interval': 50})
+        version = validator.ruleset_version
+        validator.validate_products([low_price] * 50)
+        assert validator.ruleset_version == version
+
+        validator.validate_products([low_price])
+
+        assert validator.ruleset_version != version
+        assert validator.ruleset_version == validator._ruleset_hash()
+
+    def test_statistics_expose_rule_timings(self, low_price):
+        """Test per-layer telemetry is reported in get_validation_statistics"""
+        validator = InternalValidator(config={'strict_mode': False})
+        validator.validate_product(low_price)
+
+        telemetry = validator.get_validation_statistics()['rule_telemetry']
+
+        assert telemetry['order'] == list(InternalValidator.VALIDATION_LAYERS)
+        assert telemetry['rules']['field_rules']['calls'] == 1
+        assert telemetry['rules']['field_rules']['failure_rate'] == 1.0
+        assert telemetry['rules']['model_catalog']['mean_ms'] >= 0.0
@@ -0,0 +1,61 @@
+"""
+Unit tests for the stage 3 running validation summary
+Tests TopKCounter bounds and ValidationSummary against the list-based summary
+"""
+
+from collections import Counter
+
+from pipeline.stage3_validation import InternalValidator
+from pipeline.stage3_validation.summary import TopKCounter, ValidationSummary
+from core import ValidationResult
+
+
+def results():
+    return [
+        ValidationResult(success=True, confidence=1.0),
+        ValidationResult(success=False, errors=["Price too low", "Model not found"], confidence=0.0),
+        ValidationResult(success=True, warnings=["Currency mismatch"], confidence=0.9),
+        ValidationResult(success=False, errors=["Price too low"], warnings=["Currency mismatch"], confidence=0.0),
+    ]
+
+
+class TestTopKCounter:
+    """Test the bounded issue counter"""
+
+    def test_exact_within_capacity(self):
+        """Test counts match Counter while the keys fit"""
+        issues = [f"issue {i % 7}" for i in range(100)] + ["issue 3"] * 5
+        counter = TopKCounter(capacity=4)
+        counter.update(issues)
+
+        assert counter.most_common(3) == Counter(issues).most_common(3)
+
+    def test_memory_is_bounded(self):
+        """Test the table never exceeds twice the capacity"""
+        counter = TopKCounter(capacity=10)
+        for i in range(1000):
+            counter.add("frequent")
+            counter.add(f"unique {i}")
+            assert len(counter) <= 20
+
+        assert counter.most_common(1) == [("frequent", 1000)]
+        assert counter.pruned_keys > 0
+
+
+class TestValidationSummary:
+    """Test running summaries"""
+
+    def test_matches_validator_summary(self):
+        """Test the accumulated summary equals get_validation_summary"""
+        summary = ValidationSummary()
+        for result in results():
+            summary.add(result)
+
+        expected = InternalValidator().get_validation_summary(results())
+        assert summary.to_dict() == expected
+        assert expected['common_errors'][0] == {'issue': "Price too low", 'count': 2}
+        assert expected['with_warnings'] == 2
+
+    def test_empty_summary(self):
+        """Test no results give an empty summary"""
+        assert ValidationSummary().to_dict() == {}
@@ -0,0 +1,245 @@
+"""
+Unit tests for the Avito internal validator
+Tests ModelLookup suggestions, the compiled constraint artefact cache and feed validation
+"""
+
+import json
+import logging
+import os
+from collections import Counter
+from unittest.mock import Mock
+
+import pytest
+
+from avito_internal_validator import AvitoInternalValidator, ModelLookup
+
+
+MODELS = ["Ski-Doo MXZ X 600R E-TEC", "Ski-Doo Summit X 850 E-TEC", "Lynx Rave RE 600R E-TEC", "MXZ", "GT"]
+
+FIELDS = {
+    'fields': [
+        {'tag': 'Price', 'label': 'Цена', 'descriptions': 'Цена в рублях, только число',
+         'content': [{'required': True, 'field_type': 'input'}]},
+        {'tag': 'Title', 'label': 'Название', 'descriptions': 'Длина до 50 символов'},
+    ]
+}
+
+
+def scan_similar(models, value):
+    """Suggestion of the list scan ModelLookup replaced"""
+    similar = [m for m in models if value.lower() in m.lower() or m.lower() in value.lower()]
+    return similar[0] if similar else None
+
+
+@pytest.fixture
+def sources(tmp_path, monkeypatch):
+    """Source files in tmp_path and an empty in-process artefact cache"""
+    models_file = tmp_path / "models.json"
+    constraints_file = tmp_path / "fields.json"
+    models_file.write_text(json.dumps({'brp_models': MODELS}), encoding='utf-8')
+    constraints_file.write_text(json.dumps({'raw_data': FIELDS}), encoding='utf-8')
+
+    monkeypatch.setattr(AvitoInternalValidator, 'models_file', models_file)
+    monkeypatch.setattr(AvitoInternalValidator, 'constraints_file', constraints_file)
+    monkeypatch.setattr(AvitoInternalValidator, '_compiled', {})
+    return models_file, constraints_file
+
+
+class TestModelLookup:
+    """Test indexed model suggestions"""
+
+    @pytest.mark.parametrize("value", [
+        "Ski-Doo MXZ", "ski-doo mxz x 600r e-tec 2025", "LYNX", "mx", "GT", "", "Polaris RMK",
+    ])
+    def test_first_similar_matches_list_scan(self, value):
+        """Test suggestions equal the first match of a scan over the model list"""
+        assert ModelLookup(MODELS).first_similar(value) == scan_similar(MODELS, value)
+
+    def test_trigrams_reused(self):
+        """Test a lookup built from stored trigram postings suggests the same models"""
+        stored = json.loads(json.dumps(ModelLookup(MODELS).trigrams))
+
+        assert ModelLookup(MODELS, stored).first_similar("Summit") == "Ski-Doo Summit X 850 E-TEC"
+
+    def test_membership_is_exact(self):
+        """Test membership is case-sensitive like the model list"""
+        lookup = ModelLookup(MODELS)
+
+        assert "MXZ" in lookup
+        assert "mxz" not in lookup
+        assert len(lookup) == len(MODELS)
+
+
+class TestCompiledConstraints:
+    """Test the compiled artefact cache"""
+
+    def test_no_disk_cache_by_default(self, sources, tmp_path):
+        """Test cache_dir=None parses the sources and writes nothing"""
+        before = set(tmp_path.iterdir())
+
+        validator = AvitoInternalValidator()
+
+        assert validator.artefact_path is None
+        assert validator.brp_models == tuple(MODELS)
+        assert validator.field_constraints['Price']['required'] is True
+        assert set(tmp_path.iterdir()) == before
+
+    def test_artefact_reused_from_disk(self, sources, tmp_path, monkeypatch):
+        """Test a second process loads the artefact instead of parsing the sources"""
+        AvitoInternalValidator(cache_dir=str(tmp_path / "cache"))
+        monkeypatch.setattr(AvitoInternalValidator, '_compiled', {})
+        monkeypatch.setattr(AvitoInternalValidator, 'load_brp_models', lambda self: pytest.fail("sources parsed"))
+
+        validator = AvitoInternalValidator(cache_dir=str(tmp_path / "cache"))
+
+        assert validator.brp_models == tuple(MODELS)
+        assert validator.validate_model("Ski-Doo MXZ").suggested_fix == "Did you mean: Ski-Doo MXZ X 600R E-TEC?"
+
+    def test_rebuilt_when_source_changes(self, sources, tmp_path):
+        """Test a new source modification time recompiles the artefact"""
+        models_file, _ = sources
+        cache_dir = str(tmp_path / "cache")
+        AvitoInternalValidator(cache_dir=cache_dir)
+
+        models_file.write_text(json.dumps({'brp_models': ["Lynx Xtrim 600"]}), encoding='utf-8')
+        stat = models_file.stat()
+        os.utime(models_file, ns=(stat.st_atime_ns, stat.st_mtime_ns + 1_000_000_000))
+        validator = AvitoInternalValidator(cache_dir=cache_dir)
+
+        assert validator.brp_models == ("Lynx Xtrim 600",)
+        artefact = json.loads(validator.artefact_path.read_text(encoding='utf-8'))
+        assert artefact['source_state'] == validator.source_state()
+        assert artefact['brp_models'] == ["Lynx Xtrim 600"]
+
+    @pytest.mark.parametrize("content", [
+        "{not json",
+        "[]",
+        json.dumps({'source_state': 'stale', 'brp_models': ["Old"], 'field_constraints': {}, 'model_trigrams': {}}),
+    ])
+    def test_corrupt_or_stale_artefact_ignored(self, sources, tmp_path, content):
+        """Test unreadable or outdated artefacts are replaced by a fresh compile"""
+        cache_dir = tmp_path / "cache"
+        cache_dir.mkdir()
+        (cache_dir / "constraints.json").write_text(content, encoding='utf-8')
+
+        validator = AvitoInternalValidator(cache_dir=str(cache_dir))
+
+        assert validator.brp_models == tuple(MODELS)
+        assert json.loads(validator.artefact_path.read_text(encoding='utf-8'))['source_state'] == validator.source_state()
+
+    def test_nothing_cached_without_sources(self, sources, tmp_path):
+        """Test missing source files give empty rules and no artefact"""
+        for path in sources:
+            path.unlink()
+
+        validator = AvitoInternalValidator(cache_dir=str(tmp_path / "cache"))
+
+        assert validator.brp_models == ()
+        assert not validator.artefact_path.exists()
+
+    def test_shared_artefact_is_read_only(self, sources):
+        """Test validators cannot change the models and constraints they share"""
+        first, second = AvitoInternalValidator(), AvitoInternalValidator()
+
+        assert first.brp_models is second.brp_models
+        with pytest.raises(TypeError):
+            first.field_constraints['Price'] = {}
+        with pytest.raises(TypeError):
+            first.field_constraints['Price']['required'] = False
+        assert isinstance(first.field_constraints['Price']['validation_hints'], tuple)
+
+
+class TestFeedValidation:
+    """Test validate_feed() against per-ad validate_xml_data()"""
+
+    @pytest.fixture
+    def items(self):
+        base = {
+            'Id': 'MXZ-X-600R-2025', 'Title': 'Снегоход Ski-Doo MXZ X 600R E-TEC 2025',
+            'Model': 'Ski-Doo MXZ X 600R E-TEC', 'Price': '2500000', 'Year': '2025',
+            'Category': 'Мотоциклы и мототехника', 'VehicleType': 'Снегоходы',
+            'Address': 'Санкт-Петербург', 'Color': 'Белый'
+        }
+        variants = [
+            {}, {'Price': '2,500,000'}, {'Model': 'Ski-Doo MXZ'}, {'Title': 'Новая модель техники 2025'},
+            {'Year': '1990', 'Id': 'x'}, {'Dealer': 'Moto'}, {'Price': '50'},
+        ]
+        return [{**base, 'Id': f"AD-{position}", **variant} for position, variant in enumerate(variants * 3)]
+
+    def test_counts_match_per_item_validation(self, sources, items, capsys):
+        """Test feed counters equal the sum of validate_xml_data over the items"""
+        validator = AvitoInternalValidator()
+        expected = [validator.validate_xml_data(item) for item in items]
+        skipped = [line.split()[1].rstrip(':') for line in capsys.readouterr().out.splitlines()
+                   if line.startswith("SKIP")]
+
+        feed = validator.validate_feed(items)
+
+        assert feed.total_items == len(items)
+        assert list(feed.item_errors) == [len(result.errors) for result in expected]
+        assert list(feed.item_warnings) == [len(result.warnings) for result in expected]
+        assert feed.invalid_items == [position for position, result in enumerate(expected) if not result.is_valid]
+        assert feed.passed_checks == sum(result.passed_checks for result in expected)
+        assert feed.total_checks == sum(result.total_checks for result in expected)
+        assert feed.error_histogram() == dict(
+            Counter(error.field_name for result in expected for error in result.errors).most_common())
+        assert feed.warning_histogram() == dict(
+            Counter(warning.field_name for result in expected for warning in result.warnings).most_common())
+        assert feed.skipped_fields == Counter(skipped)
+        assert not feed.is_valid
+
+    def test_repeated_values_validated_once(self, sources, items):
+        """Test low-cardinality fields run once per distinct value and free-text fields per item"""
+        validator = AvitoInternalValidator()
+        validate_model = Mock(wraps=validator.validate_model)
+        validate_price = Mock(wraps=validator.validate_price)
+        validator.validation_rules.update(Model=validate_model, Price=validate_price)
+
+        feed = validator.validate_feed(items)
+
+        assert validate_model.call_count == len({item['Model'] for item in items})
+        assert validate_price.call_count == len(items)
+        assert feed.field_errors['Price']["Price seems too low for a snowmobile (minimum 100,000 rubles)"] == 3
+
+    def test_generator_feed_keeps_no_item_values(self, sources, items, monkeypatch):
+        """Test a long generator feed holds no more field values than the bounded memo"""
+        monkeypatch.setattr(AvitoInternalValidator, 'FEED_MEMO_SIZE', 8)
+        alive = Counter()
+        
+        class Value(str):
+            def __new__(cls, value):
+                alive['values'] += 1
+                return super().__new__(cls, value)
+            
+            def __del__(self):
+                alive['values'] -= 1
+        
+        peak = []
+        
+        def feed():
+            for position in range(2000):
+                peak.append(alive['values'])
+                item = items[position % len(items)]
+                yield {name: Value(f"{value} {position}") for name, value in item.items()}
+        
+        feed_result = AvitoInternalValidator().validate_feed(feed())
+        
+        assert feed_result.total_items == 2000
+        # One item's values plus at most FEED_MEMO_SIZE cached values per memoised field
+        assert max(peak) <= 10 + 8 * len(AvitoInternalValidator.FEED_MEMO_FIELDS)
+    
+    def test_logging_instead_of_stdout(self, sources, items, capsys, caplog):
+        """Test nothing is printed and failed checks are logged only at an enabled level"""
+        validator = AvitoInternalValidator()
+
+        with caplog.at_level(logging.INFO, logger='avito_internal_validator'):
+            feed = validator.validate_feed(items)
+            quiet = list(caplog.records)
+            caplog.clear()
+            validator.validate_feed(items, error_log_level=logging.WARNING)
+            loud = list(caplog.records)
+
+        assert capsys.readouterr().out == ""
+        assert [record.levelno for record in quiet] == [logging.INFO]
+        assert quiet[0].getMessage() == feed.summary
+        assert sum(record.levelno == logging.WARNING for record in loud) == sum(feed.item_errors)